@@ -1,495 +1,72 @@
-import re
+import cProfile
+import functools
+import gzip
+import hashlib
+import hmac
+import io
+import json
+import os
+import pstats
+import random
+import sys
+import threading
 import time
-from typing import Dict, List, Tuple, Optional, Any
-from flask import Flask, request, jsonify, render_template_string
+import tracemalloc
+from datetime import datetime, timezone
+from itertools import combinations, islice
+from typing import Dict, Iterable, List, Tuple, Any
+from flask import Flask, Response, request, jsonify, render_template_string
+
+from string_matching import (
+    MAX_TRACE_STEPS, OVERLAP_THRESHOLD, OVERLAP_TOP_K, MAX_OVERLAP_TOP_K,
+    ENGINES, engine_names, normalize, encode_words, method_label, run_one_pair, compare_sets,
+    new_op_summary, add_op_stats, op_summary_json, PATTERN_CACHE, PREFILTERS, PairPrefilter, escape_html,
+)
+from corpus_store import open_corpus
+from history_store import open_history, sentence_hash, sentences_digest
+from report_export import EXPORT_FORMATS, export_columns, iter_csv, iter_pair_rows, iter_parquet, parquet_available
+from winnowing import MAX_POSTINGS, WINNOW_K, WINNOW_W, FingerprintIndex
+from complexity import (
+    SCALING_METHODS, SCALING_KINDS, DEFAULT_SIZES_N, DEFAULT_SIZES_M, MAX_SCALING_N, MAX_SCALING_POINTS,
+    estimate_scaling_work, run_scaling,
+)
+
+try:
+    import brotli  # opsional: tanpa paket ini UI hanya dikirim gzip / identity
+except ImportError:
+    brotli = None
 
 
-MAX_TRACE_STEPS = 350
 MAX_INPUT_CHARS_PER_SENTENCE = 5000
 MAX_SENTENCES = 30
+MAX_EXPORT_SENTENCES = 1000   # /api/check/export: streaming, memori O(n); beban tetap dibatasi budget kerja
+MAX_COMPARE_SENTENCES = 500   # per sisi di /api/compare dan /api/corpus/check; beban tetap dibatasi budget kerja
+MAX_DOCUMENTS = 200           # /api/documents (winnowing, hampir linear terhadap total teks)
+MAX_DOCUMENT_CHARS = 200_000
+MAX_POSTINGS_LIMIT = 1000     # batas atas max_postings /api/documents (seed per fingerprint kuadratik)
 
 app = Flask(__name__)
 
-def normalize(text: str) -> str:
-    text = text.lower().strip()
-    text = text.replace("–", " ").replace("—", " ").replace("-", " ")
-    text = re.sub(r"[^a-z0-9\s]", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
-
-def normalize_with_map(original: str) -> Tuple[str, List[int]]:
-    """
-    Normalisasi mirip normalize(), tapi juga mengembalikan mapping:
-    map_norm[i] = indeks karakter di original yang menghasilkan norm[i]
-    """
-    s = original.strip()
-    out_chars: List[str] = []
-    out_map: List[int] = []
-
-    prev_space = False
-    for i, ch in enumerate(s):
-        c = ch.lower()
-        if c in ["–", "—", "-"]:
-            c = " "
-
-        if c.isalnum():
-            out_chars.append(c)
-            out_map.append(i)
-            prev_space = False
-        else:
-            if not prev_space and len(out_chars) > 0:
-                out_chars.append(" ")
-                out_map.append(i)
-                prev_space = True
-
-    while out_chars and out_chars[0] == " ":
-        out_chars.pop(0); out_map.pop(0)
-    while out_chars and out_chars[-1] == " ":
-        out_chars.pop(); out_map.pop()
-
-    return "".join(out_chars), out_map
-
-def escape_html(s: str) -> str:
-    return (s.replace("&", "&amp;")
-             .replace("<", "&lt;")
-             .replace(">", "&gt;")
-             .replace('"', "&quot;")
-             .replace("'", "&#39;"))
-
-def highlight_span(original: str, start: int, end: int) -> str:
-    """
-    Return HTML aman: original di-escape, bagian [start:end] diberi <mark class='hl'>.
-    """
-    start = max(0, min(start, len(original)))
-    end = max(0, min(end, len(original)))
-    if end <= start:
-        return escape_html(original)
-
-    left = escape_html(original[:start])
-    mid = escape_html(original[start:end])
-    right = escape_html(original[end:])
-    return f"{left}<mark class='hl'>{mid}</mark>{right}"
-
-def naive_search(text: str, pattern: str) -> int:
-    n, m = len(text), len(pattern)
-    if m == 0:
-        return 0
-    if m > n:
-        return -1
-    for i in range(n - m + 1):
-        if text[i:i+m] == pattern:
-            return i
-    return -1
-
-def naive_search_count(text: str, pattern: str) -> Tuple[int, int]:
-    n, m = len(text), len(pattern)
-    if m == 0:
-        return 0, 0
-    if m > n:
-        return -1, 0
-    comps = 0
-    for i in range(n - m + 1):
-        match = True
-        for j in range(m):
-            comps += 1
-            if text[i+j] != pattern[j]:
-                match = False
-                break
-        if match:
-            return i, comps
-    return -1, comps
-
-def naive_search_trace(text: str, pattern: str) -> Tuple[int, List[str], int]:
-    trace: List[str] = []
-    n, m = len(text), len(pattern)
-    if m == 0:
-        trace.append("[Naive] Pattern kosong → ditemukan di indeks 0")
-        return 0, trace, 0
-    if m > n:
-        trace.append("[Naive] Pattern lebih panjang dari text → tidak mungkin ketemu")
-        return -1, trace, 0
-
-    steps = 0
-    comps = 0
-    trace.append("[NAIVE TRACE] Pergeseran satu-per-satu")
-    for i in range(n - m + 1):
-        trace.append(f"Shift i={i} | bandingkan text[{i}:{i+m}] dengan pattern")
-        match = True
-        for j in range(m):
-            steps += 1
-            comps += 1
-            trace.append(f"  Compare j={j}: T[{i+j}]='{text[i+j]}' vs P[{j}]='{pattern[j]}'")
-            if steps >= MAX_TRACE_STEPS:
-                trace.append("...trace dihentikan (batas langkah)")
-                return -2, trace, comps
-            if text[i+j] != pattern[j]:
-                trace.append("  ✗ mismatch → geser 1")
-                match = False
-                break
-        if match:
-            trace.append("  ✓ semua karakter cocok → FOUND")
-            return i, trace, comps
-    trace.append("→ pattern tidak ditemukan")
-    return -1, trace, comps
-
-def kmp_build_lps(pattern: str) -> List[int]:
-    m = len(pattern)
-    lps = [0] * m
-    length = 0
-    i = 1
-    while i < m:
-        if pattern[i] == pattern[length]:
-            length += 1
-            lps[i] = length
-            i += 1
-        else:
-            if length != 0:
-                length = lps[length - 1]
-            else:
-                lps[i] = 0
-                i += 1
-    return lps
-
-def kmp_search(text: str, pattern: str) -> int:
-    n, m = len(text), len(pattern)
-    if m == 0:
-        return 0
-    if m > n:
-        return -1
-
-    lps = kmp_build_lps(pattern)
-    i = j = 0
-    while i < n:
-        if text[i] == pattern[j]:
-            i += 1
-            j += 1
-            if j == m:
-                return i - j
-        else:
-            if j != 0:
-                j = lps[j - 1]  # wajib LPS[j-1]
-            else:
-                i += 1
-    return -1
-
-def kmp_search_count(text: str, pattern: str) -> Tuple[int, int, List[int]]:
-    n, m = len(text), len(pattern)
-    if m == 0:
-        return 0, 0, []
-    if m > n:
-        return -1, 0, kmp_build_lps(pattern)
-
-    lps = kmp_build_lps(pattern)
-    i = j = 0
-    comps = 0
-    while i < n:
-        comps += 1
-        if text[i] == pattern[j]:
-            i += 1
-            j += 1
-            if j == m:
-                return i - j, comps, lps
-        else:
-            if j != 0:
-                j = lps[j - 1]
-            else:
-                i += 1
-    return -1, comps, lps
-
-def kmp_search_trace(text: str, pattern: str) -> Tuple[int, List[str], int, List[int]]:
-    trace: List[str] = []
-    n, m = len(text), len(pattern)
-    if m == 0:
-        trace.append("[KMP] Pattern kosong → ditemukan di indeks 0")
-        return 0, trace, 0, []
-    if m > n:
-        trace.append("[KMP] Pattern lebih panjang dari text → tidak mungkin ketemu")
-        return -1, trace, 0, kmp_build_lps(pattern)
-
-    # Build LPS with trace
-    lps = [0] * m
-    length = 0
-    i = 1
-    trace.append("[KMP] Tahap 1: Bangun Tabel LPS")
-    trace.append(f"Pattern: '{pattern}'")
-    steps = 0
-    while i < m:
-        trace.append(f" i={i}, length={length} | P[i]='{pattern[i]}' vs P[length]='{pattern[length]}'")
-        if pattern[i] == pattern[length]:
-            length += 1
-            lps[i] = length
-            trace.append(f"  ✓ match → LPS[{i}]={length}, i++")
-            i += 1
-        else:
-            if length != 0:
-                trace.append(f"  ✗ mismatch → length = LPS[{length-1}] = {lps[length-1]}")
-                length = lps[length - 1]
-            else:
-                lps[i] = 0
-                trace.append(f"  ✗ mismatch & length==0 → LPS[{i}]=0, i++")
-                i += 1
-        steps += 1
-        if steps >= MAX_TRACE_STEPS:
-            trace.append("...trace dihentikan (batas langkah)")
-            return -2, trace, 0, lps
-
-    trace.append(f"LPS Table: {lps}")
-
-    trace.append("[KMP] Tahap 2: Proses Pencarian (i tidak pernah mundur)")
-    i = j = 0
-    comps = 0
-    step2 = 0
-    while i < n:
-        step2 += 1
-        if step2 >= MAX_TRACE_STEPS:
-            trace.append("...trace dihentikan (batas langkah)")
-            return -2, trace, comps, lps
-
-        comps += 1
-        trace.append(f" Step {step2}: i={i}, j={j} | T[i]='{text[i]}' vs P[j]='{pattern[j]}'")
-        if text[i] == pattern[j]:
-            i += 1
-            j += 1
-            trace.append(f"  ✓ match → i={i}, j={j}")
-            if j == m:
-                pos = i - j
-                trace.append(f"  ✓ FOUND pada posisi {pos}")
-                trace.append(f"  → set j = LPS[{j-1}] = {lps[j-1]}")
-                return pos, trace, comps, lps
-        else:
-            trace.append("  ✗ mismatch")
-            if j != 0:
-                old_j = j
-                j = lps[j - 1]
-                trace.append(f"  → geser j: {old_j} → {j} (pakai LPS[{old_j-1}])")
-            else:
-                i += 1
-                trace.append(f"  → j==0, geser i: i → {i}")
-
-    trace.append("→ pattern tidak ditemukan")
-    return -1, trace, comps, lps
-
-# ============================================================
-# 3) BOYER–MOORE (BAD CHARACTER) (FAST + TRACE + COUNT + LAST)
-# ============================================================
-def bm_build_last(pattern: str) -> Dict[str, int]:
-    last = {}
-    for idx, ch in enumerate(pattern):
-        last[ch] = idx
-    return last
-
-def bm_search(text: str, pattern: str) -> int:
-    n, m = len(text), len(pattern)
-    if m == 0:
-        return 0
-    if m > n:
-        return -1
-
-    last = bm_build_last(pattern)
-    s = 0
-    while s <= n - m:
-        j = m - 1
-        while j >= 0 and pattern[j] == text[s + j]:
-            j -= 1
-        if j < 0:
-            return s
-        bad_char = text[s + j]
-        lo = last.get(bad_char, -1)
-        shift = max(1, j - lo)
-        s += shift
-    return -1
-
-def bm_search_count(text: str, pattern: str) -> Tuple[int, int, Dict[str, int]]:
-    n, m = len(text), len(pattern)
-    if m == 0:
-        return 0, 0, {}
-    if m > n:
-        return -1, 0, bm_build_last(pattern)
-
-    last = bm_build_last(pattern)
-    s = 0
-    comps = 0
-    while s <= n - m:
-        j = m - 1
-        while j >= 0:
-            comps += 1
-            if pattern[j] == text[s + j]:
-                j -= 1
-            else:
-                break
-        if j < 0:
-            return s, comps, last
-        bad_char = text[s + j]
-        lo = last.get(bad_char, -1)
-        shift = max(1, j - lo)
-        s += shift
-    return -1, comps, last
-
-def bm_search_trace(text: str, pattern: str) -> Tuple[int, List[str], int, Dict[str, int]]:
-    trace: List[str] = []
-    n, m = len(text), len(pattern)
-    if m == 0:
-        trace.append("[BM] Pattern kosong → ditemukan di indeks 0")
-        return 0, trace, 0, {}
-    if m > n:
-        trace.append("[BM] Pattern lebih panjang dari text → tidak mungkin ketemu")
-        return -1, trace, 0, bm_build_last(pattern)
-
-    last = bm_build_last(pattern)
-    trace.append("[BOYER–MOORE TRACE] Bad Character Rule (bandingkan dari kanan)")
-    trace.append(f"Last Table: {last}")
-
-    s = 0
-    steps = 0
-    comps = 0
-    while s <= n - m:
-        j = m - 1
-        trace.append(f"Alignment shift s={s} | mulai dari kanan (j={j})")
-
-        while j >= 0 and pattern[j] == text[s + j]:
-            comps += 1
-            trace.append(f"  ✓ match j={j}: P='{pattern[j]}' == T='{text[s+j]}'")
-            j -= 1
-            steps += 1
-            if steps >= MAX_TRACE_STEPS:
-                trace.append("...trace dihentikan (batas langkah)")
-                return -2, trace, comps, last
-
-        if j < 0:
-            trace.append("  ✓ semua cocok → FOUND")
-            return s, trace, comps, last
-
-        comps += 1
-        bad_char = text[s + j]
-        lo = last.get(bad_char, -1)
-        shift = max(1, j - lo)
-        trace.append(f"  ✗ mismatch j={j}: P='{pattern[j]}' != T='{bad_char}'")
-        trace.append(f"  bad_char='{bad_char}', last_occurrence={lo} → shift={shift}")
-        s += shift
-
-        steps += 1
-        if steps >= MAX_TRACE_STEPS:
-            trace.append("...trace dihentikan (batas langkah)")
-            return -2, trace, comps, last
-
-    trace.append("→ pattern tidak ditemukan")
-    return -1, trace, comps, last
-
-# ============================================================
-# RUNNER + HIGHLIGHT + EXPLAIN (UNTUK MENU PROSES)
-# ============================================================
-def method_label(method: str) -> str:
-    return {"naive": "Naive String Matching", "kmp": "Knuth–Morris–Pratt (KMP)", "bm": "Boyer–Moore (Bad Character)"}\
-        .get(method, "Unknown")
-
-def method_explain(method: str) -> str:
-    if method == "naive":
-        return "Naive menggeser pattern satu-per-satu dan membandingkan karakter dari kiri. Sederhana tetapi bisa lebih lambat pada teks panjang."
-    if method == "kmp":
-        return "KMP membangun tabel LPS untuk menghindari perbandingan ulang saat mismatch. i tidak mundur; pencarian lebih efisien."
-    if method == "bm":
-        return "Boyer–Moore membandingkan dari kanan ke kiri dan dapat melompat jauh dengan aturan bad character. Umumnya cepat pada teks natural."
-    return "Metode tidak dikenal."
-
-def run_one_pair(method: str, sA: str, sB: str, analysis_mode: bool) -> Dict[str, Any]:
-    origA, origB = sA, sB
-
-    normA, mapA = normalize_with_map(origA)
-    normB, mapB = normalize_with_map(origB)
-
-    # Tentukan TEXT (lebih panjang) dan PATTERN (lebih pendek)
-    if len(normA) >= len(normB):
-        text_norm, pattern_norm = normA, normB
-        text_orig, pattern_orig = origA, origB
-        text_map = mapA
-        text_source = "A"
-        pattern_source = "B"
-    else:
-        text_norm, pattern_norm = normB, normA
-        text_orig, pattern_orig = origB, origA
-        text_map = mapB
-        text_source = "B"
-        pattern_source = "A"
-
-    t0 = time.perf_counter()
-    trace: Optional[List[str]] = None
-    comps = 0
-    lps: Optional[List[int]] = None
-    last_table: Optional[Dict[str, int]] = None
-
-    if analysis_mode:
-        if method == "naive":
-            idx, trace, comps = naive_search_trace(text_norm, pattern_norm)
-        elif method == "kmp":
-            idx, trace, comps, lps = kmp_search_trace(text_norm, pattern_norm)
-        elif method == "bm":
-            idx, trace, comps, last_table = bm_search_trace(text_norm, pattern_norm)
-        else:
-            idx, trace = -1, ["Metode tidak dikenal"]
-    else:
-        if method == "naive":
-            idx, comps = naive_search_count(text_norm, pattern_norm)
-        elif method == "kmp":
-            idx, comps, lps = kmp_search_count(text_norm, pattern_norm)
-        elif method == "bm":
-            idx, comps, last_table = bm_search_count(text_norm, pattern_norm)
-        else:
-            idx = -1
-
-    t_ms = (time.perf_counter() - t0) * 1000
-    status = "DUPLIKAT" if idx >= 0 else "TIDAK DUPLIKAT"
-
-    # Highlight HTML
-    a_hl = escape_html(origA)
-    b_hl = escape_html(origB)
-    match_info = None
-    match_snippet_norm = ""
-
-    if idx >= 0 and len(pattern_norm) > 0:
-        m = len(pattern_norm)
-        start_orig = text_map[idx]
-        end_orig = text_map[idx + m - 1] + 1
-        match_snippet_norm = text_norm[idx:idx+m]
-
-        text_hl = highlight_span(text_orig, start_orig, end_orig)
-        pattern_hl = f"<mark class='hl'>{escape_html(pattern_orig)}</mark>"
-
-        if text_source == "A":
-            a_hl = text_hl
-            b_hl = pattern_hl
-            match_info = {"container": "A", "start": start_orig, "end": end_orig}
-        else:
-            b_hl = text_hl
-            a_hl = pattern_hl
-            match_info = {"container": "B", "start": start_orig, "end": end_orig}
-
-    explain = {
-        "metode": method_label(method),
-        "metode_ringkas": method_explain(method),
-        "aturan_duplikasi": "Duplikat jika PATTERN ditemukan sebagai substring di dalam TEXT setelah normalisasi.",
-        "normA": normA,
-        "normB": normB,
-        "text_source": text_source,
-        "pattern_source": pattern_source,
-        "text_norm": text_norm,
-        "pattern_norm": pattern_norm,
-        "found_idx": idx,
-        "match_norm": match_snippet_norm,
-        "comparisons": comps,
-        "lps": lps,
-        "last_table": last_table
-    }
-
-    return {
-        "idx": idx,
-        "time_ms": round(t_ms, 3),
-        "status": status,
-        "trace": trace,
-        "a_hl": a_hl,
-        "b_hl": b_hl,
-        "match_info": match_info,
-        "explain": explain
-    }
+# Corpus referensi opsional (lihat corpus_store.py): dibuka sekali via mmap,
+# worker hasil fork berbagi page yang sama.
+CORPUS = open_corpus(os.environ.get("CORPUS_PATH"))
+
+# Riwayat + store hasil pasangan opsional (lihat history_store.py): pasangan yang
+# pernah dihitung dengan parameter sama diambil dari SQLite, bukan dihitung ulang.
+HISTORY = open_history(os.environ.get("HISTORY_DB"))
+MAX_HISTORY_LIMIT = 200
+
+# Cache tabel LPS/last lintas request (lihat PatternCache): kapasitas LRU dan
+# warm-up dari file kalimat baku yang sering muncul (satu kalimat per baris).
+if os.environ.get("PATTERN_CACHE_SIZE"):
+    try:
+        PATTERN_CACHE.resize(int(os.environ["PATTERN_CACHE_SIZE"]))
+    except ValueError:
+        print(f"PATTERN_CACHE_SIZE={os.environ['PATTERN_CACHE_SIZE']!r} tidak valid (harus bilangan bulat ≥ 1); "
+              f"memakai default {PATTERN_CACHE.capacity}.", file=sys.stderr)
+if os.environ.get("PATTERN_CACHE_WARM"):
+    with open(os.environ["PATTERN_CACHE_WARM"], encoding="utf-8") as _fh:
+        PATTERN_CACHE.warm([line.strip() for line in _fh if line.strip()])
 
 # ============================================================
 # WEB UI (SIDEBAR AKTIF + MENU PROSES DETAIL)
@@ -770,6 +347,15 @@ HTML = r"""
     }
     tr:last-child td{border-bottom:none}
 
+    /* Tabel virtualized: tinggi baris tetap, isi kalimat dipotong 3 baris */
+    .vwrap{max-height:70vh;overflow:auto;border-radius:18px}
+    .vwrap thead th{position:sticky;top:0;z-index:1;background:#f3f2fd}
+    tr.vrow td{height:84px;padding:8px 10px;overflow:hidden}
+    .clamp{
+      display:-webkit-box;-webkit-line-clamp:3;-webkit-box-orient:vertical;
+      overflow:hidden;line-height:1.45;
+    }
+
     .tag{
       display:inline-flex;align-items:center;gap:8px;
       padding:7px 10px;border-radius:999px;
@@ -895,6 +481,9 @@ HTML = r"""
         <div class="navBtn" id="nav_process" onclick="goTo('process','nav_process')">
           <div class="ico">🧠</div> Proses (Detail)
         </div>
+        <div class="navBtn" id="nav_scaling" onclick="goTo('scaling','nav_scaling')">
+          <div class="ico">📈</div> Skala Empiris
+        </div>
       </div>
 
       <div class="note">
@@ -920,9 +509,8 @@ HTML = r"""
         <div class="chips">
           <div class="chip">Metode:
             <select id="method">
-              <option value="naive">Naive</option>
-              <option value="kmp">KMP</option>
-              <option value="bm">Boyer–Moore</option>
+              {% for e in engines %}<option value="{{ e.name }}">{{ e.label }}</option>
+              {% endfor %}<option value="all">Bandingkan Semua ({{ compare_names }})</option>
             </select>
           </div>
           <div class="chip">Mode:
@@ -931,6 +519,19 @@ HTML = r"""
               <option value="trace">Analisis (Trace)</option>
             </select>
           </div>
+          <div class="chip">Unit:
+            <select id="unit">
+              <option value="char">Karakter</option>
+              <option value="word">Kata</option>
+            </select>
+          </div>
+          <div class="chip">Aturan:
+            <select id="rule">
+              <option value="substring">Substring penuh</option>
+              <option value="overlap">Overlap (LCS)</option>
+            </select>
+            <input id="threshold" type="number" min="0.05" max="1" step="0.05" value="0.8" title="Threshold overlap (0–1)" style="width:64px" />
+          </div>
         </div>
       </div>
 
@@ -994,6 +595,8 @@ Hasil menunjukkan peningkatan akurasi secara signifikan."></textarea>
       <!-- Results -->
       <section class="card" id="results">
         <h2>Hasil Pairwise + Highlight</h2>
+        <button class="btn2" onclick="exportResults('csv')">⬇ Export CSV</button>
+        <div style="height:10px"></div>
         <div id="resultArea" class="hint">Belum ada hasil.</div>
       </section>
 
@@ -1005,12 +608,41 @@ Hasil menunjukkan peningkatan akurasi secara signifikan."></textarea>
         </div>
       </section>
 
+      <!-- SKALA EMPIRIS -->
+      <section class="card" id="scaling">
+        <h2>Analisis Skala Empiris</h2>
+        <div class="actions">
+          <div class="chip">Metode:
+            <select id="scaleMethod">
+              {% for e in scaling_engines %}<option value="{{ e.name }}">{{ e.label }}</option>
+              {% endfor %}
+            </select>
+          </div>
+          <div class="chip">Input:
+            <select id="scaleKind">
+              <option value="natural">Natural</option>
+              <option value="adversarial">Adversarial (kasus terburuk)</option>
+            </select>
+          </div>
+          <div class="chip">Sumbu Y:
+            <select id="scaleKey" onchange="drawScaling()">
+              <option value="comparisons">Comparisons</option>
+              <option value="time_ms">Waktu (ms)</option>
+            </select>
+          </div>
+          <button class="btn" id="scaleBtn" onclick="runScaling()">▶ Ukur Metode Terpilih</button>
+        </div>
+        <div id="scalingArea" class="hint">
+          Metode terpilih dijalankan pada TEXT n = 500…8000 dan PATTERN m = 4, 16, 64; hasil di-fit ke model n, n·m, dan n/m.
+        </div>
+      </section>
+
     </main>
   </div>
 
 <script>
 function setActiveNav(navId){
-  ["nav_dashboard","nav_check","nav_results","nav_process"].forEach(id=>{
+  ["nav_dashboard","nav_check","nav_results","nav_process","nav_scaling"].forEach(id=>{
     const el = document.getElementById(id);
     if(el) el.classList.remove("active");
   });
@@ -1043,6 +675,7 @@ function clearAll(){
   document.getElementById("k_pairs").textContent = 0;
   document.getElementById("k_dup").textContent = 0;
   document.getElementById("k_time").textContent = "0.000";
+  STATE = {req: null, summary: null, rows: [], accLimit: ACC_CHUNK, accShown: 0};
   showProcess(false);
   for(let i=1;i<=5;i++) setStep(i,"");
   goTo("dashboard","nav_dashboard");
@@ -1066,12 +699,6 @@ function showProcess(show=true){
   if(box) box.style.display = show ? "block" : "none";
 }
 
-function toggleAcc(id){
-  const body = document.getElementById(id);
-  if(!body) return;
-  body.style.display = (body.style.display === "none" || body.style.display === "") ? "block" : "none";
-}
-
 function formatJSON(obj){
   try{
     return JSON.stringify(obj, null, 2);
@@ -1080,160 +707,474 @@ function formatJSON(obj){
   }
 }
 
-function buildProcessDetail(data){
-  const area = document.getElementById("processArea");
-  if(!data || !data.ok){
-    area.innerHTML = "Tidak ada data proses.";
-    return;
+// ============================================================
+// STATE + PAGING: hasil diambil per halaman (tanpa explain/trace),
+// detail per pasangan diambil saat accordion dibuka.
+// ============================================================
+const PAGE_SIZE = 200;   // pasangan per request halaman
+const ROW_H = 84;        // tinggi tetap baris tabel (px) → posisi baris bisa dihitung
+const OVERSCAN = 8;      // baris ekstra di atas/bawah area terlihat
+const ACC_CHUNK = 100;   // jumlah accordion yang ditambahkan per "Tampilkan lebih banyak"
+
+let STATE = {req: null, summary: null, rows: [], accLimit: ACC_CHUNK, accShown: 0};
+let rowsFrame = 0;
+
+async function postCheck(body, url="/api/check"){
+  // Backpressure: 429 → tunggu Retry-After lalu ulangi
+  for(;;){
+    const resp = await fetch(url, {
+      method: "POST",
+      headers: {"Content-Type":"application/json"},
+      body: JSON.stringify(body)
+    });
+    if(resp.status === 429){
+      const wait = parseFloat(resp.headers.get("Retry-After") || "1");
+      await new Promise(ok => setTimeout(ok, wait * 1000));
+      continue;
+    }
+    return await resp.json();
+  }
+}
+
+function statusTag(r, long=false){
+  return r.status === "DUPLIKAT"
+    ? `<span class="tag tagDup">✓ DUPLIKAT</span>`
+    : `<span class="tag tagNo">✗ ${long ? "TIDAK DUPLIKAT" : "TIDAK"}</span>`;
+}
+
+// ---------- Tabel hasil (virtualized) ----------
+function initResultTable(){
+  document.getElementById("resultArea").innerHTML = `
+    <div class="vwrap" id="vwrap" onscroll="scheduleRows()">
+      <table>
+        <thead>
+          <tr>
+            <th>Pasangan</th>
+            <th>Kalimat A (highlight)</th>
+            <th>Kalimat B (highlight)</th>
+            <th>Status</th>
+            <th>Idx</th>
+            <th>Waktu (ms)</th>
+            <th>Comparisons</th>
+          </tr>
+        </thead>
+        <tbody id="vbody"></tbody>
+      </table>
+    </div>
+  `;
+}
+
+function rowHTML(r){
+  return `
+    <tr class="vrow">
+      <td><b>(${r.i1}, ${r.i2})</b></td>
+      <td><div class="clamp">${r.a_hl}</div></td>
+      <td><div class="clamp">${r.b_hl}</div></td>
+      <td>${statusTag(r)}${r.overlap_ratio != null ? `<div class="pill">overlap ${esc((r.overlap_ratio*100).toFixed(1))}%</div>` : ``}</td>
+      <td>${esc(String(r.idx))}</td>
+      <td>${esc(String(r.time_ms))}</td>
+      <td>${r.methods ? methodCompsHTML(r.methods) : esc(String(r.comparisons ?? 0))}</td>
+    </tr>
+  `;
+}
+
+// method="all": comparisons per metode, nilai terkecil ditebalkan
+const ENGINES = {{ engines_json | safe }};
+const METHOD_SHORT = Object.fromEntries(ENGINES.map(e => [e.name, e.short]));
+function methodCompsHTML(methods){
+  const best = Math.min(...Object.values(methods).map(m => m.comparisons));
+  return Object.entries(methods).map(([k, m]) =>
+    `<div${m.comparisons === best ? ' style="font-weight:950"' : ""}>${esc(METHOD_SHORT[k] || k)}: ${esc(m.comparisons)}</div>`
+  ).join("");
+}
+
+function addMethodTotals(methods){
+  if(!methods) return;
+  STATE.methodTotals = STATE.methodTotals || {};
+  for(const [k, t] of Object.entries(methods.per_method)){
+    const acc = STATE.methodTotals[k] || (STATE.methodTotals[k] = {comparisons: 0, time_ms: 0, wins_comparisons: 0, wins_time: 0});
+    for(const f of Object.keys(acc)) acc[f] += t[f];
   }
+  const totals = STATE.methodTotals;
+  const winC = Object.keys(totals).reduce((a, b) => totals[b].comparisons < totals[a].comparisons ? b : a);
+  const winT = Object.keys(totals).reduce((a, b) => totals[b].time_ms < totals[a].time_ms ? b : a);
+  const el = document.getElementById("methodSummary");
+  if(!el) return;
+  el.innerHTML = `
+    <div class="mini">
+      <div class="t">Perbandingan Metode</div>
+      <div class="p">Pemenang total comparisons: <b>${esc(METHOD_SHORT[winC])}</b> • waktu: <b>${esc(METHOD_SHORT[winT])}</b></div>
+    </div>
+    <div style="height:10px"></div>
+    <table><thead><tr><th>Metode</th><th>Total Comparisons</th><th>Total Waktu (ms)</th><th>Menang (comps)</th><th>Menang (waktu)</th></tr></thead>
+    <tbody>${Object.entries(totals).map(([k, t]) => `
+      <tr><td>${esc(METHOD_SHORT[k] || k)}</td><td>${esc(t.comparisons)}</td><td>${esc(t.time_ms.toFixed(3))}</td>
+          <td>${esc(t.wins_comparisons)}</td><td>${esc(t.wins_time)}</td></tr>`).join("")}</tbody></table>
+    <div style="height:10px"></div>
+  `;
+}
 
-  // Panel ringkas di atas
-  let header = `
+function spacerRow(h){
+  return h > 0 ? `<tr><td colspan="7" style="height:${h}px;padding:0;border:none"></td></tr>` : ``;
+}
+
+function renderRows(){
+  rowsFrame = 0;
+  const wrap = document.getElementById("vwrap");
+  const body = document.getElementById("vbody");
+  if(!wrap || !body) return;
+  const rows = STATE.rows;
+  const first = Math.max(0, Math.floor(wrap.scrollTop / ROW_H) - OVERSCAN);
+  const last = Math.min(rows.length, Math.ceil((wrap.scrollTop + wrap.clientHeight) / ROW_H) + OVERSCAN);
+  let html = spacerRow(first * ROW_H);
+  for(let k = first; k < last; k++) html += rowHTML(rows[k]);
+  html += spacerRow((rows.length - Math.max(last, first)) * ROW_H);
+  body.innerHTML = html;
+}
+
+function scheduleRows(){
+  if(!rowsFrame) rowsFrame = requestAnimationFrame(renderRows);
+}
+
+// ---------- Proses (Detail): header ringan, body dibangun saat dibuka ----------
+function initProcessDetail(summary){
+  const aturan = summary.rule === "overlap"
+    ? `Duplikat jika substring bersama terpanjang ≥ ${esc((summary.threshold*100).toFixed(0))}% panjang <b>PATTERN</b> setelah normalisasi.`
+    : `Duplikat jika <b>PATTERN</b> ditemukan sebagai substring dalam <b>TEXT</b> setelah normalisasi.`;
+  document.getElementById("processArea").innerHTML = `
     <div class="mini">
       <div class="t">Ringkasan Proses</div>
       <div class="p">
-        <b>Metode:</b> ${esc(data.summary.method_label)}<br/>
-        <b>Mode:</b> ${esc(data.summary.mode)}<br/>
-        <b>Aturan:</b> Duplikat jika <b>PATTERN</b> ditemukan sebagai substring dalam <b>TEXT</b> setelah normalisasi.
+        <b>Metode:</b> ${esc(summary.method_label)}<br/>
+        <b>Mode:</b> ${esc(summary.mode)}<br/>
+        <b>Unit:</b> ${summary.unit === "word" ? "Kata (id token, cocok hanya di batas kata)" : "Karakter"}<br/>
+        <b>Aturan:</b> ${aturan}<br/>
+        Klik pasangan untuk memuat detail proses.
       </div>
     </div>
     <div style="height:10px"></div>
+    <div id="methodSummary"></div>
+    <div class="acc" id="accList"></div>
+    <div id="accMore" style="margin-top:10px"></div>
   `;
+  STATE.accShown = 0;
+}
 
-  let acc = `<div class="acc">`;
-
-  data.results.forEach((r, idx) => {
-    const ex = r.explain || {};
-    const statusPill = (r.status === "DUPLIKAT")
-      ? `<span class="tag tagDup">✓ DUPLIKAT</span>`
-      : `<span class="tag tagNo">✗ TIDAK DUPLIKAT</span>`;
-
-    const title = `Pasangan (${r.i1}, ${r.i2})`;
-    const accBodyId = `accBody_${idx}`;
-
-    // Method-specific info
-    let extra = "";
-    if (data.summary.method === "kmp"){
-      extra = `
-        <div class="kv">
-          <div class="k">Info KMP</div>
-          <div class="v">KMP memakai tabel LPS untuk menghindari perbandingan ulang saat mismatch.</div>
-          <div class="k">LPS</div>
-          <div class="v"><span class="pill">${esc((ex.lps||[]).join(", "))}</span></div>
-        </div>
-      `;
-    } else if (data.summary.method === "bm"){
-      extra = `
-        <div class="kv">
-          <div class="k">Info BM</div>
-          <div class="v">BM memakai tabel last occurrence (bad character) untuk menentukan lompatan shift.</div>
-          <div class="k">Last Table</div>
-          <div class="v"><div class="codebox">${esc(formatJSON(ex.last_table||{}))}</div></div>
-        </div>
-      `;
-    } else {
-      extra = `
-        <div class="kv">
-          <div class="k">Info Naive</div>
-          <div class="v">Naive menggeser pattern satu-per-satu dan membandingkan dari kiri.</div>
-        </div>
-      `;
-    }
-
-    // Alasan keputusan
-    let alasan = "";
-    if (r.status === "DUPLIKAT"){
-      alasan = `PATTERN ditemukan pada TEXT (indeks ${esc(r.idx)}). Substring bukti di-highlight.`;
-    } else {
-      alasan = `Tidak ditemukan substring identik setelah semua pergeseran/shift diperiksa oleh metode ${esc(data.summary.method_label)}.`;
-    }
-
-    acc += `
+function appendAccHeads(){
+  const list = document.getElementById("accList");
+  if(!list) return;
+  const upto = Math.min(STATE.rows.length, STATE.accLimit);
+  let html = "";
+  for(let k = STATE.accShown; k < upto; k++){
+    const r = STATE.rows[k];
+    html += `
       <div class="accItem">
-        <div class="accHead" onclick="toggleAcc('${accBodyId}')">
+        <div class="accHead" onclick="toggleAcc(${k})">
           <div class="left">
-            <span class="pill">${esc(title)}</span>
-            ${statusPill}
+            <span class="pill">${esc(`Pasangan (${r.i1}, ${r.i2})`)}</span>
+            ${statusTag(r, true)}
           </div>
-          <div class="pill">${esc(r.time_ms)} ms • ${esc(ex.comparisons ?? 0)} comps</div>
+          <div class="pill">${esc(r.time_ms)} ms • ${esc(r.comparisons ?? 0)} comps</div>
         </div>
+        <div class="accBody" id="accBody_${k}" style="display:none"></div>
+      </div>
+    `;
+  }
+  list.insertAdjacentHTML("beforeend", html);
+  STATE.accShown = upto;
 
-        <div class="accBody" id="${accBodyId}" style="display:none">
-          <div class="kv">
-            <div class="k">Metode</div>
-            <div class="v"><b>${esc(ex.metode || data.summary.method_label)}</b> — ${esc(ex.metode_ringkas || "")}</div>
+  const rest = STATE.rows.length - STATE.accShown;
+  document.getElementById("accMore").innerHTML = rest > 0
+    ? `<button class="btn2" onclick="showMoreAcc()">Tampilkan ${Math.min(rest, ACC_CHUNK)} pasangan lagi (${rest} tersisa)</button>`
+    : ``;
+}
 
-            <div class="k">Aturan</div>
-            <div class="v">${esc(ex.aturan_duplikasi || "")}</div>
+function showMoreAcc(){
+  STATE.accLimit += ACC_CHUNK;
+  appendAccHeads();
+}
 
-            <div class="k">Kalimat A</div>
-            <div class="v">${esc(r.a)}</div>
+async function toggleAcc(k){
+  const body = document.getElementById(`accBody_${k}`);
+  if(!body) return;
+  const open = (body.style.display === "none" || body.style.display === "");
+  body.style.display = open ? "block" : "none";
+  if(!open || body.dataset.built) return;
 
-            <div class="k">Kalimat B</div>
-            <div class="v">${esc(r.b)}</div>
-          </div>
+  body.dataset.built = "1";
+  body.innerHTML = `<div class="hint">Memuat detail...</div>`;
+  try{
+    const data = await postCheck({...STATE.req, offset: STATE.rows[k].ord, limit: 1, detail: true});
+    if(!data.ok || !data.results.length) throw new Error(data.error || "detail kosong");
+    body.innerHTML = buildAccBody(data.results[0], STATE.summary);
+  } catch(e){
+    delete body.dataset.built;
+    body.innerHTML = `<span style="color:#e11d48;font-weight:950">Error:</span> ${esc(String(e.message || e))}`;
+  }
+}
 
-          <div class="grid2">
-            <div>
-              <div class="pill">Normalisasi A</div>
-              <div class="codebox">${esc(ex.normA || "")}</div>
-            </div>
-            <div>
-              <div class="pill">Normalisasi B</div>
-              <div class="codebox">${esc(ex.normB || "")}</div>
-            </div>
-          </div>
+// tabel praproses engine: array (LPS, Z) → pill, array padat beralfabet (last BM)
+// → simbol:posisi yang ada di PATTERN, objek (mode kata) → JSON; null → tidak ditampilkan
+function tableKV(label, table, alphabet){
+  if(table === undefined || table === null) return "";
+  let v;
+  if(Array.isArray(table) && alphabet){
+    const sym = c => c < alphabet.length ? (alphabet[c] === " " ? "␣" : alphabet[c]) : "lain";
+    v = `<span class="pill">${esc(table.map((lo, c) => lo >= 0 ? `${sym(c)}:${lo}` : "").filter(Boolean).join("  "))}</span>`;
+  } else if(Array.isArray(table)){
+    v = `<span class="pill">${esc(table.join(", "))}</span>`;
+  } else {
+    v = `<div class="codebox">${esc(formatJSON(table))}</div>`;
+  }
+  return `<div class="k">${esc(label)}</div><div class="v">${v}</div>`;
+}
 
-          <div style="height:10px"></div>
+function buildAccBody(r, summary){
+  const ex = r.explain || {};
+  const statusPill = statusTag(r, true);
+
+  // Method-specific info
+  let extra = "";
+  if (summary.rule === "overlap"){
+    extra = `
+      <div class="kv">
+        <div class="k">Info Overlap</div>
+        <div class="v">Substring bersama terpanjang (LCS) dicari dengan suffix automaton. Rasio = panjang LCS / panjang PATTERN, duplikat jika ≥ ${esc(summary.threshold)}.</div>
+        <div class="k">Rasio Overlap</div>
+        <div class="v"><span class="pill">${esc(((ex.overlap_ratio || 0)*100).toFixed(1))}%</span></div>
+        <div class="k">Substring Bersama</div>
+        <div class="v"><div class="codebox">${esc((ex.overlaps || []).map(o => `[${o.length}] ${o.match_norm}`).join("\n"))}</div></div>
+      </div>
+    `;
+  } else if (summary.method === "all"){
+    extra = `
+      <div class="kv">
+        <div class="k">Per Metode</div>
+        <div class="v">
+          <table><thead><tr><th>Metode</th><th>Idx</th><th>Comparisons</th><th>Waktu (ms)</th></tr></thead>
+          <tbody>${Object.entries(ex.methods || {}).map(([k, m]) => `
+            <tr><td>${esc(METHOD_SHORT[k] || k)}</td><td>${esc(m.idx)}</td><td>${esc(m.comparisons)}</td><td>${esc(m.time_ms)}</td></tr>`).join("")}
+          </tbody></table>
+        </div>
+        ${ENGINES.filter(e => e.compare && e.table).map(e => tableKV(`${e.table_label} (${e.short})`, (ex.tables || {})[e.table], e.table_alphabet)).join("")}
+      </div>
+    `;
+  } else {
+    const eng = ENGINES.find(e => e.name === summary.method) || {short: summary.method, info: ""};
+    extra = `
+      <div class="kv">
+        <div class="k">Info ${esc(eng.short)}</div>
+        <div class="v">${esc(eng.info)}</div>
+        ${eng.table ? tableKV(eng.table_label, (ex.tables || {})[eng.table], eng.table_alphabet) : ""}
+      </div>
+    `;
+  }
 
-          <div class="kv">
-            <div class="k">TEXT</div>
-            <div class="v">Sumber: <b>${esc(ex.text_source || "")}</b></div>
-            <div class="k">PATTERN</div>
-            <div class="v">Sumber: <b>${esc(ex.pattern_source || "")}</b></div>
-          </div>
+  // Alasan keputusan
+  let alasan = "";
+  if (summary.rule === "overlap"){
+    alasan = (r.status === "DUPLIKAT")
+      ? `Substring bersama terpanjang mencakup ${esc(((ex.overlap_ratio || 0)*100).toFixed(1))}% PATTERN (mulai indeks ${esc(r.idx)} di TEXT). Bagian bersama di-highlight di kedua kalimat.`
+      : `Substring bersama terpanjang hanya ${esc(((ex.overlap_ratio || 0)*100).toFixed(1))}% PATTERN, di bawah threshold.`;
+  } else if (r.status === "DUPLIKAT"){
+    alasan = `PATTERN ditemukan pada TEXT (indeks ${esc(r.idx)}). Substring bukti di-highlight.`;
+  } else {
+    alasan = `Tidak ditemukan substring identik setelah semua pergeseran/shift diperiksa oleh metode ${esc(summary.method_label)}.`;
+  }
 
-          <div class="grid2">
-            <div>
-              <div class="pill">TEXT (normalized)</div>
-              <div class="codebox">${esc(ex.text_norm || "")}</div>
-            </div>
-            <div>
-              <div class="pill">PATTERN (normalized)</div>
-              <div class="codebox">${esc(ex.pattern_norm || "")}</div>
-            </div>
-          </div>
+  return `
+    <div class="kv">
+      <div class="k">Metode</div>
+      <div class="v"><b>${esc(ex.metode || summary.method_label)}</b> — ${esc(ex.metode_ringkas || "")}</div>
 
-          ${extra}
+      <div class="k">Aturan</div>
+      <div class="v">${esc(ex.aturan_duplikasi || "")}</div>
 
-          <div class="kv">
-            <div class="k">Keputusan</div>
-            <div class="v">${statusPill} — ${esc(alasan)}</div>
-          </div>
+      <div class="k">Kalimat A</div>
+      <div class="v">${esc(r.a)}</div>
 
-          <div class="grid2">
-            <div>
-              <div class="pill">Bukti (Highlight) — Kalimat A</div>
-              <div class="codebox" style="font-family:Inter,system-ui">${r.a_hl}</div>
-            </div>
-            <div>
-              <div class="pill">Bukti (Highlight) — Kalimat B</div>
-              <div class="codebox" style="font-family:Inter,system-ui">${r.b_hl}</div>
-            </div>
-          </div>
+      <div class="k">Kalimat B</div>
+      <div class="v">${esc(r.b)}</div>
+    </div>
+
+    <div class="grid2">
+      <div>
+        <div class="pill">Normalisasi A</div>
+        <div class="codebox">${esc(ex.normA || "")}</div>
+      </div>
+      <div>
+        <div class="pill">Normalisasi B</div>
+        <div class="codebox">${esc(ex.normB || "")}</div>
+      </div>
+    </div>
+
+    <div style="height:10px"></div>
+
+    <div class="kv">
+      <div class="k">TEXT</div>
+      <div class="v">Sumber: <b>${esc(ex.text_source || "")}</b></div>
+      <div class="k">PATTERN</div>
+      <div class="v">Sumber: <b>${esc(ex.pattern_source || "")}</b></div>
+    </div>
+
+    <div class="grid2">
+      <div>
+        <div class="pill">TEXT (normalized)</div>
+        <div class="codebox">${esc(ex.text_norm || "")}</div>
+      </div>
+      <div>
+        <div class="pill">PATTERN (normalized)</div>
+        <div class="codebox">${esc(ex.pattern_norm || "")}</div>
+      </div>
+    </div>
 
-          ${data.summary.mode === "trace" ? `
-            <div style="height:10px"></div>
-            <div class="pill">Trace (Algoritma)</div>
-            <div class="trace">${esc((r.trace || []).join("\\n"))}</div>
-          ` : ``}
+    ${ex.unit === "word" ? `
+      <div class="grid2">
+        <div>
+          <div class="pill">TEXT (id token)</div>
+          <div class="codebox">${esc((ex.text_ids || []).join(", "))}</div>
+        </div>
+        <div>
+          <div class="pill">PATTERN (id token)</div>
+          <div class="codebox">${esc((ex.pattern_ids || []).join(", "))}</div>
         </div>
       </div>
-    `;
+    ` : ``}
+
+    ${extra}
+
+    <div class="kv">
+      <div class="k">Keputusan</div>
+      <div class="v">${statusPill} — ${esc(alasan)}</div>
+    </div>
+
+    <div class="grid2">
+      <div>
+        <div class="pill">Bukti (Highlight) — Kalimat A</div>
+        <div class="codebox" style="font-family:Inter,system-ui">${r.a_hl}</div>
+      </div>
+      <div>
+        <div class="pill">Bukti (Highlight) — Kalimat B</div>
+        <div class="codebox" style="font-family:Inter,system-ui">${r.b_hl}</div>
+      </div>
+    </div>
+
+    ${summary.mode === "trace" ? `
+      <div style="height:10px"></div>
+      <div class="pill">Trace (Algoritma)</div>
+      <div class="trace">${esc((r.trace || []).join("\n"))}</div>
+    ` : ``}
+  `;
+}
+
+function showError(msg){
+  showProcess(false);
+  const html = `<span style="color:#e11d48;font-weight:950">Error:</span> ${esc(msg)}`;
+  document.getElementById("resultArea").innerHTML = html;
+  document.getElementById("processArea").innerHTML = html;
+}
+
+// ekspor semua pasangan (mode fast) lewat /api/check/export → unduh file
+async function exportResults(format){
+  if(!STATE || !STATE.req){ alert("Jalankan pemeriksaan terlebih dahulu."); return; }
+  const {sentences, method, unit, rule, threshold} = STATE.req;
+  const resp = await fetch(`/api/check/export?format=${format}`, {
+    method: "POST",
+    headers: {"Content-Type":"application/json"},
+    body: JSON.stringify({sentences, method, unit, rule, threshold})
   });
+  if(!resp.ok){
+    const data = await resp.json().catch(() => ({error: resp.statusText}));
+    alert(`Export gagal: ${data.error}`);
+    return;
+  }
+  let blob;
+  try{
+    blob = await resp.blob();
+  }catch(e){
+    // server membatalkan stream (deadline habis) → jangan simpan file yang terpotong
+    alert("Export gagal: stream terputus sebelum selesai. Kurangi jumlah kalimat lalu coba lagi.");
+    return;
+  }
+  const url = URL.createObjectURL(blob);
+  const a = document.createElement("a");
+  a.href = url;
+  a.download = `hasil_pairwise.${format}`;
+  a.click();
+  URL.revokeObjectURL(url);
+}
+
+// ---------- Skala empiris (/api/scaling) ----------
+let SCALING = null;
+const SCALE_COLORS = ["#6c5ce7", "#10b981", "#f59e0b", "#e11d48", "#0ea5e9"];
+const MODEL_FN = {"n": (n, m) => n, "nm": (n, m) => n * m, "n/m": (n, m) => n / m};
 
-  acc += `</div>`;
-  area.innerHTML = header + acc;
+async function runScaling(){
+  const btn = document.getElementById("scaleBtn");
+  btn.disabled = true;
+  document.getElementById("scalingArea").innerHTML = "Mengukur...";
+  try{
+    const data = await postCheck({
+      method: document.getElementById("scaleMethod").value,
+      kind: document.getElementById("scaleKind").value
+    }, "/api/scaling");
+    if(!data.ok){
+      document.getElementById("scalingArea").innerHTML =
+        `<span style="color:#e11d48;font-weight:950">Error:</span> ${esc(data.error)}`;
+      return;
+    }
+    SCALING = data;
+    drawScaling();
+  } catch(e){
+    document.getElementById("scalingArea").innerHTML = `Gagal mengukur. ${esc(String(e))}`;
+  } finally {
+    btn.disabled = false;
+  }
+}
+
+function drawScaling(){
+  if(!SCALING) return;
+  const key = document.getElementById("scaleKey").value;
+  const pts = SCALING.points;
+  const fits = SCALING.fits[key] || {};
+  const best = SCALING.best[key];
+  const W = 640, H = 300, PAD = 48;
+  const maxN = Math.max(...pts.map(p => p.n), 1);
+  const maxY = Math.max(...pts.map(p => p[key]), 1e-9);
+  const x = n => PAD + (n / maxN) * (W - 2 * PAD);
+  const y = v => H - PAD - (v / maxY) * (H - 2 * PAD);
+
+  const ms = [...new Set(pts.map(p => p.m))];
+  let svg = `<svg viewBox="0 0 ${W} ${H}" width="100%" style="max-width:${W}px;background:#fff;border:1px solid var(--stroke);border-radius:18px">
+    <line x1="${PAD}" y1="${H-PAD}" x2="${W-PAD}" y2="${H-PAD}" stroke="#9ca3af"/>
+    <line x1="${PAD}" y1="${PAD}" x2="${PAD}" y2="${H-PAD}" stroke="#9ca3af"/>
+    <text x="${W-PAD}" y="${H-PAD+28}" font-size="11" text-anchor="end">n = ${maxN}</text>
+    <text x="${PAD-6}" y="${PAD-8}" font-size="11">${esc(key)} max = ${maxY}</text>`;
+  ms.forEach((m, k) => {
+    const color = SCALE_COLORS[k % SCALE_COLORS.length];
+    const row = pts.filter(p => p.m === m);
+    svg += `<polyline fill="none" stroke="${color}" stroke-width="2" points="${row.map(p => `${x(p.n)},${y(p[key])}`).join(" ")}"/>`;
+    row.forEach(p => { svg += `<circle cx="${x(p.n)}" cy="${y(p[key])}" r="3" fill="${color}"><title>n=${p.n}, m=${p.m}: ${p[key]}</title></circle>`; });
+    if(best && fits[best]){
+      const c = fits[best].coef, f = MODEL_FN[best];
+      svg += `<polyline fill="none" stroke="${color}" stroke-dasharray="4 4" points="${row.map(p => `${x(p.n)},${y(c * f(p.n, p.m))}`).join(" ")}"/>`;
+    }
+    svg += `<text x="${W-PAD+4}" y="${PAD + 14*k}" font-size="11" fill="${color}">m=${m}</text>`;
+  });
+  svg += `</svg>`;
+
+  const fitRows = Object.entries(fits).map(([name, f]) => `
+    <tr${name === best ? ' style="font-weight:950"' : ""}>
+      <td>${esc(name)}${name === best ? " ✓" : ""}</td><td>${f.coef.toPrecision(4)}</td><td>${f.r2}</td>
+    </tr>`).join("");
+  document.getElementById("scalingArea").innerHTML = `
+    <div class="hint" style="margin-bottom:8px"><b>${esc(SCALING.method_label)}</b> — input ${esc(SCALING.kind)};
+      model terbaik untuk ${esc(key)}: <b>${esc(best || "-")}</b> (garis putus-putus = fit)
+      ${SCALING.complete ? "" : " — <b>parsial</b> (deadline habis)"}</div>
+    ${svg}
+    <div style="height:10px"></div>
+    <table><thead><tr><th>Model</th><th>Koefisien c (y ≈ c·f)</th><th>R²</th></tr></thead><tbody>${fitRows}</tbody></table>
+  `;
 }
 
 async function run(){
@@ -1251,89 +1192,58 @@ async function run(){
 
   const method = document.getElementById("method").value;
   const mode = document.getElementById("mode").value;
+  const unit = document.getElementById("unit").value;
+  const rule = document.getElementById("rule").value;
+  const threshold = parseFloat(document.getElementById("threshold").value);
 
-  const resArea = document.getElementById("resultArea");
-  const procArea = document.getElementById("processArea");
-  resArea.innerHTML = "Memproses...";
-  procArea.innerHTML = "Memproses detail...";
+  STATE = {req: {sentences: sents, method, mode, unit, rule, threshold}, summary: null, rows: [],
+           accLimit: ACC_CHUNK, accShown: 0};
+  document.getElementById("resultArea").innerHTML = "Memproses...";
+  document.getElementById("processArea").innerHTML = "Memproses detail...";
 
   // tampilkan hasil dulu biar terlihat output
   goTo("results","nav_results");
 
   try{
     setStep(2,"done"); setStep(3,"on");
-    const resp = await fetch("/api/check", {
-      method: "POST",
-      headers: {"Content-Type":"application/json"},
-      body: JSON.stringify({sentences: sents, method, mode})
-    });
-
-    const data = await resp.json();
-    if(!data.ok){
-      showProcess(false);
-      resArea.innerHTML = `<span style="color:#e11d48;font-weight:950">Error:</span> ${esc(data.error)}`;
-      procArea.innerHTML = `<span style="color:#e11d48;font-weight:950">Error:</span> ${esc(data.error)}`;
-      runBtn.disabled = false;
-      return;
+    let offset = 0, dup = 0, totalTime = 0;
+    while(offset !== null && offset !== undefined){
+      const data = await postCheck({...STATE.req, offset, limit: PAGE_SIZE, detail: false});
+      if(!data.ok){
+        showError(data.error);
+        return;
+      }
+
+      if(!STATE.summary){
+        STATE.summary = data.summary;
+        // halaman berikutnya dicatat ke run riwayat yang sama (jika HISTORY_DB aktif)
+        if(data.summary.run_id) STATE.req.run_id = data.summary.run_id;
+        setStep(3,"done"); setStep(4,"on");
+        initResultTable();
+        initProcessDetail(data.summary);
+        document.getElementById("k_n").textContent = data.summary.n;
+        document.getElementById("k_pairs").textContent = data.summary.total_pairs;
+      }
+
+      STATE.rows.push(...data.results);
+      addMethodTotals(data.summary.methods);
+      dup += data.summary.dup_count;
+      totalTime += data.summary.total_time_ms;
+      document.getElementById("k_dup").textContent = dup;
+      document.getElementById("k_time").textContent = totalTime.toFixed(3);
+
+      renderRows();
+      appendAccHeads();
+      offset = data.summary.next_offset;
     }
 
-    setStep(3,"done"); setStep(4,"on");
-
-    document.getElementById("k_n").textContent = data.summary.n;
-    document.getElementById("k_pairs").textContent = data.summary.total_pairs;
-    document.getElementById("k_dup").textContent = data.summary.dup_count;
-    document.getElementById("k_time").textContent = data.summary.total_time_ms.toFixed(3);
-
-    // hasil tabel ringkas
-    let html = `
-    <table>
-      <thead>
-        <tr>
-          <th>Pasangan</th>
-          <th>Kalimat A (highlight)</th>
-          <th>Kalimat B (highlight)</th>
-          <th>Status</th>
-          <th>Idx</th>
-          <th>Waktu (ms)</th>
-          <th>Comparisons</th>
-        </tr>
-      </thead>
-      <tbody>
-    `;
-
-    data.results.forEach((r) => {
-      const tag = r.status === "DUPLIKAT"
-        ? `<span class="tag tagDup">✓ DUPLIKAT</span>`
-        : `<span class="tag tagNo">✗ TIDAK</span>`;
-
-      html += `
-        <tr>
-          <td><b>(${r.i1}, ${r.i2})</b></td>
-          <td>${r.a_hl}</td>
-          <td>${r.b_hl}</td>
-          <td>${tag}</td>
-          <td>${esc(String(r.idx))}</td>
-          <td>${esc(String(r.time_ms))}</td>
-          <td>${esc(String((r.explain||{}).comparisons ?? 0))}</td>
-        </tr>
-      `;
-    });
-
-    html += "</tbody></table>";
-    resArea.innerHTML = html;
-
     setStep(4,"done"); setStep(5,"done");
 
-    // build proses detail
-    buildProcessDetail(data);
-
     // auto scroll ke proses (detail) biar dosen lihat "mengapa"
     goTo("process","nav_process");
 
   } catch(e){
-    showProcess(false);
-    resArea.innerHTML = `<span style="color:#e11d48;font-weight:950">Error:</span> Gagal memproses. ${esc(String(e))}`;
-    procArea.innerHTML = `<span style="color:#e11d48;font-weight:950">Error:</span> Gagal memproses. ${esc(String(e))}`;
+    showError(`Gagal memproses. ${String(e)}`);
   } finally {
     runBtn.disabled = false;
   }
@@ -1343,81 +1253,814 @@ async function run(){
 </html>
 """
 
+# ============================================================
+# UI STATIS: render sekali, kompres sekali, layani dengan ETag/304
+# ============================================================
+UI_CACHE_CONTROL = "public, no-cache"  # selalu revalidasi → 304 jika tidak berubah
+
+def _build_ui_page() -> Dict[str, Any]:
+    with app.app_context():
+        engines = [ENGINES[name].describe() for name in engine_names()]
+        raw = render_template_string(
+            HTML, engines=engines, engines_json=json.dumps(engines, ensure_ascii=False),
+            compare_names="/".join(ENGINES[name].short for name in engine_names("compare")),
+            scaling_engines=[e for e in engines if e["name"] in SCALING_METHODS],
+        ).encode("utf-8")
+    variants = {"identity": raw, "gzip": gzip.compress(raw, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(raw, quality=11)
+    digest = hashlib.sha256(raw).hexdigest()[:32]
+    return {
+        "variants": variants,
+        "etags": {enc: digest if enc == "identity" else f"{digest}-{enc}" for enc in variants},
+        "last_modified": datetime.fromtimestamp(int(os.path.getmtime(__file__)), tz=timezone.utc),
+    }
+
+UI_PAGE = _build_ui_page()
+
 @app.get("/")
 def home():
-    return render_template_string(HTML)
+    page = UI_PAGE
+    encoding = "identity"
+    for enc in ("br", "gzip"):
+        if enc in page["variants"] and request.accept_encodings[enc] > 0:
+            encoding = enc
+            break
+    etag = page["etags"][encoding]
+
+    if request.if_none_match:
+        # strong ETag per varian: body gzip yang tersimpan tidak boleh divalidasi sebagai varian br
+        not_modified = request.if_none_match.contains(etag)
+    else:
+        since = request.if_modified_since
+        not_modified = since is not None and since >= page["last_modified"]
 
-@app.post("/api/check")
-def api_check():
-    data = request.get_json(force=True, silent=True) or {}
+    if not_modified:
+        resp = Response(status=304)
+    else:
+        resp = Response(page["variants"][encoding], mimetype="text/html")
+        if encoding != "identity":
+            resp.headers["Content-Encoding"] = encoding
+    resp.set_etag(etag)
+    resp.last_modified = page["last_modified"]
+    resp.headers["Cache-Control"] = UI_CACHE_CONTROL
+    resp.headers["Vary"] = "Accept-Encoding"
+    return resp
+
+# ============================================================
+# ADMISSION CONTROL (BUDGET KERJA + BATAS IN-FLIGHT + DEADLINE)
+# ============================================================
+# 1 unit kerja ≈ 1 perbandingan karakter/token (estimasi kasus terburuk per metode)
+WORK_BUDGET_PER_REQUEST = 200_000_000
+WORK_BUDGET_IN_FLIGHT = 400_000_000
+MAX_IN_FLIGHT_CHECKS = 4
+ADMISSION_QUEUE_TIMEOUT_S = 2.0
+RETRY_AFTER_S = 1
+REQUEST_DEADLINE_MS = 10_000
+TRACE_COST_FACTOR = 20  # satu langkah trace (f-string) jauh lebih mahal dari satu perbandingan
+# index berbasis dict (Python murni) per karakter input, diukur relatif terhadap satu perbandingan
+# (~60 ns): suffix automaton + Aho–Corasick ≈ 18 µs dan ~800 byte, winnowing ≈ 12 µs
+COMPARE_WORK_PER_CHAR = 300
+DOCUMENT_WORK_PER_CHAR = 200
+
+def estimate_pair_work(method: str, rule: str, n: int, m: int, analysis_mode: bool) -> int:
+    if method == "all" and rule != "overlap":
+        return sum(estimate_pair_work(mth, rule, n, m, analysis_mode) for mth in engine_names("compare"))
+    if rule == "overlap":
+        cost = 3 * (n + m)              # bangun automaton + alirkan pattern
+    elif method in ENGINES:
+        cost = ENGINES[method].work(n, m)   # kasus terburuk per engine (lihat registry)
+    else:
+        cost = 1
+    if analysis_mode:
+        cost = min(cost, MAX_TRACE_STEPS) * TRACE_COST_FACTOR
+    return max(cost, 1)
+
+def estimate_work(method: str, rule: str, unit: str, analysis_mode: bool, sentences: List[str],
+                  pairs: Iterable[Tuple[int, int]]) -> int:
+    lengths = [len(s.split()) if unit == "word" else len(s) for s in sentences]
+    total = 0
+    for i, j in pairs:
+        n, m = max(lengths[i], lengths[j]), min(lengths[i], lengths[j])
+        total += estimate_pair_work(method, rule, n, m, analysis_mode)
+    return total
+
+class _Admission:
+    """
+    Batas global: maksimal MAX_IN_FLIGHT_CHECKS request dan WORK_BUDGET_IN_FLIGHT
+    unit kerja sekaligus. Request yang tidak muat menunggu (antri) sampai timeout.
+    """
+    def __init__(self):
+        self.cond = threading.Condition()
+        self.count = 0
+        self.work = 0
+
+    def acquire(self, work: int, timeout: float) -> bool:
+        until = time.monotonic() + timeout
+        with self.cond:
+            # server kosong selalu menerima request yang lolos budget per-request
+            while self.count >= MAX_IN_FLIGHT_CHECKS or (self.count > 0 and self.work + work > WORK_BUDGET_IN_FLIGHT):
+                remaining = until - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self.cond.wait(remaining)
+            self.count += 1
+            self.work += work
+            return True
+
+    def release(self, work: int) -> None:
+        with self.cond:
+            self.count -= 1
+            self.work -= work
+            self.cond.notify_all()
+
+ADMISSION = _Admission()
+
+def _busy_response():
+    """429 + Retry-After untuk request yang tidak mendapat slot admission."""
+    resp = jsonify(ok=False, error=f"Server sedang sibuk. Coba lagi dalam {RETRY_AFTER_S} detik.")
+    resp.status_code = 429
+    resp.headers["Retry-After"] = str(RETRY_AFTER_S)
+    return resp
+
+def _over_budget(work: int, hint: str = ""):
+    """413 untuk request yang estimasi bebannya melebihi WORK_BUDGET_PER_REQUEST."""
+    error = f"Estimasi beban terlalu besar ({work:,} > {WORK_BUDGET_PER_REQUEST:,} unit)."
+    return jsonify(ok=False, error=f"{error} {hint}" if hint else error,
+                   estimated_work=work, budget=WORK_BUDGET_PER_REQUEST), 413
+
+# ============================================================
+# PROFILING PER REQUEST (OPT-IN, ADMIN)
+# ============================================================
+# Aktif hanya jika PROFILE_TOKEN di-set. Request dengan header X-Profile-Token
+# (atau ?profile=<token>) dijalankan di bawah cProfile + tracemalloc dan
+# ringkasannya ditambahkan ke response JSON sebagai "profile". PROFILE_SAMPLE_RATE
+# (0–1) memprofil sebagian request biasa secara acak (hanya disimpan ke disk).
+# Semua profil disimpan ke PROFILE_DIR: <id>.prof (untuk pstats) + <id>.json.
+PROFILE_TOKEN = os.environ.get("PROFILE_TOKEN", "")
+PROFILE_SAMPLE_RATE = 0.0
+if os.environ.get("PROFILE_SAMPLE_RATE"):
+    try:
+        PROFILE_SAMPLE_RATE = float(os.environ["PROFILE_SAMPLE_RATE"])
+        if PROFILE_SAMPLE_RATE != PROFILE_SAMPLE_RATE:  # NaN
+            raise ValueError
+    except ValueError:
+        print(f"PROFILE_SAMPLE_RATE={os.environ['PROFILE_SAMPLE_RATE']!r} tidak valid (harus angka 0–1); "
+              "sampling profil dimatikan.", file=sys.stderr)
+        PROFILE_SAMPLE_RATE = 0.0
+    if not 0.0 <= PROFILE_SAMPLE_RATE <= 1.0:
+        print(f"PROFILE_SAMPLE_RATE={PROFILE_SAMPLE_RATE} di luar 0–1; dipotong ke rentang itu.", file=sys.stderr)
+        PROFILE_SAMPLE_RATE = min(max(PROFILE_SAMPLE_RATE, 0.0), 1.0)
+PROFILE_DIR = os.environ.get("PROFILE_DIR", "profiles")
+PROFILE_TOP_FUNCS = 25
+PROFILE_TOP_ALLOCS = 15
+
+# tracemalloc bersifat global per proses → satu request diprofil pada satu waktu
+_PROFILE_LOCK = threading.Lock()
+
+def _profile_requested() -> bool:
+    if not PROFILE_TOKEN:
+        return False
+    given = request.headers.get("X-Profile-Token") or request.args.get("profile") or ""
+    return hmac.compare_digest(given.encode(), PROFILE_TOKEN.encode())
+
+def _profile_summary(prof: cProfile.Profile, snapshot: tracemalloc.Snapshot, peak: int,
+                     wall_ms: float) -> Dict[str, Any]:
+    stats = pstats.Stats(prof, stream=io.StringIO())
+    rows = sorted(stats.stats.items(), key=lambda kv: kv[1][3], reverse=True)[:PROFILE_TOP_FUNCS]
+    funcs = [{"function": f"{os.path.basename(file)}:{line}({name})", "calls": nc,
+              "tottime_ms": round(tt * 1000, 3), "cumtime_ms": round(ct * 1000, 3)}
+             for (file, line, name), (cc, nc, tt, ct, _) in rows]
+    # snapshot diambil setelah response dibangun: situs alokasi yang masih hidup
+    # (body JSON, cache, trace); puncak keseluruhan ada di peak_alloc_kb
+    snapshot = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)])
+    allocs = [{"site": f"{os.path.basename(st.traceback[0].filename)}:{st.traceback[0].lineno}",
+               "size_kb": round(st.size / 1024, 1), "count": st.count}
+              for st in snapshot.statistics("lineno")[:PROFILE_TOP_ALLOCS]]
+    return {"wall_ms": round(wall_ms, 3), "peak_alloc_kb": round(peak / 1024, 1),
+            "top_cumulative": funcs, "top_alloc_sites": allocs}
+
+def _save_profile(prof: cProfile.Profile, summary: Dict[str, Any]) -> str:
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    profile_id = f"{datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{random.randrange(16**6):06x}"
+    prof.dump_stats(os.path.join(PROFILE_DIR, profile_id + ".prof"))
+    with open(os.path.join(PROFILE_DIR, profile_id + ".json"), "w", encoding="utf-8") as fh:
+        json.dump({"path": request.path, **summary}, fh, indent=2)
+    return profile_id
+
+def profiled(view):
+    """Bungkus view: profil cProfile + tracemalloc jika diminta (token) atau terpilih sampling."""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        requested = _profile_requested()
+        sampled = not requested and PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE
+        if not (requested or sampled) or not _PROFILE_LOCK.acquire(blocking=False):
+            return view(*args, **kwargs)
+        try:
+            prof = cProfile.Profile()
+            tracemalloc.start()
+            t0 = time.perf_counter()
+            prof.enable()
+            try:
+                # make_response di dalam profil → encoding JSON ikut terukur
+                resp = app.make_response(view(*args, **kwargs))
+            finally:
+                prof.disable()
+                wall_ms = (time.perf_counter() - t0) * 1000
+                snapshot = tracemalloc.take_snapshot()
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+        finally:
+            _PROFILE_LOCK.release()
+
+        summary = _profile_summary(prof, snapshot, peak, wall_ms)
+        summary["id"] = _save_profile(prof, summary)
+        resp.headers["X-Profile-Id"] = summary["id"]
+        if requested and resp.is_json:
+            body = resp.get_json()
+            body["profile"] = summary
+            resp.set_data(json.dumps(body, ensure_ascii=False))
+        return resp
+    return wrapper
+
+def _check_options(data: Dict[str, Any], max_sentences: int) -> Tuple[Dict[str, Any], Any]:
+    """Validasi input pemeriksaan pairwise yang dipakai /api/check dan /api/check/export."""
     sentences = data.get("sentences", [])
     method = data.get("method", "naive")
-    mode = data.get("mode", "fast")
+    rule = data.get("rule", "substring")
+    threshold = data.get("threshold", OVERLAP_THRESHOLD)
+    top_k = data.get("top_k", OVERLAP_TOP_K)
 
     if not isinstance(sentences, list) or len(sentences) < 2:
-        return jsonify(ok=False, error="Masukkan minimal 2 kalimat."), 400
-    if len(sentences) > MAX_SENTENCES:
-        return jsonify(ok=False, error=f"Maksimal {MAX_SENTENCES} kalimat."), 400
+        return {}, (jsonify(ok=False, error="Masukkan minimal 2 kalimat."), 400)
+    if len(sentences) > max_sentences:
+        return {}, (jsonify(ok=False, error=f"Maksimal {max_sentences} kalimat."), 400)
+    if not isinstance(method, str) or (method not in ENGINES and method != "all"):
+        return {}, (jsonify(ok=False, error=f"Metode harus salah satu dari {', '.join(engine_names() + ('all',))}."), 400)
+    if rule not in ("substring", "overlap"):
+        return {}, (jsonify(ok=False, error="Aturan harus 'substring' atau 'overlap'."), 400)
+    if isinstance(threshold, bool) or not isinstance(threshold, (int, float)) or not 0 < threshold <= 1:
+        return {}, (jsonify(ok=False, error="Threshold overlap harus di antara 0 dan 1."), 400)
+    if isinstance(top_k, bool) or not isinstance(top_k, int) or not 1 <= top_k <= MAX_OVERLAP_TOP_K:
+        return {}, (jsonify(ok=False, error=f"top_k harus bilangan bulat 1–{MAX_OVERLAP_TOP_K}."), 400)
 
     clean_sentences = []
     for s in sentences:
         if not isinstance(s, str):
-            return jsonify(ok=False, error="Semua input harus berupa teks."), 400
+            return {}, (jsonify(ok=False, error="Semua input harus berupa teks."), 400)
         s = s.strip()
         if len(s) == 0:
             continue
         if len(s) > MAX_INPUT_CHARS_PER_SENTENCE:
-            return jsonify(ok=False, error=f"Satu kalimat terlalu panjang (>{MAX_INPUT_CHARS_PER_SENTENCE} karakter)."), 400
+            return {}, (jsonify(ok=False, error=f"Satu kalimat terlalu panjang (>{MAX_INPUT_CHARS_PER_SENTENCE} karakter)."), 400)
         clean_sentences.append(s)
 
     if len(clean_sentences) < 2:
-        return jsonify(ok=False, error="Masukkan minimal 2 kalimat yang tidak kosong."), 400
+        return {}, (jsonify(ok=False, error="Masukkan minimal 2 kalimat yang tidak kosong."), 400)
+    return {"sentences": clean_sentences, "method": method, "rule": rule, "threshold": threshold, "top_k": top_k,
+            "unit": "word" if data.get("unit", "char") == "word" else "char"}, None
+
+@app.post("/api/check")
+@profiled
+def api_check():
+    data = request.get_json(force=True, silent=True) or {}
+    mode = data.get("mode", "fast")
+    deadline_ms = data.get("deadline_ms", REQUEST_DEADLINE_MS)
+    offset = data.get("offset", 0)
+    limit = data.get("limit")
+    detail = data.get("detail", True)
+    run_id = data.get("run_id")
+
+    opts, err = _check_options(data, MAX_SENTENCES)
+    if err:
+        return err
+    clean_sentences, method, unit, rule = opts["sentences"], opts["method"], opts["unit"], opts["rule"]
+    threshold, top_k = opts["threshold"], opts["top_k"]
+    if isinstance(deadline_ms, bool) or not isinstance(deadline_ms, (int, float)) or deadline_ms <= 0:
+        return jsonify(ok=False, error="deadline_ms harus angka positif."), 400
+    if isinstance(offset, bool) or not isinstance(offset, int) or offset < 0:
+        return jsonify(ok=False, error="offset harus bilangan bulat ≥ 0."), 400
+    if limit is not None and (isinstance(limit, bool) or not isinstance(limit, int) or limit < 1):
+        return jsonify(ok=False, error="limit harus bilangan bulat ≥ 1."), 400
+    if run_id is not None:
+        if (isinstance(run_id, bool) or not isinstance(run_id, int)
+                or HISTORY is None or not HISTORY.run_exists(run_id)):
+            return jsonify(ok=False, error="run_id tidak dikenal."), 400
+        # halaman lanjutan hanya boleh masuk ke run dengan parameter + daftar kalimat yang sama
+        if not HISTORY.run_matches(run_id, method, unit, rule, float(threshold) if rule == "overlap" else None,
+                                   top_k if rule == "overlap" else None, len(clean_sentences),
+                                   sentences_digest(clean_sentences)):
+            return jsonify(ok=False, error="run_id milik run dengan metode/unit/aturan/kalimat berbeda."), 400
 
     analysis_mode = (mode == "trace")
 
+    # Paging: pasangan (i<j) diurutkan leksikografis; halaman = [offset, offset+limit)
+    pairs = list(islice(combinations(range(len(clean_sentences)), 2), offset,
+                        offset + limit if limit is not None else None))
+
+    work = estimate_work(method, rule, unit, analysis_mode, clean_sentences, pairs)
+    if work > WORK_BUDGET_PER_REQUEST:
+        return _over_budget(work, "Kurangi kalimat/panjang teks atau pilih metode KMP.")
+    if not ADMISSION.acquire(work, ADMISSION_QUEUE_TIMEOUT_S):
+        return _busy_response()
+
+    try:
+        deadline = time.perf_counter() + min(deadline_ms, REQUEST_DEADLINE_MS) / 1000
+        return _check_pairs(clean_sentences, pairs, offset, method, analysis_mode, unit, rule, float(threshold),
+                            top_k, deadline, work, bool(detail), run_id)
+    finally:
+        ADMISSION.release(work)
+
+def _check_pairs(clean_sentences: List[str], pairs: List[Tuple[int, int]], offset: int, method: str,
+                 analysis_mode: bool, unit: str, rule: str, threshold: float, top_k: int, deadline: float,
+                 work: int, detail: bool, run_id: Any = None):
+    # kamus kata → id, dipakai bersama semua pasangan; diisi urut kalimat agar id
+    # sama di setiap halaman
+    vocab: Dict[str, int] = {}
+    norms = [normalize(s) for s in clean_sentences]
+    if unit == "word":
+        for norm in norms:
+            encode_words(norm, vocab)
+    # prefilter (aturan substring, halaman ringkas): pasangan yang pasti bukan duplikat
+    # (panjang, bitmask, index kata, histogram, q-gram) ditolak tanpa menjalankan engine
+    prefilter = None
+    if rule == "substring" and not analysis_mode and not detail:
+        prefilter = PairPrefilter(unit)
+        for norm in norms:
+            prefilter.add(norm)
+    pruned = dict.fromkeys(PREFILTERS, 0)
+
     n = len(clean_sentences)
     total_pairs = n * (n - 1) // 2
     results = []
     dup_count = 0
     total_time = 0.0
-
-    for i in range(n):
-        for j in range(i + 1, n):
-            out = run_one_pair(method, clean_sentences[i], clean_sentences[j], analysis_mode)
+    complete = True
+    # histogram operasi per metode (hanya mode fast/count; trace tidak diinstrumentasi)
+    ops_by_method: Dict[str, Dict[str, Any]] = {}
+    # normalisasi per kalimat + tabel LPS/last per PATTERN dipakai ulang antar pasangan/metode
+    cache: Dict[Any, Any] = {}
+    # method="all": total + jumlah kemenangan per metode (comparisons & waktu)
+    method_totals = {m: {"comparisons": 0, "time_ms": 0.0, "wins_comparisons": 0, "wins_time": 0}
+                     for m in engine_names("compare")} if method == "all" and rule != "overlap" else None
+    # store riwayat hanya untuk halaman ringkas mode fast (trace/explain tidak disimpan)
+    store = HISTORY if HISTORY is not None and not analysis_mode and not detail else None
+    key_threshold = threshold if rule == "overlap" else None
+    key_top_k = top_k if rule == "overlap" else None
+    hashes = [sentence_hash(s) for s in clean_sentences] if store is not None else []
+    cached_pairs = 0
+
+    for k, (i, j) in enumerate(pairs):
+        if time.perf_counter() >= deadline:
+            complete = False  # deadline habis → kirim hasil parsial
+            break
+        a, b = clean_sentences[i], clean_sentences[j]
+        by = prefilter.reject(i, j) if prefilter is not None else None
+        if by is not None:
+            pruned[by] += 1
+            results.append(_pruned_row(offset + k, i, j, a, b, by))
+            continue
+        hit = store.lookup(hashes[i], hashes[j], a, b, method, unit, rule, key_threshold, key_top_k) \
+            if store is not None else None
+        if hit is not None:
+            # waktu tersimpan tetap ditampilkan per pasangan, tapi tidak masuk total_time
+            cached_pairs += 1
+            row = {"ord": offset + k, "i1": i + 1, "i2": j + 1, **hit,
+                   "trace": None, "explain": None, "cached": True, "pruned": None}
+        else:
+            out = run_one_pair(method, a, b, analysis_mode, unit, vocab, rule, threshold, top_k, cache)
             total_time += out["time_ms"]
-            if out["idx"] >= 0:
-                dup_count += 1
-
-            results.append({
+            ops = out["explain"]["ops"]
+            if ops is not None:
+                add_op_stats(ops_by_method.setdefault("sam" if rule == "overlap" else method, new_op_summary()), ops)
+            per_method = out["explain"]["methods"]
+            if per_method is not None:
+                for m, r in per_method.items():
+                    if r["ops"] is not None:
+                        add_op_stats(ops_by_method.setdefault(m, new_op_summary()), r["ops"])
+            row = {
+                "ord": offset + k,
                 "i1": i + 1,
                 "i2": j + 1,
-                "a": clean_sentences[i],
-                "b": clean_sentences[j],
+                "a": a,
+                "b": b,
                 "a_hl": out["a_hl"],
                 "b_hl": out["b_hl"],
                 "status": out["status"],
                 "idx": out["idx"],
                 "time_ms": out["time_ms"],
-                "trace": out["trace"] if analysis_mode else None,
-                "explain": out["explain"]
-            })
-
+                "comparisons": out["explain"]["comparisons"],
+                "methods": {m: {k: r[k] for k in ("idx", "time_ms", "comparisons")}
+                            for m, r in per_method.items()} if per_method is not None else None,
+                "overlap_ratio": out["overlap_ratio"],
+                "trace": out["trace"] if analysis_mode and detail else None,
+                "explain": out["explain"] if detail else None,
+                "cached": False,
+                "pruned": None
+            }
+        if row["idx"] >= 0:
+            dup_count += 1
+        per_method = row["methods"]
+        if per_method is not None:
+            for m, r in per_method.items():
+                method_totals[m]["comparisons"] += r["comparisons"]
+                method_totals[m]["time_ms"] += r["time_ms"]
+            # pemenang pasangan (seri → metode pertama di engine_names("compare"))
+            method_totals[min(per_method, key=lambda m: per_method[m]["comparisons"])]["wins_comparisons"] += 1
+            method_totals[min(per_method, key=lambda m: per_method[m]["time_ms"])]["wins_time"] += 1
+        results.append(row)
+
+    if store is not None:
+        if run_id is None:
+            run_id = store.start_run(method, "fast", unit, rule, key_threshold, key_top_k, n, total_pairs,
+                                     sentences_digest(clean_sentences))
+        store.add_results(run_id, hashes, results, method, unit, rule, key_threshold, key_top_k,
+                          cached_pairs, total_time)
+
+    processed = len(results)
+    computed = processed - cached_pairs - sum(pruned.values())
+    next_offset = offset + processed
     return jsonify(
         ok=True,
         summary={
             "n": n,
             "total_pairs": total_pairs,
+            "processed_pairs": processed,
+            "complete": complete,
+            "offset": offset,
+            "next_offset": next_offset if next_offset < total_pairs else None,
             "dup_count": dup_count,
-            "no_dup": total_pairs - dup_count,
+            "no_dup": processed - dup_count,
             "total_time_ms": round(total_time, 3),
-            "avg_time_ms": round(total_time / total_pairs, 3),
+            "avg_time_ms": round(total_time / computed, 3) if computed else 0.0,
+            "cached_pairs": cached_pairs,
+            "pruned_pairs": pruned if prefilter is not None else None,
+            "run_id": run_id if store is not None else None,
+            "estimated_work": work,
             "method": method,
             "method_label": method_label(method),
-            "mode": "trace" if analysis_mode else "fast"
+            "mode": "trace" if analysis_mode else "fast",
+            "unit": unit,
+            "rule": rule,
+            "threshold": threshold if rule == "overlap" else None,
+            "ops": {m: op_summary_json(agg) for m, agg in ops_by_method.items()} or None,
+            "methods": _method_summary(method_totals) if method_totals is not None else None
         },
         results=results
     )
 
+def _pruned_row(ord_: int, i: int, j: int, a: str, b: str, by: str) -> Dict[str, Any]:
+    """Baris hasil pasangan yang ditolak sebelum engine dijalankan (pasti TIDAK DUPLIKAT)."""
+    return {"ord": ord_, "i1": i + 1, "i2": j + 1, "a": a, "b": b,
+            "a_hl": escape_html(a), "b_hl": escape_html(b), "status": "TIDAK DUPLIKAT", "idx": -1,
+            "time_ms": 0.0, "comparisons": 0, "methods": None, "overlap_ratio": None,
+            "trace": None, "explain": None, "cached": False, "pruned": by}
+
+def _method_summary(totals: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Total per metode (halaman ini) + pemenang agregat: comparisons dan waktu terkecil."""
+    for t in totals.values():
+        t["time_ms"] = round(t["time_ms"], 3)
+    return {
+        "per_method": totals,
+        "winner_comparisons": min(totals, key=lambda m: totals[m]["comparisons"]),
+        "winner_time": min(totals, key=lambda m: totals[m]["time_ms"]),
+    }
+
+EXPORT_MIMETYPES = {"csv": "text/csv", "parquet": "application/vnd.apache.parquet"}
+
+@app.post("/api/check/export")
+def api_check_export():
+    """
+    Semua pasangan (mode fast) sebagai laporan CSV / Parquet yang di-stream.
+    Body JSON sama dengan /api/check (tanpa paging); format lewat ?format=csv|parquet.
+    """
+    fmt = request.args.get("format", "csv")
+    if fmt not in EXPORT_FORMATS:
+        return jsonify(ok=False, error="Format harus 'csv' atau 'parquet'."), 400
+    if fmt == "parquet" and not parquet_available():
+        return jsonify(ok=False, error="Format parquet memerlukan paket pyarrow."), 400
+    data = request.get_json(force=True, silent=True) or {}
+    opts, err = _check_options(data, MAX_EXPORT_SENTENCES)
+    if err:
+        return err
+    sentences, method, unit, rule = opts["sentences"], opts["method"], opts["unit"], opts["rule"]
+
+    # estimasi dihitung lazily atas semua pasangan (tanpa membentuk list O(n²))
+    work = estimate_work(method, rule, unit, False, sentences, combinations(range(len(sentences)), 2))
+    if work > WORK_BUDGET_PER_REQUEST:
+        return _over_budget(work, "Kurangi kalimat/panjang teks atau pilih metode builtin.")
+    if not ADMISSION.acquire(work, ADMISSION_QUEUE_TIMEOUT_S):
+        return _busy_response()
+
+    columns = export_columns(method, rule)
+    rows = iter_pair_rows(sentences, method, unit, rule, float(opts["threshold"]), opts["top_k"])
+    body = iter_csv(rows, columns) if fmt == "csv" else iter_parquet(rows, columns)
+    # slot admission dilepas saat stream selesai / koneksi ditutup, atau oleh timer saat deadline
+    # habis — klien yang berhenti membaca menahan generator di write, jadi cek di dalamnya saja tidak cukup
+    release = _release_once(work)
+    timer = threading.Timer(REQUEST_DEADLINE_MS / 1000, release)
+    timer.daemon = True
+    timer.start()
+    resp = Response(_until_deadline(body, time.perf_counter() + REQUEST_DEADLINE_MS / 1000),
+                    mimetype=EXPORT_MIMETYPES[fmt])
+    resp.call_on_close(timer.cancel)
+    resp.call_on_close(release)
+    resp.headers["Content-Disposition"] = f'attachment; filename="hasil_pairwise.{fmt}"'
+    return resp
+
+def _release_once(work: int):
+    """Pelepas slot admission yang aman dipanggil berkali-kali / dari thread lain (timer)."""
+    lock = threading.Lock()
+    released = False
+
+    def release() -> None:
+        nonlocal released
+        with lock:
+            if released:
+                return
+            released = True
+        ADMISSION.release(work)
+    return release
+
+def _until_deadline(chunks, deadline: float):
+    """
+    Teruskan potongan stream sampai deadline; setelah itu stream DIBATALKAN (exception),
+    bukan diakhiri normal, agar klien melihat unduhan gagal dan bukan file terpotong yang tampak utuh.
+    """
+    try:
+        for chunk in chunks:
+            if time.perf_counter() >= deadline:
+                raise TimeoutError(f"Ekspor melewati deadline {REQUEST_DEADLINE_MS} ms; stream dibatalkan.")
+            yield chunk
+    finally:
+        chunks.close()
+
+def _clean_sentence_list(items: Any, label: str, max_items: int) -> Tuple[List[str], Any]:
+    if not isinstance(items, list) or len(items) == 0:
+        return [], (jsonify(ok=False, error=f"Set {label} harus berisi minimal 1 kalimat."), 400)
+    if len(items) > max_items:
+        return [], (jsonify(ok=False, error=f"Set {label} maksimal {max_items} kalimat."), 400)
+    out = []
+    for s in items:
+        if not isinstance(s, str):
+            return [], (jsonify(ok=False, error="Semua input harus berupa teks."), 400)
+        s = s.strip()
+        if len(s) == 0:
+            continue
+        if len(s) > MAX_INPUT_CHARS_PER_SENTENCE:
+            return [], (jsonify(ok=False, error=f"Satu kalimat terlalu panjang (>{MAX_INPUT_CHARS_PER_SENTENCE} karakter)."), 400)
+        out.append(s)
+    if not out:
+        return [], (jsonify(ok=False, error=f"Set {label} tidak boleh kosong."), 400)
+    return out, None
+
+@app.post("/api/compare")
+def api_compare():
+    """
+    Set A (mis. kalimat mahasiswa) × set B (mis. sumber): hanya pasangan lintas set.
+    Index dibangun sekali di sisi yang lebih besar; response hanya berisi pasangan DUPLIKAT.
+    """
+    data = request.get_json(force=True, silent=True) or {}
+    unit = "word" if data.get("unit", "char") == "word" else "char"
+    set_a, err = _clean_sentence_list(data.get("a"), "A", MAX_COMPARE_SENTENCES)
+    if err:
+        return err
+    set_b, err = _clean_sentence_list(data.get("b"), "B", MAX_COMPARE_SENTENCES)
+    if err:
+        return err
+
+    # index + query linear terhadap total panjang, tetapi automaton dict jauh lebih mahal per karakter
+    work = COMPARE_WORK_PER_CHAR * (sum(map(len, set_a)) + sum(map(len, set_b)))
+    if work > WORK_BUDGET_PER_REQUEST:
+        return _over_budget(work, "Kurangi jumlah/panjang kalimat per set.")
+    if not ADMISSION.acquire(work, ADMISSION_QUEUE_TIMEOUT_S):
+        return _busy_response()
+    try:
+        out = compare_sets(set_a, set_b, unit)
+    finally:
+        ADMISSION.release(work)
+
+    results = out["results"]
+    return jsonify(
+        ok=True,
+        summary={
+            "n_a": len(set_a),
+            "n_b": len(set_b),
+            "total_pairs": len(set_a) * len(set_b),
+            "dup_count": len(results),
+            "index_side": out["index_side"],
+            "index_states": out["index_states"],
+            "build_ms": out["build_ms"],
+            "query_ms": out["query_ms"],
+            "unit": unit
+        },
+        results=results
+    )
+
+@app.post("/api/documents")
+def api_documents():
+    """
+    Passage bersama antar dokumen utuh (lintas baris/kalimat) dengan fingerprint
+    winnowing: {"documents": [{"name": ..., "text": ...}, ...], "k": 20, "w": 10, "max_postings": 50}.
+    """
+    data = request.get_json(force=True, silent=True) or {}
+    docs = data.get("documents")
+    k = data.get("k", WINNOW_K)
+    w = data.get("w", WINNOW_W)
+    max_postings = data.get("max_postings", MAX_POSTINGS)
+    if not isinstance(docs, list) or len(docs) < 2:
+        return jsonify(ok=False, error="Masukkan minimal 2 dokumen."), 400
+    if len(docs) > MAX_DOCUMENTS:
+        return jsonify(ok=False, error=f"Maksimal {MAX_DOCUMENTS} dokumen."), 400
+    for name, val, lo, hi in (("k", k, 5, 200), ("w", w, 1, 200), ("max_postings", max_postings, 2, MAX_POSTINGS_LIMIT)):
+        if isinstance(val, bool) or not isinstance(val, int) or not lo <= val <= hi:
+            return jsonify(ok=False, error=f"{name} harus bilangan bulat {lo}–{hi}."), 400
+    clean = []
+    for i, d in enumerate(docs):
+        if not isinstance(d, dict) or not isinstance(d.get("text"), str):
+            return jsonify(ok=False, error="Setiap dokumen harus berupa {\"name\", \"text\"}."), 400
+        if len(d["text"]) > MAX_DOCUMENT_CHARS:
+            return jsonify(ok=False, error=f"Dokumen terlalu panjang (>{MAX_DOCUMENT_CHARS} karakter)."), 400
+        clean.append((str(d.get("name") or f"dokumen {i + 1}"), d["text"]))
+
+    # normalisasi + hash rolling + winnowing + perpanjangan seed per karakter
+    work = DOCUMENT_WORK_PER_CHAR * sum(len(t) for _, t in clean)
+    if work > WORK_BUDGET_PER_REQUEST:
+        return _over_budget(work, "Kurangi jumlah/panjang dokumen.")
+    if not ADMISSION.acquire(work, ADMISSION_QUEUE_TIMEOUT_S):
+        return _busy_response()
+    try:
+        t0 = time.perf_counter()
+        index = FingerprintIndex(k, w, max_postings=max_postings)
+        for name, text in clean:
+            index.add(name, text)
+        results = index.report()
+        skipped = index.skipped_fingerprints
+        t_ms = (time.perf_counter() - t0) * 1000
+    finally:
+        ADMISSION.release(work)
+
+    return jsonify(
+        ok=True,
+        summary={
+            "n_documents": len(index),
+            "fingerprints": len(index.postings),
+            "k": k,
+            "w": w,
+            "max_postings": max_postings,
+            # fingerprint bersama yang dilewati bisa menyembunyikan passage → tanpa jaminan ambang
+            "skipped_fingerprints": skipped,
+            "guaranteed_len": index.threshold if not skipped else None,
+            "pairs_with_passages": len(results),
+            "time_ms": round(t_ms, 3)
+        },
+        results=results
+    )
+
+@app.post("/api/corpus/check")
+def api_corpus_check():
+    """Cek kalimat terhadap corpus referensi mmap (CORPUS_PATH); hanya pasangan DUPLIKAT."""
+    if CORPUS is None:
+        return jsonify(ok=False, error="Corpus referensi belum dimuat (set CORPUS_PATH)."), 400
+    data = request.get_json(force=True, silent=True) or {}
+    sentences, err = _clean_sentence_list(data.get("sentences"), "kalimat", MAX_COMPARE_SENTENCES)
+    if err:
+        return err
+
+    # pencarian di mmap adalah C-level find → ~1 unit per 8 byte corpus yang dipindai
+    work = len(sentences) * max(1, CORPUS.norm_size // 8)
+    if work > WORK_BUDGET_PER_REQUEST:
+        return _over_budget(work, "Kurangi jumlah kalimat per request.")
+    if not ADMISSION.acquire(work, ADMISSION_QUEUE_TIMEOUT_S):
+        return _busy_response()
+    try:
+        t0 = time.perf_counter()
+        results = []
+        for qi, s in enumerate(sentences):
+            for hit in CORPUS.check(s):
+                results.append({"iq": qi + 1, "query": s, "status": "DUPLIKAT", **hit})
+        t_ms = (time.perf_counter() - t0) * 1000
+    finally:
+        ADMISSION.release(work)
+
+    return jsonify(
+        ok=True,
+        summary={
+            "n": len(sentences),
+            "corpus_size": len(CORPUS),
+            "dup_count": len(results),
+            "total_time_ms": round(t_ms, 3)
+        },
+        results=results
+    )
+
+def _history_page() -> Tuple[int, int, Any]:
+    """offset/limit dari query string untuk endpoint riwayat."""
+    try:
+        offset = int(request.args.get("offset", 0))
+        limit = int(request.args.get("limit", 50))
+    except ValueError:
+        return 0, 0, (jsonify(ok=False, error="offset dan limit harus bilangan bulat."), 400)
+    if offset < 0 or not 1 <= limit <= MAX_HISTORY_LIMIT:
+        return 0, 0, (jsonify(ok=False, error=f"offset ≥ 0 dan limit 1–{MAX_HISTORY_LIMIT}."), 400)
+    return offset, limit, None
+
+@app.get("/api/history")
+def api_history():
+    """Daftar run /api/check tersimpan (terbaru dulu), opsional filter ?method=."""
+    if HISTORY is None:
+        return jsonify(ok=False, error="Riwayat tidak aktif (set HISTORY_DB)."), 400
+    offset, limit, err = _history_page()
+    if err:
+        return err
+    out = HISTORY.list_runs(offset, limit, request.args.get("method") or None)
+    next_offset = offset + len(out["runs"])
+    return jsonify(ok=True, offset=offset, next_offset=next_offset if next_offset < out["total"] else None, **out)
+
+@app.get("/api/history/<int:run_id>")
+def api_history_run(run_id: int):
+    """Hasil pasangan satu run, per halaman (urut ord)."""
+    if HISTORY is None:
+        return jsonify(ok=False, error="Riwayat tidak aktif (set HISTORY_DB)."), 400
+    offset, limit, err = _history_page()
+    if err:
+        return err
+    out = HISTORY.run_results(run_id, offset, limit)
+    if out is None:
+        return jsonify(ok=False, error="Run tidak ditemukan."), 404
+    next_offset = offset + len(out["results"])
+    return jsonify(ok=True, offset=offset,
+                   next_offset=next_offset if next_offset < out["run"]["processed_pairs"] else None, **out)
+
+@app.get("/api/history/sentence")
+def api_history_sentence():
+    """Semua hasil tersimpan yang melibatkan ?text= (dicocokkan lewat hash normalisasi)."""
+    if HISTORY is None:
+        return jsonify(ok=False, error="Riwayat tidak aktif (set HISTORY_DB)."), 400
+    text = request.args.get("text", "").strip()
+    if not text or len(text) > MAX_INPUT_CHARS_PER_SENTENCE:
+        return jsonify(ok=False, error=f"text wajib diisi (maks {MAX_INPUT_CHARS_PER_SENTENCE} karakter)."), 400
+    offset, limit, err = _history_page()
+    if err:
+        return err
+    return jsonify(ok=True, offset=offset, **HISTORY.sentence_history(text, offset, limit))
+
+def _int_list(value: Any, default: Tuple[int, ...], label: str) -> Tuple[List[int], Any]:
+    if value is None:
+        return list(default), None
+    if (not isinstance(value, list) or not value
+            or any(isinstance(v, bool) or not isinstance(v, int) or not 1 <= v <= MAX_SCALING_N for v in value)):
+        return [], (jsonify(ok=False, error=f"{label} harus list bilangan bulat 1–{MAX_SCALING_N}."), 400)
+    return sorted(set(value)), None
+
+@app.get("/api/pattern-cache")
+def api_pattern_cache():
+    """Counter cache tabel pattern lintas request (size, hits, misses, evictions, hit_rate)."""
+    return jsonify(ok=True, **PATTERN_CACHE.stats())
+
+@app.get("/api/engines")
+def api_engines():
+    """Engine substring terdaftar (nama, label, tabel praproses, kapabilitas)."""
+    return jsonify(ok=True, engines=[ENGINES[name].describe() for name in engine_names()])
+
+@app.post("/api/scaling")
+def api_scaling():
+    """
+    Analisis skala empiris satu metode: deret ukuran n × m (natural / adversarial),
+    comparisons + waktu di-fit ke model n, nm, n/m (lihat complexity.py).
+    """
+    data = request.get_json(force=True, silent=True) or {}
+    method = data.get("method", "kmp")
+    kind = data.get("kind", "natural")
+    repeat = data.get("repeat", 3)
+    if method not in SCALING_METHODS:
+        return jsonify(ok=False, error=f"Metode harus salah satu dari {', '.join(SCALING_METHODS)}."), 400
+    if kind not in SCALING_KINDS:
+        return jsonify(ok=False, error="kind harus 'natural' atau 'adversarial'."), 400
+    if isinstance(repeat, bool) or not isinstance(repeat, int) or not 1 <= repeat <= 10:
+        return jsonify(ok=False, error="repeat harus bilangan bulat 1–10."), 400
+    sizes_n, err = _int_list(data.get("sizes_n"), DEFAULT_SIZES_N, "sizes_n")
+    if err:
+        return err
+    sizes_m, err = _int_list(data.get("sizes_m"), DEFAULT_SIZES_M, "sizes_m")
+    if err:
+        return err
+    if len(sizes_n) * len(sizes_m) > MAX_SCALING_POINTS:
+        return jsonify(ok=False, error=f"Maksimal {MAX_SCALING_POINTS} titik (sizes_n × sizes_m)."), 400
+
+    work = estimate_scaling_work(method, kind, sizes_n, sizes_m, repeat)
+    if work > WORK_BUDGET_PER_REQUEST:
+        return _over_budget(work)
+    if not ADMISSION.acquire(work, ADMISSION_QUEUE_TIMEOUT_S):
+        return _busy_response()
+    try:
+        out = run_scaling(method, kind, sizes_n, sizes_m, repeat,
+                          time.perf_counter() + REQUEST_DEADLINE_MS / 1000)
+    finally:
+        ADMISSION.release(work)
+
+    return jsonify(ok=True, method_label=method_label(method), estimated_work=work, **out)
+
 if __name__ == "__main__":
     # Jalankan: python app.py
     # Buka: http://127.0.0.1:5000
@@ -0,0 +1,240 @@
+"""
+CLI batch pendeteksi duplikasi (tanpa Flask).
+
+Setiap file teks: 1 baris = 1 kalimat. Direktori dibaca rekursif (*.txt).
+Pasangan kalimat dibagi ke process pool dan hasilnya ditulis sebagai JSONL
+(1 baris JSON per pasangan) ke stdout atau file, berurutan dan streaming.
+
+Contoh:
+  python batch_check.py submissions/ sumber.txt --only-dup -o hasil.jsonl
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from string_matching import (
+    OVERLAP_THRESHOLD, OVERLAP_TOP_K, MAX_OVERLAP_TOP_K, PREFILTERS, PairPrefilter, WordIndex, engine_names,
+    normalize, run_one_pair,
+)
+
+CHUNK_PAIRS = 256          # pasangan per task worker (mengurangi overhead IPC)
+WINDOW_PER_WORKER = 4      # task in-flight per worker (memori tetap terbatas)
+
+# Sentence = (file, nomor_baris, teks)
+Sentence = Tuple[str, int, str]
+
+_SENTENCES: List[Sentence] = []
+_OPTS: Dict[str, Any] = {}
+_PREFILTER: Optional[PairPrefilter] = None
+
+
+def collect_files(paths: List[str]) -> List[str]:
+    files: List[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            for root, dirs, names in os.walk(path):
+                dirs.sort()
+                files.extend(os.path.join(root, n) for n in sorted(names) if n.endswith(".txt"))
+        elif os.path.isfile(path):
+            files.append(path)
+        else:
+            raise FileNotFoundError(f"Path tidak ditemukan: {path}")
+    return files
+
+
+def read_sentences(files: List[str], max_chars: int) -> List[Sentence]:
+    out: List[Sentence] = []
+    for f in files:
+        with open(f, encoding="utf-8", errors="replace") as fh:
+            for line_no, line in enumerate(fh, start=1):
+                s = line.strip()
+                if s and len(s) <= max_chars:
+                    out.append((f, line_no, s))
+    return out
+
+
+def build_prefilter(sentences: List[Sentence], unit: str) -> PairPrefilter:
+    prefilter = PairPrefilter(unit)
+    for _, _, s in sentences:
+        prefilter.add(normalize(s))
+    return prefilter
+
+
+def iter_pairs(sentences: List[Sentence], scope: str,
+               index: Optional[WordIndex] = None) -> Iterator[Tuple[int, int]]:
+    """
+    scope="cross": hanya pasangan dari file berbeda (antar submission)
+    scope="file" : hanya pasangan di dalam file yang sama
+    scope="all"  : semua pasangan
+    index (opsional): hanya pasangan kandidat hasil pruning index kata
+    """
+    pairs = index.candidate_pairs() if index is not None else combinations(range(len(sentences)), 2)
+    for i, j in pairs:
+        same = sentences[i][0] == sentences[j][0]
+        if scope == "all" or (scope == "file") == same:
+            yield i, j
+
+
+def _init_worker(sentences: List[Sentence], opts: Dict[str, Any],
+                 prefilter: Optional[PairPrefilter] = None) -> None:
+    global _SENTENCES, _OPTS, _PREFILTER
+    _SENTENCES = sentences
+    _OPTS = opts
+    _PREFILTER = prefilter
+
+
+def _run_chunk(pairs: List[Tuple[int, int]]) -> List[Dict[str, Any]]:
+    opts = _OPTS
+    vocab: Dict[str, int] = {}
+    cache: Dict[Any, Any] = {}   # normalisasi + tabel praproses dipakai ulang dalam satu chunk
+    rows = []
+    for i, j in pairs:
+        fa, la, a = _SENTENCES[i]
+        fb, lb, b = _SENTENCES[j]
+        by = _PREFILTER.reject(i, j) if _PREFILTER is not None else None
+        if by is not None:
+            # ditolak prefilter → pasti TIDAK DUPLIKAT, engine dilewati
+            if not opts["only_dup"]:
+                rows.append({"a_file": fa, "a_line": la, "b_file": fb, "b_line": lb, "status": "TIDAK DUPLIKAT",
+                             "idx": -1, "time_ms": 0.0, "comparisons": 0, "overlap_ratio": None,
+                             "match_norm": "", "match_info": None, "pruned": by})
+            continue
+        out = run_one_pair(opts["method"], a, b, opts["analysis_mode"], opts["unit"], vocab,
+                           opts["rule"], opts["threshold"], opts["top_k"], cache)
+        if opts["only_dup"] and out["idx"] < 0:
+            continue
+        ex = out["explain"]
+        row = {
+            "a_file": fa, "a_line": la,
+            "b_file": fb, "b_line": lb,
+            "status": out["status"],
+            "idx": out["idx"],
+            "time_ms": out["time_ms"],
+            "comparisons": ex["comparisons"],
+            "overlap_ratio": out["overlap_ratio"],
+            "match_norm": ex["match_norm"],
+            "match_info": out["match_info"],
+        }
+        if ex["methods"] is not None:
+            row["methods"] = {m: {k: r[k] for k in ("idx", "time_ms", "comparisons")}
+                              for m, r in ex["methods"].items()}
+        if opts["analysis_mode"]:
+            row["trace"] = out["trace"]
+        rows.append(row)
+    return rows
+
+
+def _chunks(pairs: Iterator[Tuple[int, int]], size: int) -> Iterator[List[Tuple[int, int]]]:
+    while True:
+        chunk = list(islice(pairs, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_batch(sentences: List[Sentence], opts: Dict[str, Any], scope: str,
+              workers: int, prefilter: Optional[PairPrefilter] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Hasil per pasangan, urut sesuai iter_pairs; task dikirim dalam jendela terbatas.
+    Dengan prefilter + only_dup hanya pasangan kandidat index kata yang dibentuk
+    (~O(n) untuk matriks duplikat jarang); pasangan yang ditolak prefilter tidak
+    menjalankan engine dan (tanpa only_dup) ditulis sebagai TIDAK DUPLIKAT.
+    """
+    index = prefilter.index if prefilter is not None and opts["only_dup"] else None
+    chunks = _chunks(iter_pairs(sentences, scope, index), CHUNK_PAIRS)
+    if workers <= 1:
+        _init_worker(sentences, opts, prefilter)
+        for chunk in chunks:
+            yield from _run_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(sentences, opts, prefilter)) as pool:
+        window: deque = deque()
+        for chunk in chunks:
+            window.append(pool.submit(_run_chunk, chunk))
+            if len(window) >= workers * WINDOW_PER_WORKER:
+                yield from window.popleft().result()
+        while window:
+            yield from window.popleft().result()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="Deteksi duplikasi kalimat (batch, output JSONL).")
+    p.add_argument("paths", nargs="+", help="file teks atau direktori (1 baris = 1 kalimat)")
+    p.add_argument("--method", choices=engine_names("batch") + ("all",), default="builtin",
+                   help="builtin = str.find (C), default untuk batch besar; all = "
+                        + "+".join(engine_names("compare")) + " berdampingan")
+    p.add_argument("--mode", choices=("fast", "trace"), default="fast")
+    p.add_argument("--unit", choices=("char", "word"), default="char")
+    p.add_argument("--rule", choices=("substring", "overlap"), default="substring")
+    p.add_argument("--threshold", type=float, default=OVERLAP_THRESHOLD)
+    p.add_argument("--top-k", type=int, default=OVERLAP_TOP_K)
+    p.add_argument("--scope", choices=("cross", "file", "all"), default="cross",
+                   help="cross = antar file (default), file = dalam file, all = semua pasangan")
+    p.add_argument("--max-chars", type=int, default=5000, help="kalimat lebih panjang dilewati")
+    p.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    p.add_argument("--only-dup", action="store_true", help="hanya tulis pasangan DUPLIKAT")
+    p.add_argument("--no-prefilter", action="store_true",
+                   help="matikan prefilter + index kata (aturan substring, mode fast)")
+    p.add_argument("-o", "--output", help="file JSONL (default: stdout)")
+    return p
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    if not 0 < args.threshold <= 1:
+        print("Error: --threshold harus di antara 0 dan 1.", file=sys.stderr)
+        return 2
+    if not 1 <= args.top_k <= MAX_OVERLAP_TOP_K:
+        print(f"Error: --top-k harus 1–{MAX_OVERLAP_TOP_K}.", file=sys.stderr)
+        return 2
+
+    try:
+        files = collect_files(args.paths)
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    sentences = read_sentences(files, args.max_chars)
+    opts = {
+        "method": args.method, "analysis_mode": args.mode == "trace", "unit": args.unit,
+        "rule": args.rule, "threshold": args.threshold, "top_k": args.top_k, "only_dup": args.only_dup,
+    }
+
+    prefilter = None
+    if args.rule == "substring" and args.mode == "fast" and not args.no_prefilter:
+        prefilter = build_prefilter(sentences, args.unit)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    t0 = time.perf_counter()
+    written = dup = 0
+    pruned = dict.fromkeys(PREFILTERS, 0)
+    try:
+        for row in run_batch(sentences, opts, args.scope, args.workers, prefilter):
+            out.write(json.dumps(row, ensure_ascii=False) + "\n")
+            written += 1
+            if row["idx"] >= 0:
+                dup += 1
+            if row.get("pruned"):
+                pruned[row["pruned"]] += 1
+    finally:
+        if out is not sys.stdout:
+            out.close()
+        else:
+            out.flush()
+
+    print(f"{len(files)} file, {len(sentences)} kalimat, {written} baris ditulis, {dup} duplikat, "
+          f"{time.perf_counter() - t0:.2f} s", file=sys.stderr)
+    if any(pruned.values()):
+        print("ditolak prefilter: " + ", ".join(f"{k}={v}" for k, v in pruned.items()), file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
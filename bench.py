@@ -0,0 +1,65 @@
+"""
+Benchmark sederhana untuk engine di string_matching.py.
+
+Jalankan: python bench.py
+"""
+import random
+import timeit
+from typing import Any, Callable
+
+import string_matching as sm
+
+WORDS = ("penelitian ini menggunakan metode knuth morris pratt untuk pencocokan string "
+         "hasil menunjukkan peningkatan akurasi secara signifikan pada data uji").split()
+PUNCT = [",", ".", " –", ";", " (2023)", ":", "!", " - "]
+
+
+def make_text(n_chars: int, seed: int = 1) -> str:
+    rnd = random.Random(seed)
+    parts = []
+    size = 0
+    while size < n_chars:
+        w = rnd.choice(WORDS)
+        if rnd.random() < 0.15:
+            w = w.capitalize()
+        if rnd.random() < 0.05:
+            w = w.replace("a", "á")
+        if rnd.random() < 0.12:
+            w += rnd.choice(PUNCT)
+        parts.append(w)
+        size += len(w) + 1
+    return " ".join(parts)[:n_chars]
+
+
+def bench(label: str, fn: Callable[[], Any], number: int = 200) -> float:
+    best = min(timeit.repeat(fn, number=number, repeat=5)) / number
+    print(f"  {label:<36} {best * 1e6:10.1f} µs")
+    return best
+
+
+def bench_normalize() -> None:
+    text = make_text(5000)
+    print(f"[normalize] input {len(text)} karakter")
+    for fold in sm.FOLD_MODES:
+        bench(f"normalize(fold={fold})", lambda: sm.normalize(text, fold))
+        bench(f"normalize_with_map(fold={fold})", lambda: sm.normalize_with_map(text, fold))
+
+
+def bench_engines() -> None:
+    text = sm.normalize(make_text(5000))
+    pattern = text[-40:-1] + "#"   # tidak ditemukan → seluruh text dipindai
+    print(f"[engine] text {len(text)} karakter, pattern {len(pattern)} karakter (tidak ditemukan)")
+    base = bench("builtin_search (baseline)", lambda: sm.builtin_search(text, pattern), number=2000)
+    for name in sm.engine_names("scaling"):
+        fn = sm.ENGINES[name].fast
+        t = bench(f"{name}_search", lambda: fn(text, pattern), number=20)
+        print(f"  {'':<36} {t / base:10.0f}× baseline")
+
+
+def main() -> None:
+    bench_normalize()
+    bench_engines()
+
+
+if __name__ == "__main__":
+    main()
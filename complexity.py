@@ -0,0 +1,123 @@
+"""
+Analisis kompleksitas empiris untuk engine terdaftar (Naive / KMP / Boyer–Moore / Z)
+(tanpa Flask).
+
+Satu metode dijalankan atas deret ukuran TEXT (n) × PATTERN (m) yang makin besar,
+lalu jumlah perbandingan dan waktu diukur dan di-fit ke model c·f(n, m) dengan
+f ∈ {n, n·m, n/m} (kuadrat terkecil tanpa intersep). Model dengan R² tertinggi
+adalah perilaku skala yang teramati.
+
+Jenis input:
+  "natural"     → teks kata-kata akademik acak; PATTERN = potongan teks dengan
+                  karakter terakhir diubah (tidak ditemukan → seluruh teks dipindai)
+  "adversarial" → TEXT = "a"·n dengan PATTERN kasus terburuk metode (Engine.adversarial):
+                  "a"·(m-1)+"b" (Naive/KMP/Z) atau "b"+"a"·(m-1) (Boyer–Moore)
+"""
+import random
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from string_matching import ENGINES, engine_names, new_op_stats
+
+SCALING_METHODS = engine_names("scaling")
+SCALING_KINDS = ("natural", "adversarial")
+DEFAULT_SIZES_N = (500, 1000, 2000, 4000, 8000)
+DEFAULT_SIZES_M = (4, 16, 64)
+MAX_SCALING_N = 50_000
+MAX_SCALING_POINTS = 40
+
+MODELS: Dict[str, Callable[[int, int], float]] = {
+    "n": lambda n, m: float(n),
+    "nm": lambda n, m: float(n * m),
+    "n/m": lambda n, m: n / m,
+}
+
+_WORDS = ("penelitian ini menggunakan metode knuth morris pratt untuk pencocokan string "
+          "hasil menunjukkan peningkatan akurasi secara signifikan pada data uji").split()
+
+
+def make_input(kind: str, method: str, n: int, m: int, seed: int = 1) -> Tuple[str, str]:
+    """(text, pattern) ukuran n dan m untuk jenis input kind."""
+    if kind == "adversarial":
+        return "a" * n, ENGINES[method].adversarial(m)
+    rnd = random.Random(seed)
+    parts: List[str] = []
+    size = 0
+    while size < n:
+        w = rnd.choice(_WORDS)
+        parts.append(w)
+        size += len(w) + 1
+    text = " ".join(parts)[:n]
+    start = rnd.randrange(0, n - m + 1)
+    pattern = text[start:start + m - 1] + "#"   # "#" tidak pernah ada di text
+    return text, pattern
+
+
+def fit_models(points: List[Dict[str, Any]], key: str) -> Dict[str, Dict[str, float]]:
+    """Fit y = c·f(n, m) untuk tiap model → {model: {"coef", "r2"}}."""
+    ys = [p[key] for p in points]
+    mean_y = sum(ys) / len(ys) if ys else 0.0
+    ss_tot = sum((y - mean_y) ** 2 for y in ys)
+    fits: Dict[str, Dict[str, float]] = {}
+    for name, f in MODELS.items():
+        xs = [f(p["n"], p["m"]) for p in points]
+        sxx = sum(x * x for x in xs)
+        coef = sum(x * y for x, y in zip(xs, ys)) / sxx if sxx else 0.0
+        ss_res = sum((y - coef * x) ** 2 for x, y in zip(xs, ys))
+        r2 = 1.0 - ss_res / ss_tot if ss_tot else (1.0 if ss_res == 0 else 0.0)
+        fits[name] = {"coef": coef, "r2": round(r2, 4)}
+    return fits
+
+
+def best_model(fits: Dict[str, Dict[str, float]]) -> str:
+    return max(fits, key=lambda name: fits[name]["r2"])
+
+
+def estimate_scaling_work(method: str, kind: str, sizes_n: List[int], sizes_m: List[int],
+                          repeat: int) -> int:
+    """Perkiraan perbandingan karakter seluruh deret (Engine.work, kasus terburuk)."""
+    per_point = ENGINES[method].work
+    # pengukuran waktu memakai engine fast (repeat kali) + satu kali engine count
+    return sum(per_point(n, m) * (repeat + 1) for n in sizes_n for m in sizes_m if m <= n)
+
+
+def run_scaling(method: str, kind: str, sizes_n: List[int], sizes_m: List[int],
+                repeat: int = 3, deadline: float = float("inf")) -> Dict[str, Any]:
+    """
+    Jalankan deret pengukuran. Waktu = minimum dari `repeat` kali engine fast,
+    counter operasi dari engine count. Titik dengan m > n dilewati; jika deadline
+    (perf_counter) habis, hasil sejauh ini dikembalikan dengan complete = False.
+    """
+    engine = ENGINES[method]
+    points: List[Dict[str, Any]] = []
+    complete = True
+    for m in sizes_m:
+        for n in sizes_n:
+            if m > n:
+                continue
+            if time.perf_counter() >= deadline:
+                complete = False
+                break
+            text, pattern = make_input(kind, method, n, m)
+            best = float("inf")
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                engine.fast(text, pattern)
+                best = min(best, time.perf_counter() - t0)
+            stats = new_op_stats()
+            engine.count(text, pattern, stats, None)
+            points.append({"n": n, "m": m, "time_ms": round(best * 1000, 4),
+                           "comparisons": stats["comparisons"], "shifts": stats["shifts"],
+                           "build_ops": stats["build_ops"]})
+        if not complete:
+            break
+
+    fits = {key: fit_models(points, key) for key in ("comparisons", "time_ms")} if points else {}
+    return {
+        "method": method,
+        "kind": kind,
+        "complete": complete,
+        "points": points,
+        "fits": fits,
+        "best": {key: best_model(f) for key, f in fits.items()},
+    }
@@ -0,0 +1,255 @@
+"""
+Corpus referensi biner yang dibuka dengan mmap (zero-copy, tanpa Flask).
+
+Format file (little-endian, tiap seksi rata 8 byte):
+  header   : magic, mode folding, n, lalu offset/panjang tiap seksi
+  norm     : kalimat hasil normalisasi (ASCII) digabung dengan pemisah b"\\n"
+  norm_idx : array Q[n+1]  → norm[i] = norm[norm_idx[i] : norm_idx[i+1]-1]
+  orig     : kalimat asli (UTF-8) digabung
+  orig_idx : array Q[n+1]  → byte offset kalimat asli
+  maps     : array I       → normalize_with_map per kalimat, digabung;
+             map kalimat i mulai di norm_idx[i] - i (pemisah tidak punya map)
+
+Membuka file hanya memetakan header + memoryview.cast → O(1), dan worker
+hasil fork berbagi page cache yang sama. Index awalan untuk arah "kalimat
+corpus ⊂ query" dibangun sekali saat check pertama (per proses).
+
+Contoh:
+  python corpus_store.py build sumber/*.txt -o referensi.smc
+  python corpus_store.py check referensi.smc "kalimat yang dicek"
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+
+from string_matching import NORMALIZE_FOLD, normalize_with_map, highlight_span
+
+MAGIC = b"SMCORP\x00\x01"
+_HEADER = struct.Struct("<8s8sQQQQQQQQ")
+_SEP = b"\n"
+PREFIX_KEY_LEN = 16  # panjang kunci index awalan (kalimat lebih pendek memakai seluruh teksnya)
+
+
+class CorpusFormatError(ValueError):
+    pass
+
+
+def _pad8(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def write_corpus(path: str, sentences: List[str], fold: str = NORMALIZE_FOLD) -> int:
+    """Tulis corpus ke path (atomik lewat file sementara). Return jumlah kalimat."""
+    if fold == "unicode":
+        raise ValueError("Corpus mmap memerlukan hasil normalisasi ASCII (fold 'ascii' atau 'nfkd').")
+
+    norm_parts: List[bytes] = []
+    orig_parts: List[bytes] = []
+    norm_idx = array("Q", [0])
+    orig_idx = array("Q", [0])
+    maps = array("I")
+    for s in sentences:
+        norm, omap = normalize_with_map(s, fold)
+        nb = norm.encode("ascii") + _SEP
+        ob = s.encode("utf-8")
+        norm_parts.append(nb)
+        orig_parts.append(ob)
+        norm_idx.append(norm_idx[-1] + len(nb))
+        orig_idx.append(orig_idx[-1] + len(ob))
+        maps.extend(omap)
+    norm_buf = b"".join(norm_parts)
+    orig_buf = b"".join(orig_parts)
+
+    sections = [norm_buf, norm_idx.tobytes(), orig_buf, orig_idx.tobytes(), maps.tobytes()]
+    offsets = []
+    pos = _HEADER.size
+    for sec in sections:
+        pos = _pad8(pos)
+        offsets.append(pos)
+        pos += len(sec)
+
+    header = _HEADER.pack(MAGIC, fold.encode("ascii"), len(sentences),
+                          offsets[0], len(norm_buf), offsets[1], offsets[2], len(orig_buf),
+                          offsets[3], offsets[4])
+    tmp = f"{path}.tmp{os.getpid()}"
+    with open(tmp, "wb") as fh:
+        fh.write(header)
+        for off, sec in zip(offsets, sections):
+            fh.write(b"\0" * (off - fh.tell()))
+            fh.write(sec)
+    os.replace(tmp, path)
+    return len(sentences)
+
+
+class CorpusStore:
+    """Corpus read-only di atas mmap; semua akses berupa slice memoryview."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mm) < _HEADER.size:
+            raise CorpusFormatError(f"File corpus terlalu pendek: {path}")
+        (magic, fold, n, norm_off, norm_len, normidx_off, orig_off, orig_len,
+         origidx_off, map_off) = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            raise CorpusFormatError(f"Bukan file corpus (magic salah): {path}")
+
+        mv = memoryview(self._mm)
+        self.fold = fold.rstrip(b"\0").decode("ascii")
+        self.n = n
+        self._norm_start = norm_off
+        self._norm_end = norm_off + norm_len
+        self.norm_idx = mv[normidx_off:normidx_off + 8 * (n + 1)].cast("Q")
+        self.orig_idx = mv[origidx_off:origidx_off + 8 * (n + 1)].cast("Q")
+        self._orig = mv[orig_off:orig_off + orig_len]
+        self._norm = mv[norm_off:norm_off + norm_len]
+        n_map = norm_len - n
+        self.maps = mv[map_off:map_off + 4 * n_map].cast("I")
+        self._prefix_index = None
+        self._prefix_lock = threading.Lock()
+
+    def close(self) -> None:
+        for attr in ("maps", "norm_idx", "orig_idx", "_orig", "_norm"):
+            getattr(self, attr).release()
+        self._mm.close()
+
+    def __len__(self) -> int:
+        return self.n
+
+    @property
+    def norm_size(self) -> int:
+        """Ukuran buffer normalisasi (byte) = jumlah byte yang dipindai satu pencarian penuh."""
+        return self._norm_end - self._norm_start
+
+    def norm(self, i: int) -> memoryview:
+        return self._norm[self.norm_idx[i]:self.norm_idx[i + 1] - 1]
+
+    def original(self, i: int) -> str:
+        return str(self._orig[self.orig_idx[i]:self.orig_idx[i + 1]], "utf-8")
+
+    def offset_map(self, i: int) -> memoryview:
+        start = self.norm_idx[i] - i
+        return self.maps[start:start + (self.norm_idx[i + 1] - 1 - self.norm_idx[i])]
+
+    def find(self, pattern_norm: bytes) -> Dict[int, int]:
+        """
+        Semua kalimat corpus yang memuat pattern_norm → {id: indeks pertama}.
+        Dicari langsung di mmap (C-level); setelah ketemu lompat ke kalimat berikutnya.
+        """
+        hits: Dict[int, int] = {}
+        if not pattern_norm:
+            return hits
+        pos = self._mm.find(pattern_norm, self._norm_start, self._norm_end)
+        while pos != -1:
+            rel = pos - self._norm_start
+            i = bisect_right(self.norm_idx, rel) - 1
+            hits[i] = rel - self.norm_idx[i]
+            pos = self._mm.find(pattern_norm, self._norm_start + self.norm_idx[i + 1], self._norm_end)
+        return hits
+
+    def _prefixes(self) -> Tuple[Dict[bytes, List[int]], List[int]]:
+        """
+        {PREFIX_KEY_LEN byte pertama (atau seluruh kalimat jika lebih pendek): [id]}
+        + daftar panjang kunci yang ada; dibangun sekali (O(n)) lalu dipakai ulang.
+        """
+        if self._prefix_index is None:
+            with self._prefix_lock:
+                if self._prefix_index is None:
+                    buckets: Dict[bytes, List[int]] = {}
+                    for i in range(self.n):
+                        key = bytes(self.norm(i)[:PREFIX_KEY_LEN])
+                        if key:
+                            buckets.setdefault(key, []).append(i)
+                    self._prefix_index = (buckets, sorted({len(k) for k in buckets}))
+        return self._prefix_index
+
+    def contained_in(self, pat: bytes) -> Dict[int, int]:
+        """
+        Semua kalimat corpus (tidak kosong) yang merupakan substring pat → {id: indeks pertama di pat}.
+        Tiap posisi pat dicocokkan ke index awalan; hanya kandidat satu bucket yang diverifikasi,
+        tidak setiap kalimat corpus.
+        """
+        hits: Dict[int, int] = {}
+        buckets, key_lens = self._prefixes()
+        for pos in range(len(pat)):
+            for k in key_lens:
+                if pos + k > len(pat):
+                    break
+                for i in buckets.get(pat[pos:pos + k], ()):
+                    if i not in hits and (k < PREFIX_KEY_LEN or pat.startswith(self.norm(i), pos)):
+                        hits[i] = pos
+        return hits
+
+    def check(self, sentence: str) -> List[Dict[str, Any]]:
+        """
+        Pasangan duplikat antara sentence dan corpus (aturan substring):
+        container "corpus" = sentence ⊂ kalimat corpus, "query" = kalimat corpus ⊂ sentence.
+        """
+        norm, omap = normalize_with_map(sentence, self.fold)
+        if not norm:
+            return []
+        pat = norm.encode("ascii")
+        found = {i: ("corpus", idx) for i, idx in self.find(pat).items()}
+        for i, idx in self.contained_in(pat).items():
+            found.setdefault(i, ("query", idx))
+
+        out = []
+        for i in sorted(found):
+            container, idx = found[i]
+            original = self.original(i)
+            if container == "corpus":
+                cmap, m = self.offset_map(i), len(pat)
+                corpus_hl = highlight_span(original, cmap[idx], cmap[idx + m - 1] + 1)
+                query_hl = highlight_span(sentence, omap[0], omap[-1] + 1)
+            else:
+                m = self.norm_idx[i + 1] - 1 - self.norm_idx[i]
+                cmap = self.offset_map(i)
+                corpus_hl = highlight_span(original, cmap[0], cmap[-1] + 1)
+                query_hl = highlight_span(sentence, omap[idx], omap[idx + m - 1] + 1)
+            out.append({"corpus_id": i, "container": container, "idx": idx,
+                        "corpus": original, "corpus_hl": corpus_hl, "query_hl": query_hl})
+        return out
+
+
+def open_corpus(path: Optional[str]) -> Optional[CorpusStore]:
+    return CorpusStore(path) if path else None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Bangun / cek corpus referensi mmap.")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    b = sub.add_parser("build", help="bangun corpus dari file teks (1 baris = 1 kalimat)")
+    b.add_argument("files", nargs="+")
+    b.add_argument("-o", "--output", required=True)
+    b.add_argument("--fold", choices=("ascii", "nfkd"), default=NORMALIZE_FOLD)
+    c = sub.add_parser("check", help="cek kalimat terhadap corpus (output JSONL)")
+    c.add_argument("corpus")
+    c.add_argument("sentences", nargs="+")
+    args = p.parse_args(argv)
+
+    if args.cmd == "build":
+        sentences = []
+        for f in args.files:
+            with open(f, encoding="utf-8", errors="replace") as fh:
+                sentences.extend(s.strip() for s in fh if s.strip())
+        n = write_corpus(args.output, sentences, args.fold)
+        print(f"{n} kalimat → {args.output}", file=sys.stderr)
+        return 0
+
+    store = CorpusStore(args.corpus)
+    for s in args.sentences:
+        for hit in store.check(s):
+            print(json.dumps({"query": s, **hit}, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
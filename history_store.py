@@ -0,0 +1,208 @@
+"""
+Riwayat pemeriksaan + penyimpanan hasil pasangan di SQLite (tanpa Flask).
+
+Tabel:
+  runs         : satu baris per run /api/check (parameter + ringkasan agregat)
+  pair_results : hasil per pasangan, dikunci hash SHA-1 kalimat hasil normalisasi
+                 (hash_a, hash_b) + parameter (method, unit, rule, threshold, top_k);
+                 threshold/top_k NULL untuk aturan substring
+
+Pasangan yang sama (hash normalisasi + parameter sama) diambil dari store
+alih-alih dihitung ulang. Karena highlight bergantung pada teks asli, hasil
+hanya dipakai ulang bila teks aslinya juga identik (orig_key).
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from string_matching import normalize
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id              INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at      TEXT NOT NULL,
+    method          TEXT NOT NULL,
+    mode            TEXT NOT NULL,
+    unit            TEXT NOT NULL,
+    rule            TEXT NOT NULL,
+    threshold       REAL,
+    top_k           INTEGER,
+    n               INTEGER NOT NULL,
+    sentences_hash  TEXT,
+    total_pairs     INTEGER NOT NULL,
+    processed_pairs INTEGER NOT NULL DEFAULT 0,
+    cached_pairs    INTEGER NOT NULL DEFAULT 0,
+    dup_count       INTEGER NOT NULL DEFAULT 0,
+    total_time_ms   REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS pair_results (
+    run_id        INTEGER NOT NULL REFERENCES runs(id),
+    ord           INTEGER NOT NULL,
+    hash_a        TEXT NOT NULL,
+    hash_b        TEXT NOT NULL,
+    orig_key      TEXT NOT NULL,
+    method        TEXT NOT NULL,
+    unit          TEXT NOT NULL,
+    rule          TEXT NOT NULL,
+    threshold     REAL,
+    top_k         INTEGER,
+    status        TEXT NOT NULL,
+    idx           INTEGER NOT NULL,
+    comparisons   INTEGER NOT NULL,
+    time_ms       REAL NOT NULL,
+    overlap_ratio REAL,
+    row_json      TEXT NOT NULL,
+    PRIMARY KEY (run_id, ord)
+);
+CREATE INDEX IF NOT EXISTS pair_results_hash_a ON pair_results (hash_a);
+CREATE INDEX IF NOT EXISTS pair_results_hash_b ON pair_results (hash_b);
+CREATE INDEX IF NOT EXISTS pair_results_lookup ON pair_results (hash_a, hash_b, method, unit, rule, threshold);
+CREATE INDEX IF NOT EXISTS runs_method ON runs (method, created_at);
+"""
+
+# kolom runs yang ditambahkan setelah skema awal (DB lama dimigrasi saat dibuka)
+_RUN_COLUMNS = {"top_k": "INTEGER", "sentences_hash": "TEXT"}
+
+# kolom row /api/check yang disimpan (tanpa trace/explain yang besar)
+_ROW_FIELDS = ("a", "b", "a_hl", "b_hl", "status", "idx", "time_ms", "comparisons", "methods", "overlap_ratio")
+
+
+def sentence_hash(sentence: str) -> str:
+    """SHA-1 dari kalimat hasil normalisasi (kunci store)."""
+    return hashlib.sha1(normalize(sentence).encode("utf-8")).hexdigest()
+
+
+# hash kalimat yang kosong setelah normalisasi: pasangannya dulu tersimpan sebagai DUPLIKAT
+# (PATTERN kosong), sekarang dilewati run_one_pair → tidak diambil dari store, selalu dihitung ulang (murah)
+_EMPTY_HASH = hashlib.sha1(b"").hexdigest()
+
+
+def sentences_digest(sentences: List[str]) -> str:
+    """SHA-1 dari daftar kalimat (urut) satu run; halaman lanjutan harus memakai daftar yang sama."""
+    return hashlib.sha1("\x00".join(sentences).encode("utf-8")).hexdigest()
+
+
+def _orig_key(a: str, b: str) -> str:
+    return hashlib.sha1(f"{a}\x00{b}".encode("utf-8")).hexdigest()
+
+
+class HistoryStore:
+    """Satu koneksi SQLite (WAL) dipakai bersama thread Flask, diserialkan dengan lock."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        with self._lock:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.executescript(_SCHEMA)
+            have = {r["name"] for r in self._db.execute("PRAGMA table_info(runs)")}
+            for col, kind in _RUN_COLUMNS.items():
+                if col not in have:
+                    self._db.execute(f"ALTER TABLE runs ADD COLUMN {col} {kind}")
+            self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def start_run(self, method: str, mode: str, unit: str, rule: str, threshold: Optional[float],
+                  top_k: Optional[int], n: int, total_pairs: int, sentences_hash: str) -> int:
+        with self._lock:
+            cur = self._db.execute(
+                "INSERT INTO runs (created_at, method, mode, unit, rule, threshold, top_k, n, total_pairs, "
+                "sentences_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (datetime.now(timezone.utc).isoformat(timespec="seconds"), method, mode, unit, rule,
+                 threshold, top_k, n, total_pairs, sentences_hash))
+            self._db.commit()
+            return cur.lastrowid
+
+    def run_exists(self, run_id: int) -> bool:
+        with self._lock:
+            return self._db.execute("SELECT 1 FROM runs WHERE id = ?", (run_id,)).fetchone() is not None
+
+    def run_matches(self, run_id: int, method: str, unit: str, rule: str, threshold: Optional[float],
+                    top_k: Optional[int], n: int, sentences_hash: str) -> bool:
+        """Run ada dan parameternya + daftar kalimatnya sama (halaman lanjutan boleh ditambahkan)."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT 1 FROM runs WHERE id = ? AND method = ? AND unit = ? AND rule = ? AND threshold IS ? "
+                "AND top_k IS ? AND n = ? AND sentences_hash = ?",
+                (run_id, method, unit, rule, threshold, top_k, n, sentences_hash)).fetchone()
+        return row is not None
+
+    def lookup(self, hash_a: str, hash_b: str, a: str, b: str, method: str, unit: str, rule: str,
+               threshold: Optional[float], top_k: Optional[int]) -> Optional[Dict[str, Any]]:
+        """Hasil tersimpan untuk pasangan yang sama (None jika belum pernah dihitung)."""
+        if _EMPTY_HASH in (hash_a, hash_b):
+            return None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT row_json FROM pair_results WHERE hash_a = ? AND hash_b = ? AND method = ? AND unit = ? "
+                "AND rule = ? AND threshold IS ? AND top_k IS ? AND orig_key = ? LIMIT 1",
+                (hash_a, hash_b, method, unit, rule, threshold, top_k, _orig_key(a, b))).fetchone()
+        return json.loads(row["row_json"]) if row else None
+
+    def add_results(self, run_id: int, hashes: List[str], rows: List[Dict[str, Any]], method: str, unit: str,
+                    rule: str, threshold: Optional[float], top_k: Optional[int], cached: int,
+                    time_ms: float) -> None:
+        """Simpan satu halaman hasil (rows berisi ord, i1, i2; termasuk yang dari store) dan perbarui agregat run."""
+        records = []
+        for r in rows:
+            ha, hb = hashes[r["i1"] - 1], hashes[r["i2"] - 1]
+            records.append((run_id, r["ord"], ha, hb, _orig_key(r["a"], r["b"]), method, unit, rule, threshold,
+                            top_k, r["status"], r["idx"], r["comparisons"], r["time_ms"], r["overlap_ratio"],
+                            json.dumps({k: r.get(k) for k in _ROW_FIELDS}, ensure_ascii=False)))
+        dup = sum(1 for r in rows if r["idx"] >= 0)
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO pair_results (run_id, ord, hash_a, hash_b, orig_key, method, unit, rule, "
+                "threshold, top_k, status, idx, comparisons, time_ms, overlap_ratio, row_json) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", records)
+            self._db.execute(
+                "UPDATE runs SET processed_pairs = processed_pairs + ?, cached_pairs = cached_pairs + ?, "
+                "dup_count = dup_count + ?, total_time_ms = total_time_ms + ? WHERE id = ?",
+                (len(rows), cached, dup, round(time_ms, 3), run_id))
+            self._db.commit()
+
+    def list_runs(self, offset: int, limit: int, method: Optional[str] = None) -> Dict[str, Any]:
+        where, args = ("WHERE method = ?", [method]) if method else ("", [])
+        with self._lock:
+            total = self._db.execute(f"SELECT COUNT(*) FROM runs {where}", args).fetchone()[0]
+            rows = self._db.execute(f"SELECT * FROM runs {where} ORDER BY id DESC LIMIT ? OFFSET ?",
+                                    args + [limit, offset]).fetchall()
+        return {"total": total, "runs": [dict(r) for r in rows]}
+
+    def run_results(self, run_id: int, offset: int, limit: int) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            run = self._db.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+            if run is None:
+                return None
+            rows = self._db.execute(
+                "SELECT ord, hash_a, hash_b, row_json FROM pair_results WHERE run_id = ? ORDER BY ord "
+                "LIMIT ? OFFSET ?", (run_id, limit, offset)).fetchall()
+        results = [{"ord": r["ord"], "hash_a": r["hash_a"], "hash_b": r["hash_b"], **json.loads(r["row_json"])}
+                   for r in rows]
+        return {"run": dict(run), "results": results}
+
+    def sentence_history(self, sentence: str, offset: int, limit: int) -> Dict[str, Any]:
+        """Semua hasil tersimpan yang melibatkan kalimat ini (hash normalisasi), terbaru dulu."""
+        h = sentence_hash(sentence)
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT run_id, ord, method, unit, rule, status, idx, row_json FROM pair_results "
+                "WHERE hash_a = ? UNION ALL "
+                "SELECT run_id, ord, method, unit, rule, status, idx, row_json FROM pair_results "
+                "WHERE hash_b = ? ORDER BY run_id DESC, ord LIMIT ? OFFSET ?", (h, h, limit, offset)).fetchall()
+        return {"hash": h, "results": [{"run_id": r["run_id"], "ord": r["ord"], "method": r["method"],
+                                        "unit": r["unit"], "rule": r["rule"], **json.loads(r["row_json"])}
+                                       for r in rows]}
+
+
+def open_history(path: Optional[str]) -> Optional[HistoryStore]:
+    return HistoryStore(path) if path else None
@@ -0,0 +1,235 @@
+"""
+Load test lokal untuk HTTP API (/api/check) — hanya stdlib.
+
+Payload realistis (jumlah & panjang kalimat, metode, mode, unit bervariasi,
+deterministik dari --seed) dikirim oleh --concurrency worker selama --duration
+detik. Laporan: throughput, latensi p50/p95/p99, error rate, jumlah 429
+(backpressure) dan RSS server (dibaca dari /proc/<pid>/status).
+
+Contoh:
+  python loadtest.py --spawn --concurrency 8 --duration 30 --save baseline.json
+  python loadtest.py --spawn --concurrency 8 --duration 30 --compare baseline.json
+  python loadtest.py --url http://127.0.0.1:5000 --server-pid 1234
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Any, Dict, List, Optional
+
+APP_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "KELOMPOK 1 PROJECT 9.py")
+RSS_SAMPLE_S = 0.25
+
+_WORDS = ("penelitian ini menggunakan metode knuth morris pratt untuk pencocokan string "
+          "hasil menunjukkan peningkatan akurasi secara signifikan pada data uji "
+          "analisis algoritma kompleksitas waktu teks pola pergeseran tabel").split()
+
+# (bobot, field payload) — campuran kira-kira seperti pemakaian UI
+METHOD_MIX = [(30, "kmp"), (20, "naive"), (20, "bm"), (20, "builtin"), (10, "all")]
+MODE_MIX = [(85, "fast"), (15, "trace")]
+UNIT_MIX = [(80, "char"), (20, "word")]
+RULE_MIX = [(85, "substring"), (15, "overlap")]
+
+
+def _pick(rnd: random.Random, mix: List[Any]) -> Any:
+    return rnd.choices([v for _, v in mix], weights=[w for w, _ in mix])[0]
+
+
+def _sentence(rnd: random.Random, n_words: int) -> str:
+    s = " ".join(rnd.choice(_WORDS) for _ in range(n_words))
+    return s.capitalize() + rnd.choice([".", ".", ",", "!", ""])
+
+
+def make_payload(rnd: random.Random) -> Dict[str, Any]:
+    """Satu payload /api/check; sebagian kalimat diambil dari kalimat lain (duplikat nyata)."""
+    n = rnd.choice([2, 4, 8, 12, 20, 30])
+    sents: List[str] = []
+    for _ in range(n):
+        if sents and rnd.random() < 0.3:
+            words = rnd.choice(sents).split()
+            a = rnd.randrange(len(words))
+            sents.append(" ".join(words[a:a + rnd.randint(2, 8)]))
+        else:
+            sents.append(_sentence(rnd, rnd.randint(6, 60)))
+    return {"sentences": sents, "method": _pick(rnd, METHOD_MIX), "mode": _pick(rnd, MODE_MIX),
+            "unit": _pick(rnd, UNIT_MIX), "rule": _pick(rnd, RULE_MIX), "detail": False}
+
+
+def read_rss_kb(pid: int) -> Optional[int]:
+    try:
+        with open(f"/proc/{pid}/status") as fh:
+            for line in fh:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def percentile(sorted_vals: List[float], q: float) -> float:
+    if not sorted_vals:
+        return 0.0
+    k = (len(sorted_vals) - 1) * q
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_vals) - 1)
+    return sorted_vals[lo] + (sorted_vals[hi] - sorted_vals[lo]) * (k - lo)
+
+
+def spawn_server(port: int) -> subprocess.Popen:
+    """Jalankan app tanpa debug/reloader (satu proses → pid = server sebenarnya)."""
+    code = ("import importlib.util, sys; "
+            f"spec = importlib.util.spec_from_file_location('app', {APP_FILE!r}); "
+            "mod = importlib.util.module_from_spec(spec); spec.loader.exec_module(mod); "
+            f"mod.app.run(host='127.0.0.1', port={port}, debug=False, threaded=True)")
+    # cwd = folder app → import string_matching dkk. berhasil dari mana pun loadtest dijalankan;
+    # log request werkzeug dibuang agar tidak memengaruhi pengukuran
+    proc = subprocess.Popen([sys.executable, "-c", code], cwd=os.path.dirname(APP_FILE),
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    url = f"http://127.0.0.1:{port}/"
+    for _ in range(100):
+        try:
+            urllib.request.urlopen(url, timeout=1).close()
+            return proc
+        except (urllib.error.URLError, ConnectionError):
+            if proc.poll() is not None:
+                raise RuntimeError(f"Server gagal dijalankan (exit {proc.returncode}).") from None
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("Server tidak merespons.")
+
+
+def run_load(url: str, concurrency: int, duration: float, seed: int,
+             server_pid: Optional[int]) -> Dict[str, Any]:
+    endpoint = url.rstrip("/") + "/api/check"
+    stop_at = time.perf_counter() + duration
+    lock = threading.Lock()
+    latencies: List[float] = []
+    counts = {"ok": 0, "rejected_429": 0, "client_4xx": 0, "server_5xx": 0, "exceptions": 0}
+    rss: List[int] = []
+
+    def worker(k: int) -> None:
+        rnd = random.Random(seed * 1000 + k)
+        while time.perf_counter() < stop_at:
+            body = json.dumps(make_payload(rnd)).encode("utf-8")
+            req = urllib.request.Request(endpoint, data=body, headers={"Content-Type": "application/json"})
+            t0 = time.perf_counter()
+            try:
+                with urllib.request.urlopen(req, timeout=60) as resp:
+                    resp.read()
+                key = "ok"
+            except urllib.error.HTTPError as e:
+                e.read()
+                key = "rejected_429" if e.code == 429 else ("client_4xx" if e.code < 500 else "server_5xx")
+            except (urllib.error.URLError, OSError):
+                key = "exceptions"
+            dt = (time.perf_counter() - t0) * 1000
+            with lock:
+                counts[key] += 1
+                if key == "ok":
+                    latencies.append(dt)
+
+    def sampler() -> None:
+        while time.perf_counter() < stop_at:
+            kb = read_rss_kb(server_pid)
+            if kb is not None:
+                rss.append(kb)
+            time.sleep(RSS_SAMPLE_S)
+
+    threads = [threading.Thread(target=worker, args=(k,), daemon=True) for k in range(concurrency)]
+    if server_pid is not None:
+        threads.append(threading.Thread(target=sampler, daemon=True))
+    t_start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - t_start
+
+    latencies.sort()
+    total = sum(counts.values())
+    errors = counts["client_4xx"] + counts["server_5xx"] + counts["exceptions"]
+    return {
+        "config": {"url": url, "concurrency": concurrency, "duration_s": duration, "seed": seed},
+        "requests": total,
+        **counts,
+        "error_rate": round(errors / total, 4) if total else 0.0,
+        "throughput_rps": round(counts["ok"] / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+            "p50": round(percentile(latencies, 0.50), 2),
+            "p95": round(percentile(latencies, 0.95), 2),
+            "p99": round(percentile(latencies, 0.99), 2),
+            "max": round(latencies[-1], 2) if latencies else 0.0,
+        },
+        "rss_kb": {"start": rss[0], "peak": max(rss), "end": rss[-1]} if rss else None,
+    }
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Daftar regresi (kosong = lolos) terhadap baseline tersimpan."""
+    regressions = []
+    checks = [
+        ("throughput_rps", report["throughput_rps"], baseline["throughput_rps"], False),
+        ("latency p95", report["latency_ms"]["p95"], baseline["latency_ms"]["p95"], True),
+        ("latency p99", report["latency_ms"]["p99"], baseline["latency_ms"]["p99"], True),
+    ]
+    if report["rss_kb"] and baseline.get("rss_kb"):
+        checks.append(("rss peak", report["rss_kb"]["peak"], baseline["rss_kb"]["peak"], True))
+    for name, cur, base, higher_is_worse in checks:
+        change = (cur - base) / base if base else 0.0
+        print(f"  {name:<16} {base:>12} → {cur:>12} ({change:+.1%})", file=sys.stderr)
+        if (change > tolerance) if higher_is_worse else (change < -tolerance):
+            regressions.append(f"{name}: {base} → {cur} ({change:+.1%})")
+    if report["error_rate"] > baseline["error_rate"] + 0.01:
+        regressions.append(f"error_rate: {baseline['error_rate']} → {report['error_rate']}")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Load test lokal untuk /api/check.")
+    p.add_argument("--url", default="http://127.0.0.1:5000")
+    p.add_argument("--spawn", action="store_true", help="jalankan app sendiri (port dari --port)")
+    p.add_argument("--port", type=int, default=5077)
+    p.add_argument("--server-pid", type=int, help="pid server untuk membaca RSS (otomatis dengan --spawn)")
+    p.add_argument("--concurrency", type=int, default=8)
+    p.add_argument("--duration", type=float, default=20.0, help="detik")
+    p.add_argument("--seed", type=int, default=1)
+    p.add_argument("--save", help="simpan laporan sebagai baseline JSON")
+    p.add_argument("--compare", help="bandingkan dengan baseline JSON (exit 1 jika regresi)")
+    p.add_argument("--tolerance", type=float, default=0.2, help="batas regresi relatif (default 20%%)")
+    args = p.parse_args(argv)
+
+    proc = None
+    url, pid = args.url, args.server_pid
+    if args.spawn:
+        proc = spawn_server(args.port)
+        url, pid = f"http://127.0.0.1:{args.port}", proc.pid
+    try:
+        report = run_load(url, args.concurrency, args.duration, args.seed, pid)
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+    print(json.dumps(report, indent=2))
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        regressions = compare(report, baseline, args.tolerance)
+        for r in regressions:
+            print(f"REGRESI {r}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+"""
+Pencarian satu PATTERN di satu TEXT yang sangat panjang (bab / dokumen utuh)
+secara paralel (tanpa Flask).
+
+TEXT hasil normalisasi dibagi menjadi chunk yang saling tumpang tindih m-1
+karakter: chunk k hanya bertanggung jawab atas posisi awal
+[start, start + chunk_size), sehingga setiap kemunculan ditemukan tepat satu
+kali dan tidak ada yang terpotong di batas chunk.
+  - engine Python      → process pool (terikat GIL), chunk disalin ke worker; tabel
+                         PATTERN dibangun sekali per chunk lalu semua kemunculan dipindai
+                         dengan engine.scan (offset awal, tanpa slice ulang per hit)
+  - builtin            → TIDAK paralel: satu pemindaian str.find di proses pemanggil.
+                         str.find tidak melepas GIL (thread tidak membantu) dan menyalin
+                         chunk ke process pool lebih mahal daripada pencarian C itu sendiri.
+
+Offset hasil dipetakan kembali ke teks asli lewat normalize_with_map.
+
+Contoh:
+  python parallel_search.py bab2.txt "kalimat yang dicari" --method kmp --all --workers 4
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from string_matching import ENGINES, engine_names, normalize, normalize_with_map
+
+PARALLEL_CHUNK_CHARS = 64 * 1024   # posisi awal per chunk
+MAX_OCCURRENCES = 10_000           # batas hasil mode --all
+
+PARALLEL_METHODS = tuple(name for name in engine_names("batch") if ENGINES[name].scan is not None)
+SEQUENTIAL_METHODS = ("builtin",)  # pencarian C: dijalankan sekali di proses pemanggil
+
+
+def chunk_bounds(n: int, m: int, chunk_size: int = PARALLEL_CHUNK_CHARS) -> List[Tuple[int, int]]:
+    """Rentang [start, end) tiap chunk; end = start + chunk_size + m - 1 (overlap m-1)."""
+    if chunk_size < 1:
+        raise ValueError("chunk_size harus ≥ 1.")
+    bounds = []
+    start = 0
+    while start <= n - m:
+        bounds.append((start, min(n, start + chunk_size + m - 1)))
+        start += chunk_size
+    return bounds
+
+
+def _find_in_range(method: str, text: str, pattern: str, lo: int, hi: int, find_all: bool) -> List[int]:
+    """Kemunculan pattern di text[lo:hi] (offset global), urut naik; tabel PATTERN dibangun sekali."""
+    engine = ENGINES[method]
+    table = engine.build(pattern) if engine.build is not None else None
+    out: List[int] = []
+    for pos in engine.scan(text, pattern, table, lo, hi):
+        out.append(pos)
+        if not find_all or len(out) >= MAX_OCCURRENCES:
+            break
+    return out
+
+
+def _search_chunk(args: Tuple[str, str, str, int, bool]) -> List[int]:
+    """Worker process: chunk sudah dipotong (offset lokal) → offset global = base + lokal."""
+    method, chunk, pattern, base, find_all = args
+    return [base + p for p in _find_in_range(method, chunk, pattern, 0, len(chunk), find_all)]
+
+
+def parallel_search(text: str, pattern: str, method: str = "builtin", find_all: bool = False,
+                    workers: Optional[int] = None, chunk_size: int = PARALLEL_CHUNK_CHARS,
+                    executor: Optional[Executor] = None) -> List[int]:
+    """
+    Posisi kemunculan pattern di text (keduanya sudah dinormalisasi): kemunculan
+    pertama saja ([] jika tidak ada) atau semua (find_all, maks MAX_OCCURRENCES).
+    executor (opsional) dipakai ulang antar panggilan; jika None dibuat sesuai metode.
+    """
+    if method not in PARALLEL_METHODS:
+        raise ValueError(f"Metode harus salah satu dari {', '.join(PARALLEL_METHODS)}.")
+    n, m = len(text), len(pattern)
+    if m == 0:
+        return [0]
+    bounds = chunk_bounds(n, m, chunk_size)
+    if len(bounds) <= 1 or workers == 1 or method in SEQUENTIAL_METHODS:
+        return _find_in_range(method, text, pattern, 0, n, find_all)
+
+    own = executor is None
+    if own:
+        executor = ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(bounds)))
+    try:
+        futures = [executor.submit(_search_chunk, (method, text[lo:hi], pattern, lo, find_all))
+                   for lo, hi in bounds]
+        out: List[int] = []
+        for k, fut in enumerate(futures):
+            hits = fut.result()
+            out.extend(hits)
+            if (hits and not find_all) or len(out) >= MAX_OCCURRENCES:
+                # chunk sebelumnya sudah selesai tanpa hit → ini kemunculan pertama global
+                for rest in futures[k + 1:]:
+                    rest.cancel()
+                break
+        return out[:MAX_OCCURRENCES] if find_all else out[:1]
+    finally:
+        if own:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def search_document(original: str, sentence: str, method: str = "builtin", find_all: bool = False,
+                    workers: Optional[int] = None, chunk_size: int = PARALLEL_CHUNK_CHARS,
+                    executor: Optional[Executor] = None) -> Dict[str, Any]:
+    """Cari kalimat di dokumen asli; hasil berisi offset norm dan rentang di teks asli."""
+    norm, omap = normalize_with_map(original)
+    pattern = normalize(sentence)
+    t0 = time.perf_counter()
+    hits = parallel_search(norm, pattern, method, find_all, workers, chunk_size, executor)
+    t_ms = (time.perf_counter() - t0) * 1000
+    m = len(pattern)
+    occurrences = []
+    for p in hits:
+        start, end = (omap[p], omap[p + m - 1] + 1) if m else (0, 0)
+        occurrences.append({"norm_idx": p, "start": start, "end": end, "text": original[start:end]})
+    chunks = len(chunk_bounds(len(norm), m, chunk_size)) if m else 0
+    if method in SEQUENTIAL_METHODS:
+        chunks = min(chunks, 1)  # satu pemindaian, tanpa chunk
+    return {"method": method, "n": len(norm), "m": m, "chunks": chunks, "time_ms": round(t_ms, 3),
+            "occurrences": occurrences}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Cari satu kalimat di dokumen panjang secara paralel.")
+    p.add_argument("file", help="dokumen teks (UTF-8)")
+    p.add_argument("sentence")
+    p.add_argument("--method", choices=PARALLEL_METHODS, default="builtin")
+    p.add_argument("--all", action="store_true", help="semua kemunculan (default: pertama saja)")
+    p.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    p.add_argument("--chunk-size", type=int, default=PARALLEL_CHUNK_CHARS, help="posisi awal per chunk")
+    args = p.parse_args(argv)
+    if args.chunk_size < 1:
+        print("Error: --chunk-size harus ≥ 1.", file=sys.stderr)
+        return 2
+
+    with open(args.file, encoding="utf-8", errors="replace") as fh:
+        text = fh.read()
+    out = search_document(text, args.sentence, args.method, args.all, args.workers, args.chunk_size)
+    print(json.dumps(out, ensure_ascii=False, indent=2))
+    return 0 if out["occurrences"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""
+Ekspor laporan hasil pasangan ke CSV / Parquet secara streaming (tanpa Flask).
+
+Pasangan (i < j) dibentuk lazily dari combinations, dijalankan satu per satu,
+lalu langsung ditulis: CSV per blok baris (generator str), Parquet per row group
+(generator bytes). Yang ditahan di memori hanya O(n) per kalimat (normalisasi,
+vocab, prefilter, tabel praproses) + satu blok baris, tidak pernah seluruh
+O(n²) hasil.
+
+Parquet memerlukan paket opsional pyarrow; tanpa paket itu hanya CSV yang tersedia.
+"""
+import csv
+import io
+from itertools import combinations
+from typing import Any, Dict, Iterator, List, Tuple
+
+from string_matching import (
+    OVERLAP_THRESHOLD, OVERLAP_TOP_K, PairPrefilter, encode_words, engine_names, normalize, run_one_pair,
+)
+
+try:
+    import pyarrow as pa  # opsional: format parquet
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+EXPORT_FORMATS = ("csv", "parquet")
+CSV_FLUSH_ROWS = 500              # baris per potongan CSV yang dikirim
+PARQUET_ROW_GROUP_ROWS = 10_000   # baris per row group Parquet
+# awalan sel yang dieksekusi spreadsheet sebagai formula (CSV injection)
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+# (nama kolom, tipe) — match_in/match_start/match_end = offset di teks ASLI
+# kalimat yang memuat kecocokan (kosong jika tidak duplikat)
+_BASE_COLUMNS: Tuple[Tuple[str, str], ...] = (
+    ("ord", "int"), ("i1", "int"), ("i2", "int"), ("a", "str"), ("b", "str"),
+    ("status", "str"), ("idx", "int"), ("match_in", "str"), ("match_start", "int"), ("match_end", "int"),
+    ("comparisons", "int"), ("time_ms", "float"), ("overlap_ratio", "float"), ("pruned", "str"),
+)
+
+
+def parquet_available() -> bool:
+    return pq is not None
+
+
+def export_columns(method: str, rule: str) -> List[Tuple[str, str]]:
+    """Kolom laporan; method="all" menambah comparisons + waktu per engine."""
+    cols = list(_BASE_COLUMNS)
+    if method == "all" and rule != "overlap":
+        for m in engine_names("compare"):
+            cols += [(f"{m}_idx", "int"), (f"{m}_comparisons", "int"), (f"{m}_time_ms", "float")]
+    return cols
+
+
+def iter_pair_rows(sentences: List[str], method: str, unit: str = "char", rule: str = "substring",
+                   threshold: float = OVERLAP_THRESHOLD, top_k: int = OVERLAP_TOP_K) -> Iterator[Dict[str, Any]]:
+    """Satu dict datar per pasangan (urut leksikografis i < j), dihitung saat diminta."""
+    vocab: Dict[str, int] = {}
+    norms = [normalize(s) for s in sentences]
+    if unit == "word":
+        for norm in norms:
+            encode_words(norm, vocab)
+    prefilter = None
+    if rule == "substring":
+        prefilter = PairPrefilter(unit)
+        for norm in norms:
+            prefilter.add(norm)
+    cache: Dict[Any, Any] = {}
+    per_method_cols = method == "all" and rule != "overlap"
+
+    for k, (i, j) in enumerate(combinations(range(len(sentences)), 2)):
+        a, b = sentences[i], sentences[j]
+        row: Dict[str, Any] = {"ord": k, "i1": i + 1, "i2": j + 1, "a": a, "b": b}
+        by = prefilter.reject(i, j) if prefilter is not None else None
+        if by is not None:
+            row.update(status="TIDAK DUPLIKAT", idx=-1, match_in=None, match_start=None, match_end=None,
+                       comparisons=0, time_ms=0.0, overlap_ratio=None, pruned=by)
+            if per_method_cols:
+                for m in engine_names("compare"):
+                    row.update({f"{m}_idx": -1, f"{m}_comparisons": 0, f"{m}_time_ms": 0.0})
+            yield row
+            continue
+        out = run_one_pair(method, a, b, False, unit, vocab, rule, threshold, top_k, cache)
+        info = out["match_info"] or {}
+        row.update(status=out["status"], idx=out["idx"], match_in=info.get("container"),
+                   match_start=info.get("start"), match_end=info.get("end"),
+                   comparisons=out["explain"]["comparisons"], time_ms=out["time_ms"],
+                   overlap_ratio=out["overlap_ratio"], pruned=None)
+        if per_method_cols:
+            for m, r in out["explain"]["methods"].items():
+                row.update({f"{m}_idx": r["idx"], f"{m}_comparisons": r["comparisons"],
+                            f"{m}_time_ms": r["time_ms"]})
+        yield row
+
+
+def _csv_cell(value: Any) -> Any:
+    """Teks yang diawali =, +, -, @ (atau tab/CR) diberi awalan ' agar tidak dijalankan sebagai formula."""
+    if value is None:
+        return ""
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def iter_csv(rows: Iterator[Dict[str, Any]], columns: List[Tuple[str, str]],
+             flush_rows: int = CSV_FLUSH_ROWS) -> Iterator[str]:
+    """Header lalu baris CSV, dikirim per flush_rows baris."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow([name for name, _ in columns])
+    pending = 0
+    for row in rows:
+        writer.writerow([_csv_cell(row.get(name)) for name, _ in columns])
+        pending += 1
+        if pending >= flush_rows:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+            pending = 0
+    yield buf.getvalue()
+
+
+class _DrainSink(io.RawIOBase):
+    """
+    Sink tulis-saja untuk ParquetWriter: byte ditampung sampai diambil (drain),
+    tetapi tell() tetap posisi absolut karena footer Parquet menyimpan offset row group.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._pos = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._pos += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def drain(self) -> bytes:
+        out = b"".join(self._chunks)
+        self._chunks = []
+        return out
+
+
+def iter_parquet(rows: Iterator[Dict[str, Any]], columns: List[Tuple[str, str]],
+                 row_group_rows: int = PARQUET_ROW_GROUP_ROWS) -> Iterator[bytes]:
+    """File Parquet sebagai potongan bytes: satu row group per row_group_rows baris, footer di akhir."""
+    if pq is None:
+        raise RuntimeError("Format parquet memerlukan paket pyarrow.")
+    types = {"int": pa.int64(), "float": pa.float64(), "str": pa.string()}
+    schema = pa.schema([(name, types[kind]) for name, kind in columns])
+    sink = _DrainSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        batch: List[Dict[str, Any]] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= row_group_rows:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                batch = []
+                yield sink.drain()
+        if batch:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+    finally:
+        writer.close()
+    yield sink.drain()
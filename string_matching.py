@@ -0,0 +1,2037 @@
+"""
+Inti pendeteksi duplikasi: normalisasi, engine string matching
+(Naive, KMP, Boyer–Moore, Z-Algorithm, builtin str.find, Suffix Automaton) dan runner per pasangan.
+Tidak bergantung pada Flask → dipakai oleh web app dan CLI batch.
+"""
+import hashlib
+import re
+import sys
+import threading
+import time
+import unicodedata
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+
+MAX_TRACE_STEPS = 350
+
+# ============================================================
+# NORMALISASI (SATU ENGINE UNTUK normalize + normalize_with_map)
+# ============================================================
+# Mode folding:
+#   "ascii"   → lowercase, hanya [a-z0-9] yang dipertahankan
+#   "nfkd"    → lowercase + NFKD + buang aksen (é → e), lalu seperti "ascii"
+#   "unicode" → lowercase, semua huruf/angka Unicode (str.isalnum) dipertahankan
+# Semua karakter lain (tanda baca, "–", "—", "-", whitespace) menjadi spasi,
+# spasi ganda dirapikan dan spasi di awal/akhir dibuang.
+NORMALIZE_FOLD = "nfkd"
+FOLD_MODES = ("ascii", "nfkd", "unicode")
+
+_ASCII_ALNUM = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+_NON_ASCII_RE = re.compile(r"[^\x00-\x7f]")
+_MULTI_SPACE_RE = re.compile(r" {2,}")
+
+def _fold_char(ch: str, fold: str) -> str:
+    c = ch.lower()
+    if fold == "nfkd":
+        c = "".join(x for x in unicodedata.normalize("NFKD", c) if not unicodedata.combining(x))
+    if fold == "unicode":
+        return "".join(x if x.isalnum() else " " for x in c)
+    return "".join(x if x in _ASCII_ALNUM else " " for x in c)
+
+# Untuk karakter ASCII ketiga mode identik → cukup satu tabel bytes.translate
+_ASCII_FOLD = bytes(ord(_fold_char(chr(c), "ascii")) if c < 128 else 32 for c in range(256))
+
+class _FoldTable(dict):
+    """
+    Tabel str.translate (ordinal → string) yang diisi malas:
+    tiap karakter non-ASCII dihitung sekali saat pertama muncul.
+    """
+    def __init__(self, fold: str):
+        super().__init__()
+        self.fold = fold
+
+    def __missing__(self, code: int) -> str:
+        out = _fold_char(chr(code), self.fold)
+        self[code] = out
+        return out
+
+_FOLD_TABLES: Dict[str, _FoldTable] = {}
+
+def _fold_table(fold: str) -> _FoldTable:
+    table = _FOLD_TABLES.get(fold)
+    if table is None:
+        if fold not in FOLD_MODES:
+            raise ValueError(f"Mode folding tidak dikenal: {fold!r}")
+        table = _FOLD_TABLES[fold] = _FoldTable(fold)
+    return table
+
+_IDENT = array("I")
+
+def _ident(n: int) -> array:
+    """array('I') [0, 1, 2, ...] bersama; dipotong per slice (memcpy) saat membangun map."""
+    global _IDENT
+    if len(_IDENT) < n:
+        _IDENT = array("I", range(max(n, 2 * len(_IDENT), 1024)))
+    return _IDENT
+
+def _fold(text: str, fold: str) -> Tuple[str, Optional[array]]:
+    """
+    Lowercase + folding per karakter (non-alnum → spasi) tanpa merapikan spasi.
+    Jika ada karakter yang hasil foldingnya bukan tepat 1 karakter
+    (mis. aksen terpisah → "", "ﬁ" → "fi"), origin[k] = indeks karakter asli
+    untuk karakter ke-k hasil folding; None jika posisinya 1:1.
+    """
+    table = _fold_table(fold)
+    origin: Optional[array] = None
+    if not text.isascii():
+        odd = set(_NON_ASCII_RE.findall(text))
+        if any(len(table[ord(ch)]) != 1 for ch in odd):
+            origin = array("I")
+            for i, ch in enumerate(text):
+                origin.extend([i] * (len(table[ord(ch)]) if ch in odd else 1))
+        if fold == "unicode":
+            return text.translate(table), origin
+        for ch in odd:
+            text = text.replace(ch, table[ord(ch)])
+    return text.encode("ascii").translate(_ASCII_FOLD).decode("ascii"), origin
+
+def normalize(text: str, fold: str = NORMALIZE_FOLD) -> str:
+    return " ".join(_fold(text, fold)[0].split())
+
+def normalize_with_map(original: str, fold: str = NORMALIZE_FOLD) -> Tuple[str, array]:
+    """
+    Normalisasi identik dengan normalize(), tapi juga mengembalikan mapping:
+    map_norm[i] = indeks karakter di original yang menghasilkan norm[i]
+    (spasi pemisah dipetakan ke karakter non-alnum pertama setelah kata).
+    """
+    folded, origin = _fold(original, fold)
+    ident = _ident(len(folded))
+    start = len(folded) - len(folded.lstrip(" "))
+    end = len(folded.rstrip(" "))
+
+    # Hampir semua karakter bertahan: map = ident dikurangi run spasi berlebih
+    out_map = array("I")
+    prev = start
+    for m in _MULTI_SPACE_RE.finditer(folded, start, end):
+        st, en = m.span()
+        out_map.extend(ident[prev:st + 1])
+        prev = en
+    out_map.extend(ident[prev:end])
+
+    if origin is not None:
+        out_map = array("I", [origin[k] for k in out_map])
+    return " ".join(folded.split()), out_map
+
+# ============================================================
+# MODE KATA (TOKEN): kalimat → array('i') id kata
+# ============================================================
+MATCH_UNITS = ("char", "word")
+
+def encode_words(norm: str, vocab: Dict[str, int]) -> Tuple[array, array]:
+    """
+    Ubah teks hasil normalize() menjadi urutan id kata (array('i')) memakai
+    kamus bersama vocab (kata → id, diisi jika kata baru), plus starts[k] =
+    indeks karakter awal kata ke-k di norm (untuk highlight via map).
+    """
+    words = norm.split()
+    ids = array("i", [vocab.setdefault(w, len(vocab)) for w in words])
+    starts = array("I", accumulate((len(w) + 1 for w in words[:-1]), initial=0)) if words else array("I")
+    return ids, starts
+
+def escape_html(s: str) -> str:
+    return (s.replace("&", "&amp;")
+             .replace("<", "&lt;")
+             .replace(">", "&gt;")
+             .replace('"', "&quot;")
+             .replace("'", "&#39;"))
+
+def highlight_span(original: str, start: int, end: int) -> str:
+    """
+    Return HTML aman: original di-escape, bagian [start:end] diberi <mark class='hl'>.
+    """
+    start = max(0, min(start, len(original)))
+    end = max(0, min(end, len(original)))
+    if end <= start:
+        return escape_html(original)
+
+    left = escape_html(original[:start])
+    mid = escape_html(original[start:end])
+    right = escape_html(original[end:])
+    return f"{left}<mark class='hl'>{mid}</mark>{right}"
+
+def highlight_spans(original: str, spans: List[Tuple[int, int]]) -> str:
+    """
+    Seperti highlight_span(), tetapi untuk beberapa rentang [start:end] sekaligus
+    (rentang yang tumpang tindih digabung).
+    """
+    merged: List[List[int]] = []
+    for start, end in sorted(spans):
+        start = max(0, min(start, len(original)))
+        end = max(0, min(end, len(original)))
+        if end <= start:
+            continue
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+
+    out: List[str] = []
+    prev = 0
+    for start, end in merged:
+        out.append(escape_html(original[prev:start]))
+        out.append(f"<mark class='hl'>{escape_html(original[start:end])}</mark>")
+        prev = end
+    out.append(escape_html(original[prev:]))
+    return "".join(out)
+
+# ============================================================
+# INSTRUMENTASI OPERASI (MODE COUNT)
+# ============================================================
+# Semua engine *_count menerima stats (opsional) dan mengisinya dengan definisi
+# yang sama:
+#   comparisons : perbandingan karakter/token TEXT vs PATTERN saat pencarian
+#   shifts      : berapa kali jendela pattern bergeser (SAM: lompat suffix link)
+#   shift_hist  : {jarak_geser: jumlah}
+#   build_ops   : operasi pembangunan tabel (LPS, last occurrence, transisi SAM)
+#   table_bytes : ukuran tabel praproses (sys.getsizeof)
+# Counter dihitung di variabel lokal lalu ditulis sekali di akhir engine.
+OpStats = Dict[str, Any]
+
+def new_op_stats() -> OpStats:
+    return {"comparisons": 0, "shifts": 0, "shift_total": 0, "shift_hist": {},
+            "build_ops": 0, "table_bytes": 0}
+
+def _bucket_label(b: int) -> str:
+    """Bucket log2: 0 → "0", 1 → "1", 2 → "2-3", 3 → "4-7", ..."""
+    if b <= 1:
+        return str(b)
+    return f"{1 << (b - 1)}-{(1 << b) - 1}"
+
+def _hist_add(hist: Dict[int, int], value: int, count: int = 1) -> None:
+    b = value.bit_length()
+    hist[b] = hist.get(b, 0) + count
+
+def _hist_out(hist: Dict[int, int]) -> List[List[Any]]:
+    # list [label, jumlah] (bukan dict) supaya urutan bucket tetap setelah jsonify
+    return [[_bucket_label(b), hist[b]] for b in sorted(hist)]
+
+def new_op_summary() -> Dict[str, Any]:
+    """Agregat OpStats banyak pasangan (satu request, satu metode)."""
+    return {"pairs": 0, "comparisons": 0, "comparisons_max": 0, "comparisons_hist": {},
+            "shifts": 0, "shift_total": 0, "shift_hist": {},
+            "build_ops": 0, "build_ops_hist": {}, "table_bytes_max": 0}
+
+def add_op_stats(summary: Dict[str, Any], stats: OpStats) -> None:
+    summary["pairs"] += 1
+    summary["comparisons"] += stats["comparisons"]
+    summary["comparisons_max"] = max(summary["comparisons_max"], stats["comparisons"])
+    _hist_add(summary["comparisons_hist"], stats["comparisons"])
+    summary["shifts"] += stats["shifts"]
+    summary["shift_total"] += stats["shift_total"]
+    for dist, cnt in stats["shift_hist"].items():
+        _hist_add(summary["shift_hist"], dist, cnt)
+    summary["build_ops"] += stats["build_ops"]
+    _hist_add(summary["build_ops_hist"], stats["build_ops"])
+    summary["table_bytes_max"] = max(summary["table_bytes_max"], stats["table_bytes"])
+
+def op_summary_json(summary: Dict[str, Any]) -> Dict[str, Any]:
+    """Agregat → dict siap JSON (histogram berlabel bucket log2, rata-rata per pasangan)."""
+    pairs = summary["pairs"] or 1
+    shifts = summary["shifts"]
+    return {
+        "pairs": summary["pairs"],
+        "comparisons": {"total": summary["comparisons"], "mean": round(summary["comparisons"] / pairs, 2),
+                        "max": summary["comparisons_max"], "hist": _hist_out(summary["comparisons_hist"])},
+        "shifts": {"total": shifts, "mean": round(shifts / pairs, 2)},
+        "shift_distance": {"total": summary["shift_total"],
+                           "mean": round(summary["shift_total"] / shifts, 2) if shifts else 0.0,
+                           "hist": _hist_out(summary["shift_hist"])},
+        "build_ops": {"total": summary["build_ops"], "mean": round(summary["build_ops"] / pairs, 2),
+                      "hist": _hist_out(summary["build_ops_hist"])},
+        "table_bytes_max": summary["table_bytes_max"],
+    }
+
+def _put_stats(stats: Optional[OpStats], comps: int, shifts: int, shift_total: int,
+               shift_hist: Dict[int, int], build_ops: int, table_bytes: int) -> None:
+    if stats is not None:
+        stats.update(comparisons=comps, shifts=shifts, shift_total=shift_total, shift_hist=shift_hist,
+                     build_ops=build_ops, table_bytes=table_bytes)
+
+def naive_search(text: str, pattern: str) -> int:
+    n, m = len(text), len(pattern)
+    if m == 0:
+        return 0
+    if m > n:
+        return -1
+    for i in range(n - m + 1):
+        if text[i:i+m] == pattern:
+            return i
+    return -1
+
+def naive_search_iter(text, pattern, table=None, start: int = 0, end: Optional[int] = None) -> Iterator[int]:
+    """Semua kemunculan pattern di text[start:end] (offset global, urut naik)."""
+    end = len(text) if end is None else end
+    m = len(pattern)
+    if m == 0:
+        return
+    for i in range(start, end - m + 1):
+        if text[i:i+m] == pattern:
+            yield i
+
+def naive_search_count(text: str, pattern: str,
+                       stats: Optional[OpStats] = None) -> Tuple[int, int]:
+    n, m = len(text), len(pattern)
+    if m == 0 or m > n:
+        _put_stats(stats, 0, 0, 0, {}, 0, 0)
+        return (0 if m == 0 else -1), 0
+    comps = 0
+    for i in range(n - m + 1):
+        match = True
+        for j in range(m):
+            comps += 1
+            if text[i+j] != pattern[j]:
+                match = False
+                break
+        if match:
+            # naive selalu bergeser 1 → i pergeseran sebelum posisi cocok
+            _put_stats(stats, comps, i, i, {1: i} if i else {}, 0, 0)
+            return i, comps
+    shifts = n - m + 1
+    _put_stats(stats, comps, shifts, shifts, {1: shifts}, 0, 0)
+    return -1, comps
+
+def naive_search_trace(text: str, pattern: str) -> Tuple[int, List[str], int]:
+    trace: List[str] = []
+    n, m = len(text), len(pattern)
+    if m == 0:
+        trace.append("[Naive] Pattern kosong → ditemukan di indeks 0")
+        return 0, trace, 0
+    if m > n:
+        trace.append("[Naive] Pattern lebih panjang dari text → tidak mungkin ketemu")
+        return -1, trace, 0
+
+    steps = 0
+    comps = 0
+    trace.append("[NAIVE TRACE] Pergeseran satu-per-satu")
+    for i in range(n - m + 1):
+        trace.append(f"Shift i={i} | bandingkan text[{i}:{i+m}] dengan pattern")
+        match = True
+        for j in range(m):
+            steps += 1
+            comps += 1
+            trace.append(f"  Compare j={j}: T[{i+j}]='{text[i+j]}' vs P[{j}]='{pattern[j]}'")
+            if steps >= MAX_TRACE_STEPS:
+                trace.append("...trace dihentikan (batas langkah)")
+                return -2, trace, comps
+            if text[i+j] != pattern[j]:
+                trace.append("  ✗ mismatch → geser 1")
+                match = False
+                break
+        if match:
+            trace.append("  ✓ semua karakter cocok → FOUND")
+            return i, trace, comps
+    trace.append("→ pattern tidak ditemukan")
+    return -1, trace, comps
+
+def kmp_build_lps(pattern: str, stats: Optional[OpStats] = None) -> List[int]:
+    m = len(pattern)
+    lps = [0] * m
+    length = 0
+    i = 1
+    ops = 0
+    while i < m:
+        ops += 1
+        if pattern[i] == pattern[length]:
+            length += 1
+            lps[i] = length
+            i += 1
+        else:
+            if length != 0:
+                length = lps[length - 1]
+            else:
+                lps[i] = 0
+                i += 1
+    if stats is not None:
+        stats["build_ops"] = ops
+        stats["table_bytes"] = sys.getsizeof(lps)
+    return lps
+
+def kmp_search(text: str, pattern: str) -> int:
+    n, m = len(text), len(pattern)
+    if m == 0:
+        return 0
+    if m > n:
+        return -1
+
+    lps = kmp_build_lps(pattern)
+    i = j = 0
+    while i < n:
+        if text[i] == pattern[j]:
+            i += 1
+            j += 1
+            if j == m:
+                return i - j
+        else:
+            if j != 0:
+                j = lps[j - 1]  # wajib LPS[j-1]
+            else:
+                i += 1
+    return -1
+
+def kmp_search_iter(text, pattern, lps: Optional[List[int]] = None, start: int = 0,
+                    end: Optional[int] = None) -> Iterator[int]:
+    """Semua kemunculan di text[start:end]; setelah cocok j = LPS[m-1] (tabel dibangun sekali)."""
+    end = len(text) if end is None else end
+    m = len(pattern)
+    if m == 0:
+        return
+    if lps is None:
+        lps = kmp_build_lps(pattern)
+    i, j = start, 0
+    while i < end:
+        if text[i] == pattern[j]:
+            i += 1
+            j += 1
+            if j == m:
+                yield i - m
+                j = lps[m - 1]
+        elif j != 0:
+            j = lps[j - 1]
+        else:
+            i += 1
+
+def kmp_search_count(text: str, pattern: str, stats: Optional[OpStats] = None,
+                     lps: Optional[List[int]] = None) -> Tuple[int, int, List[int]]:
+    """lps dari cache (jika ada) dipakai ulang → build_ops = 0."""
+    n, m = len(text), len(pattern)
+    build: OpStats = {"build_ops": 0, "table_bytes": 0}
+    if m == 0:
+        _put_stats(stats, 0, 0, 0, {}, 0, 0)
+        return 0, 0, []
+    if lps is None:
+        lps = kmp_build_lps(pattern, build)
+    else:
+        build["table_bytes"] = sys.getsizeof(lps)
+    if m > n:
+        _put_stats(stats, 0, 0, 0, {}, build["build_ops"], build["table_bytes"])
+        return -1, 0, lps
+
+    i = j = 0
+    comps = shifts = shift_total = 0
+    hist: Dict[int, int] = {}
+    while i < n:
+        comps += 1
+        if text[i] == pattern[j]:
+            i += 1
+            j += 1
+            if j == m:
+                _put_stats(stats, comps, shifts, shift_total, hist, build["build_ops"], build["table_bytes"])
+                return i - j, comps, lps
+        else:
+            # jendela (i - j) bergeser sejauh j - LPS[j-1], atau 1 bila j == 0
+            if j != 0:
+                d = j - lps[j - 1]
+                j = lps[j - 1]
+            else:
+                d = 1
+                i += 1
+            shifts += 1
+            shift_total += d
+            hist[d] = hist.get(d, 0) + 1
+    _put_stats(stats, comps, shifts, shift_total, hist, build["build_ops"], build["table_bytes"])
+    return -1, comps, lps
+
+def kmp_search_trace(text: str, pattern: str) -> Tuple[int, List[str], int, List[int]]:
+    trace: List[str] = []
+    n, m = len(text), len(pattern)
+    if m == 0:
+        trace.append("[KMP] Pattern kosong → ditemukan di indeks 0")
+        return 0, trace, 0, []
+    if m > n:
+        trace.append("[KMP] Pattern lebih panjang dari text → tidak mungkin ketemu")
+        return -1, trace, 0, kmp_build_lps(pattern)
+
+    # Build LPS with trace
+    lps = [0] * m
+    length = 0
+    i = 1
+    trace.append("[KMP] Tahap 1: Bangun Tabel LPS")
+    trace.append(f"Pattern: '{pattern}'")
+    steps = 0
+    while i < m:
+        trace.append(f" i={i}, length={length} | P[i]='{pattern[i]}' vs P[length]='{pattern[length]}'")
+        if pattern[i] == pattern[length]:
+            length += 1
+            lps[i] = length
+            trace.append(f"  ✓ match → LPS[{i}]={length}, i++")
+            i += 1
+        else:
+            if length != 0:
+                trace.append(f"  ✗ mismatch → length = LPS[{length-1}] = {lps[length-1]}")
+                length = lps[length - 1]
+            else:
+                lps[i] = 0
+                trace.append(f"  ✗ mismatch & length==0 → LPS[{i}]=0, i++")
+                i += 1
+        steps += 1
+        if steps >= MAX_TRACE_STEPS:
+            trace.append("...trace dihentikan (batas langkah)")
+            return -2, trace, 0, lps
+
+    trace.append(f"LPS Table: {lps}")
+
+    trace.append("[KMP] Tahap 2: Proses Pencarian (i tidak pernah mundur)")
+    i = j = 0
+    comps = 0
+    step2 = 0
+    while i < n:
+        step2 += 1
+        if step2 >= MAX_TRACE_STEPS:
+            trace.append("...trace dihentikan (batas langkah)")
+            return -2, trace, comps, lps
+
+        comps += 1
+        trace.append(f" Step {step2}: i={i}, j={j} | T[i]='{text[i]}' vs P[j]='{pattern[j]}'")
+        if text[i] == pattern[j]:
+            i += 1
+            j += 1
+            trace.append(f"  ✓ match → i={i}, j={j}")
+            if j == m:
+                pos = i - j
+                trace.append(f"  ✓ FOUND pada posisi {pos}")
+                trace.append(f"  → set j = LPS[{j-1}] = {lps[j-1]}")
+                return pos, trace, comps, lps
+        else:
+            trace.append("  ✗ mismatch")
+            if j != 0:
+                old_j = j
+                j = lps[j - 1]
+                trace.append(f"  → geser j: {old_j} → {j} (pakai LPS[{old_j-1}])")
+            else:
+                i += 1
+                trace.append(f"  → j==0, geser i: i → {i}")
+
+    trace.append("→ pattern tidak ditemukan")
+    return -1, trace, comps, lps
+
+# ============================================================
+# 3) BOYER–MOORE (BAD CHARACTER) (FAST + TRACE + COUNT + LAST)
+# ============================================================
+# Tabel skip padat atas alfabet hasil normalize ([a-z0-9 ]): TEXT dikodekan
+# sekali ke bytes kode kecil (bytes.translate di C) dan last = array berukuran
+# tetap BM_SIGMA, sehingga lookup per mismatch = dua indeks, bukan dict.get(str).
+# Simbol di luar alfabet (mode fold "unicode", karakter non-ASCII → "?") berbagi
+# kode BM_OTHER: posisi terkanan kelas ≥ posisi terkanan simbol itu sendiri,
+# jadi shift hanya bisa lebih kecil dan tidak pernah melewatkan kecocokan.
+# Perbandingan tetap atas simbol asli. Mode kata (array id kata) memakai dict.
+BM_ALPHABET = "abcdefghijklmnopqrstuvwxyz0123456789 "
+BM_OTHER = len(BM_ALPHABET)
+BM_SIGMA = BM_OTHER + 1
+_BM_CODES = bytes(BM_ALPHABET.index(chr(c)) if chr(c) in BM_ALPHABET else BM_OTHER for c in range(256))
+
+class _LastDict(dict):
+    """Tabel last mode kata (id kata → posisi terkanan); simbol yang tidak ada → -1."""
+    def __missing__(self, key: Any) -> int:
+        return -1
+
+def bm_encode(seq):
+    """Kode BM per simbol: str → bytes (indeks ke tabel padat); array id kata dipakai apa adanya."""
+    if isinstance(seq, str):
+        return seq.encode("ascii", "replace").translate(_BM_CODES)
+    return seq
+
+def bm_build_last(pattern):
+    """Posisi terkanan tiap simbol di PATTERN: array('i') BM_SIGMA (str) atau _LastDict (id kata)."""
+    if isinstance(pattern, str):
+        last = array("i", [-1]) * BM_SIGMA
+    else:
+        last = _LastDict()
+    for idx, code in enumerate(bm_encode(pattern)):
+        last[code] = idx
+    return last
+
+def bm_table_json(last) -> Any:
+    """Serialisasi ringkas untuk explain: tabel padat → list BM_SIGMA int (urut BM_ALPHABET + lain)."""
+    return last.tolist() if isinstance(last, array) else last
+
+def bm_table_view(last) -> Dict[Any, int]:
+    """Simbol → posisi terkanan (hanya yang ada di PATTERN), untuk trace."""
+    if not isinstance(last, array):
+        return dict(last)
+    return {(BM_ALPHABET[c] if c < BM_OTHER else "lain"): lo for c, lo in enumerate(last) if lo >= 0}
+
+def bm_search(text: str, pattern: str) -> int:
+    n, m = len(text), len(pattern)
+    if m == 0:
+        return 0
+    if m > n:
+        return -1
+
+    last = bm_build_last(pattern)
+    codes = bm_encode(text)
+    s = 0
+    while s <= n - m:
+        j = m - 1
+        while j >= 0 and pattern[j] == text[s + j]:
+            j -= 1
+        if j < 0:
+            return s
+        shift = j - last[codes[s + j]]
+        s += shift if shift > 0 else 1
+    return -1
+
+def bm_search_iter(text, pattern, last=None, start: int = 0, end: Optional[int] = None) -> Iterator[int]:
+    """Semua kemunculan di text[start:end]; hanya rentang itu yang dikodekan, geser 1 setelah cocok."""
+    end = len(text) if end is None else end
+    m = len(pattern)
+    if m == 0 or end - start < m:
+        return
+    if last is None:
+        last = bm_build_last(pattern)
+    codes = bm_encode(text[start:end])
+    s = start
+    while s <= end - m:
+        j = m - 1
+        while j >= 0 and pattern[j] == text[s + j]:
+            j -= 1
+        if j < 0:
+            yield s
+            s += 1
+            continue
+        shift = j - last[codes[s - start + j]]
+        s += shift if shift > 0 else 1
+
+def bm_search_count(text: str, pattern: str, stats: Optional[OpStats] = None, last=None) -> Tuple[int, int, Any]:
+    """last dari cache (jika ada) dipakai ulang → build_ops = 0."""
+    n, m = len(text), len(pattern)
+    if m == 0:
+        _put_stats(stats, 0, 0, 0, {}, 0, 0)
+        return 0, 0, bm_build_last(pattern)
+    build_ops = 0
+    if last is None:
+        last = bm_build_last(pattern)
+        build_ops = m  # satu penulisan tabel per karakter pattern
+    table_bytes = sys.getsizeof(last)
+    if m > n:
+        _put_stats(stats, 0, 0, 0, {}, build_ops, table_bytes)
+        return -1, 0, last
+
+    codes = bm_encode(text)
+    s = 0
+    comps = shifts = shift_total = 0
+    hist: Dict[int, int] = {}
+    while s <= n - m:
+        j = m - 1
+        while j >= 0:
+            comps += 1
+            if pattern[j] == text[s + j]:
+                j -= 1
+            else:
+                break
+        if j < 0:
+            _put_stats(stats, comps, shifts, shift_total, hist, build_ops, table_bytes)
+            return s, comps, last
+        shift = max(1, j - last[codes[s + j]])
+        s += shift
+        shifts += 1
+        shift_total += shift
+        hist[shift] = hist.get(shift, 0) + 1
+    _put_stats(stats, comps, shifts, shift_total, hist, build_ops, table_bytes)
+    return -1, comps, last
+
+def bm_search_trace(text: str, pattern: str) -> Tuple[int, List[str], int, Any]:
+    trace: List[str] = []
+    n, m = len(text), len(pattern)
+    if m == 0:
+        trace.append("[BM] Pattern kosong → ditemukan di indeks 0")
+        return 0, trace, 0, bm_build_last(pattern)
+    if m > n:
+        trace.append("[BM] Pattern lebih panjang dari text → tidak mungkin ketemu")
+        return -1, trace, 0, bm_build_last(pattern)
+
+    last = bm_build_last(pattern)
+    codes = bm_encode(text)
+    trace.append("[BOYER–MOORE TRACE] Bad Character Rule (bandingkan dari kanan)")
+    trace.append(f"Last Table: {bm_table_view(last)}")
+
+    s = 0
+    steps = 0
+    comps = 0
+    while s <= n - m:
+        j = m - 1
+        trace.append(f"Alignment shift s={s} | mulai dari kanan (j={j})")
+
+        while j >= 0 and pattern[j] == text[s + j]:
+            comps += 1
+            trace.append(f"  ✓ match j={j}: P='{pattern[j]}' == T='{text[s+j]}'")
+            j -= 1
+            steps += 1
+            if steps >= MAX_TRACE_STEPS:
+                trace.append("...trace dihentikan (batas langkah)")
+                return -2, trace, comps, last
+
+        if j < 0:
+            trace.append("  ✓ semua cocok → FOUND")
+            return s, trace, comps, last
+
+        comps += 1
+        bad_char = text[s + j]
+        lo = last[codes[s + j]]
+        shift = max(1, j - lo)
+        trace.append(f"  ✗ mismatch j={j}: P='{pattern[j]}' != T='{bad_char}'")
+        trace.append(f"  bad_char='{bad_char}', last_occurrence={lo} → shift={shift}")
+        s += shift
+
+        steps += 1
+        if steps >= MAX_TRACE_STEPS:
+            trace.append("...trace dihentikan (batas langkah)")
+            return -2, trace, comps, last
+
+    trace.append("→ pattern tidak ditemukan")
+    return -1, trace, comps, last
+
+# ============================================================
+# 3a) BOYER–MOORE (EXTENDED BAD CHARACTER, TABEL 2-D)
+# ============================================================
+# ext[j][c] = posisi terkanan simbol c di P[0..j) (-1 jika tidak ada), sehingga
+# shift = j - ext[j][c] ≥ 1 selalu menyejajarkan kemunculan c di KIRI posisi
+# mismatch (aturan last biasa bisa menunjuk ke kanan j → shift jatuh ke 1).
+# str → array datar m × BM_SIGMA (baris j = baris j-1 + satu pembaruan);
+# array id kata → dict simbol → posisi naik, dicari dengan bisect.
+def bm_build_ext(pattern):
+    if not isinstance(pattern, str):
+        occ: Dict[Any, List[int]] = {}
+        for j, sym in enumerate(pattern):
+            occ.setdefault(sym, []).append(j)
+        return occ
+    row = array("h" if len(pattern) < 1 << 15 else "i", [-1]) * BM_SIGMA
+    ext = array(row.typecode)
+    for j, code in enumerate(bm_encode(pattern)):
+        ext.extend(row)
+        row[code] = j
+    return ext
+
+def _bm_ext_lo(ext, codes, i: int, j: int) -> int:
+    """Posisi terkanan simbol TEXT[i] di P[0..j) (-1 jika tidak ada)."""
+    if isinstance(ext, array):
+        return ext[j * BM_SIGMA + codes[i]]
+    pos = ext.get(codes[i])
+    k = bisect_left(pos, j) if pos else 0
+    return pos[k - 1] if k else -1
+
+def bm_ext_search(text: str, pattern: str) -> int:
+    n, m = len(text), len(pattern)
+    if m == 0:
+        return 0
+    if m > n:
+        return -1
+
+    ext = bm_build_ext(pattern)
+    codes = bm_encode(text)
+    dense = isinstance(ext, array)
+    s = 0
+    while s <= n - m:
+        j = m - 1
+        while j >= 0 and pattern[j] == text[s + j]:
+            j -= 1
+        if j < 0:
+            return s
+        s += j - (ext[j * BM_SIGMA + codes[s + j]] if dense else _bm_ext_lo(ext, codes, s + j, j))
+    return -1
+
+def bm_ext_search_iter(text, pattern, ext=None, start: int = 0, end: Optional[int] = None) -> Iterator[int]:
+    """Semua kemunculan di text[start:end]; hanya rentang itu yang dikodekan, geser 1 setelah cocok."""
+    end = len(text) if end is None else end
+    m = len(pattern)
+    if m == 0 or end - start < m:
+        return
+    if ext is None:
+        ext = bm_build_ext(pattern)
+    codes = bm_encode(text[start:end])
+    dense = isinstance(ext, array)
+    s = start
+    while s <= end - m:
+        j = m - 1
+        while j >= 0 and pattern[j] == text[s + j]:
+            j -= 1
+        if j < 0:
+            yield s
+            s += 1
+            continue
+        c = s - start + j
+        s += j - (ext[j * BM_SIGMA + codes[c]] if dense else _bm_ext_lo(ext, codes, c, j))
+
+def bm_ext_search_count(text: str, pattern: str, stats: Optional[OpStats] = None, ext=None) -> Tuple[int, int, Any]:
+    """ext dari cache (jika ada) dipakai ulang → build_ops = 0."""
+    n, m = len(text), len(pattern)
+    if m == 0:
+        _put_stats(stats, 0, 0, 0, {}, 0, 0)
+        return 0, 0, bm_build_ext(pattern)
+    build_ops = 0
+    if ext is None:
+        ext = bm_build_ext(pattern)
+        build_ops = m * BM_SIGMA if isinstance(pattern, str) else m  # salin baris / catat posisi
+    table_bytes = sys.getsizeof(ext)
+    if m > n:
+        _put_stats(stats, 0, 0, 0, {}, build_ops, table_bytes)
+        return -1, 0, ext
+
+    codes = bm_encode(text)
+    s = 0
+    comps = shifts = shift_total = 0
+    hist: Dict[int, int] = {}
+    while s <= n - m:
+        j = m - 1
+        while j >= 0:
+            comps += 1
+            if pattern[j] == text[s + j]:
+                j -= 1
+            else:
+                break
+        if j < 0:
+            _put_stats(stats, comps, shifts, shift_total, hist, build_ops, table_bytes)
+            return s, comps, ext
+        shift = j - _bm_ext_lo(ext, codes, s + j, j)
+        s += shift
+        shifts += 1
+        shift_total += shift
+        hist[shift] = hist.get(shift, 0) + 1
+    _put_stats(stats, comps, shifts, shift_total, hist, build_ops, table_bytes)
+    return -1, comps, ext
+
+def bm_ext_search_trace(text: str, pattern: str) -> Tuple[int, List[str], int, Any]:
+    trace: List[str] = []
+    n, m = len(text), len(pattern)
+    ext = bm_build_ext(pattern)
+    if m == 0:
+        trace.append("[BM-EXT] Pattern kosong → ditemukan di indeks 0")
+        return 0, trace, 0, ext
+    if m > n:
+        trace.append("[BM-EXT] Pattern lebih panjang dari text → tidak mungkin ketemu")
+        return -1, trace, 0, ext
+
+    codes = bm_encode(text)
+    trace.append("[BOYER–MOORE TRACE] Extended Bad Character Rule (bandingkan dari kanan)")
+    trace.append(f"Tabel 2-D: {m} baris (posisi j) × {BM_SIGMA if isinstance(pattern, str) else 'id kata'} kolom (simbol)")
+
+    s = 0
+    steps = 0
+    comps = 0
+    while s <= n - m:
+        j = m - 1
+        trace.append(f"Alignment shift s={s} | mulai dari kanan (j={j})")
+
+        while j >= 0 and pattern[j] == text[s + j]:
+            comps += 1
+            trace.append(f"  ✓ match j={j}: P='{pattern[j]}' == T='{text[s+j]}'")
+            j -= 1
+            steps += 1
+            if steps >= MAX_TRACE_STEPS:
+                trace.append("...trace dihentikan (batas langkah)")
+                return -2, trace, comps, ext
+
+        if j < 0:
+            trace.append("  ✓ semua cocok → FOUND")
+            return s, trace, comps, ext
+
+        comps += 1
+        bad_char = text[s + j]
+        lo = _bm_ext_lo(ext, codes, s + j, j)
+        shift = j - lo
+        trace.append(f"  ✗ mismatch j={j}: P='{pattern[j]}' != T='{bad_char}'")
+        trace.append(f"  bad_char='{bad_char}', terkanan di P[0..{j})={lo} → shift={shift}")
+        s += shift
+
+        steps += 1
+        if steps >= MAX_TRACE_STEPS:
+            trace.append("...trace dihentikan (batas langkah)")
+            return -2, trace, comps, ext
+
+    trace.append("→ pattern tidak ditemukan")
+    return -1, trace, comps, ext
+
+# ============================================================
+# 3b) Z-ALGORITHM (FAST + TRACE + COUNT + Z PATTERN)
+# ============================================================
+# Z[k] = panjang prefix bersama PATTERN dan PATTERN[k:] (Z[0] = m). Saat memindai
+# TEXT, kotak [l, r) = segmen TEXT terakhir yang diketahui sama dengan prefix
+# PATTERN; untuk i di dalam kotak, Z[i-l] memberi panjang kecocokan tanpa
+# membandingkan ulang. Setiap karakter TEXT dibandingkan sukses maksimal sekali
+# → O(n + m), tanpa separator / konkatenasi (berlaku juga untuk array id kata).
+def z_build(pattern: str, stats: Optional[OpStats] = None) -> List[int]:
+    m = len(pattern)
+    z = [0] * m
+    if m:
+        z[0] = m
+    l = r = 0
+    ops = 0
+    for i in range(1, m):
+        k = min(z[i - l], r - i) if i < r else 0
+        if i + k >= r:
+            while i + k < m:
+                ops += 1
+                if pattern[k] != pattern[i + k]:
+                    break
+                k += 1
+            l, r = i, i + k
+        z[i] = k
+    if stats is not None:
+        stats["build_ops"] = ops
+        stats["table_bytes"] = sys.getsizeof(z)
+    return z
+
+def z_search(text: str, pattern: str) -> int:
+    n, m = len(text), len(pattern)
+    if m == 0:
+        return 0
+    if m > n:
+        return -1
+    z = z_build(pattern)
+    l = r = 0
+    for i in range(n - m + 1):
+        k = 0
+        if i < r:
+            k = z[i - l]
+            if k < r - i:
+                continue  # kecocokan di i sudah diketahui < m dari kotak
+            k = r - i
+        while k < m and text[i + k] == pattern[k]:
+            k += 1
+        if k == m:
+            return i
+        l, r = i, i + k
+    return -1
+
+def z_search_iter(text, pattern, z: Optional[List[int]] = None, start: int = 0,
+                  end: Optional[int] = None) -> Iterator[int]:
+    """Semua kemunculan di text[start:end]; kotak [l, r) tetap berlaku setelah kecocokan penuh."""
+    end = len(text) if end is None else end
+    m = len(pattern)
+    if m == 0:
+        return
+    if z is None:
+        z = z_build(pattern)
+    l = r = start
+    for i in range(start, end - m + 1):
+        k = 0
+        if i < r:
+            k = z[i - l]
+            if k < r - i:
+                continue
+            k = r - i
+        while k < m and text[i + k] == pattern[k]:
+            k += 1
+        if k == m:
+            yield i
+        l, r = i, i + k
+
+def z_search_count(text: str, pattern: str, stats: Optional[OpStats] = None,
+                   z: Optional[List[int]] = None) -> Tuple[int, int, List[int]]:
+    """z dari cache (jika ada) dipakai ulang → build_ops = 0."""
+    n, m = len(text), len(pattern)
+    build: OpStats = {"build_ops": 0, "table_bytes": 0}
+    if m == 0:
+        _put_stats(stats, 0, 0, 0, {}, 0, 0)
+        return 0, 0, []
+    if z is None:
+        z = z_build(pattern, build)
+    else:
+        build["table_bytes"] = sys.getsizeof(z)
+    if m > n:
+        _put_stats(stats, 0, 0, 0, {}, build["build_ops"], build["table_bytes"])
+        return -1, 0, z
+
+    # jendela (posisi i) selalu bergeser 1; yang dihemat adalah perbandingan per jendela
+    l = r = 0
+    comps = shifts = 0
+    for i in range(n - m + 1):
+        k = 0
+        if i < r:
+            k = z[i - l]
+            if k < r - i:
+                shifts += 1
+                continue
+            k = r - i
+        while k < m:
+            comps += 1
+            if text[i + k] != pattern[k]:
+                break
+            k += 1
+        if k == m:
+            _put_stats(stats, comps, shifts, shifts, {1: shifts} if shifts else {},
+                       build["build_ops"], build["table_bytes"])
+            return i, comps, z
+        l, r = i, i + k
+        shifts += 1
+    _put_stats(stats, comps, shifts, shifts, {1: shifts} if shifts else {}, build["build_ops"], build["table_bytes"])
+    return -1, comps, z
+
+def z_search_trace(text: str, pattern: str) -> Tuple[int, List[str], int, List[int]]:
+    trace: List[str] = []
+    n, m = len(text), len(pattern)
+    if m == 0:
+        trace.append("[Z] Pattern kosong → ditemukan di indeks 0")
+        return 0, trace, 0, []
+    z = z_build(pattern)
+    if m > n:
+        trace.append("[Z] Pattern lebih panjang dari text → tidak mungkin ketemu")
+        return -1, trace, 0, z
+
+    trace.append("[Z] Tahap 1: Bangun array Z PATTERN (Z[k] = prefix bersama PATTERN dan PATTERN[k:])")
+    trace.append(f"Pattern: '{pattern}'")
+    trace.append(f"Z Array: {z}")
+    trace.append("[Z] Tahap 2: Pindai TEXT dengan kotak [l, r) = segmen TEXT yang sama dengan prefix PATTERN")
+    l = r = 0
+    comps = 0
+    steps = 0
+    for i in range(n - m + 1):
+        steps += 1
+        if steps >= MAX_TRACE_STEPS:
+            trace.append("...trace dihentikan (batas langkah)")
+            return -2, trace, comps, z
+        k = 0
+        if i < r:
+            k = z[i - l]
+            if k < r - i:
+                trace.append(f" i={i} di dalam kotak [{l},{r}) | Z[{i - l}]={k} < {r - i} → pasti < m, lewati tanpa perbandingan")
+                continue
+            trace.append(f" i={i} di dalam kotak [{l},{r}) | Z[{i - l}]={k} ≥ {r - i} → mulai bandingkan dari k={r - i}")
+            k = r - i
+        else:
+            trace.append(f" i={i} di luar kotak → bandingkan dari k=0")
+        while k < m:
+            comps += 1
+            if text[i + k] != pattern[k]:
+                trace.append(f"  ✗ T[{i + k}]='{text[i + k]}' vs P[{k}]='{pattern[k]}' → cocok {k} karakter")
+                break
+            k += 1
+        if k == m:
+            trace.append(f"  ✓ FOUND pada posisi {i}")
+            return i, trace, comps, z
+        l, r = i, i + k
+    trace.append("→ pattern tidak ditemukan")
+    return -1, trace, comps, z
+
+# ============================================================
+# BUILTIN (str.find / bytes.find, C fastsearch) — BASELINE
+# ============================================================
+# Mode karakter: str.find langsung. Mode kata (array id token): cari di bytes
+# array, lalu buang hit yang tidak rata itemsize (hit di tengah sebuah id).
+def builtin_search(text, pattern) -> int:
+    n, m = len(text), len(pattern)
+    if m > n:
+        return -1
+    if isinstance(text, str):
+        return text.find(pattern)
+    size = text.itemsize
+    hay, needle = text.tobytes(), pattern.tobytes()
+    pos = hay.find(needle)
+    while pos != -1 and pos % size:
+        pos = hay.find(needle, pos + 1)
+    return pos // size if pos != -1 else -1
+
+def builtin_search_iter(text, pattern, table=None, start: int = 0, end: Optional[int] = None) -> Iterator[int]:
+    """Semua kemunculan di text[start:end] lewat str.find / bytes.find berulang (tanpa salin untuk str)."""
+    end = len(text) if end is None else end
+    if len(pattern) == 0:
+        return
+    if isinstance(text, str):
+        pos = text.find(pattern, start, end)
+        while pos != -1:
+            yield pos
+            pos = text.find(pattern, pos + 1, end)
+        return
+    size = text.itemsize
+    hay, needle = text[start:end].tobytes(), pattern.tobytes()
+    pos = hay.find(needle)
+    while pos != -1:
+        if pos % size == 0:
+            yield start + pos // size
+        pos = hay.find(needle, pos + 1)
+
+def builtin_search_count(text, pattern, stats: Optional[OpStats] = None) -> Tuple[int, int]:
+    # pencarian terjadi di C → tidak ada counter yang bisa diamati (semua 0)
+    _put_stats(stats, 0, 0, 0, {}, 0, 0)
+    return builtin_search(text, pattern), 0
+
+def builtin_search_trace(text, pattern) -> Tuple[int, List[str], int]:
+    idx = builtin_search(text, pattern)
+    where = "str.find" if isinstance(text, str) else "bytes.find (array id kata)"
+    trace = [f"[BUILTIN] {where} — pencarian C (two-way / fastsearch), tanpa langkah Python",
+             f"n={len(text)}, m={len(pattern)}",
+             f"✓ FOUND pada posisi {idx}" if idx >= 0 else "→ pattern tidak ditemukan"]
+    return idx, trace, 0
+
+# ============================================================
+# REGISTRY ENGINE SUBSTRING
+# ============================================================
+# Setiap engine mendaftarkan varian fast / count / trace, tabel praprosesnya
+# dan kapabilitas:
+#   compare      : ikut method="all" (dibandingkan berdampingan)
+#   scaling      : tersedia di analisis skala empiris (complexity.py)
+#   batch        : pilihan --method di CLI batch / pencarian paralel
+#   instrumented : counter operasi bermakna (builtin berjalan di C → selalu 0)
+# Runner, estimasi beban, UI, verifikasi dan CLI membaca registry ini, sehingga
+# engine baru cukup didaftarkan sekali lewat register_engine.
+class Engine:
+    """
+    count(text, pattern, stats, table) → (idx, comps, table)
+    trace(text, pattern)               → (idx, trace, comps, table)
+    scan(text, pattern, table, lo, hi) → iterator semua kemunculan di text[lo:hi] (tabel dipakai ulang)
+    table = jenis tabel praproses PATTERN (kunci PATTERN_CACHE) atau None;
+    table_per_vocab = tabel memetakan simbol → di mode kata tidak boleh dipakai lintas request;
+    cache_table = False → tabel tidak disimpan di cache mana pun (mis. terlalu besar, m × σ);
+    table_json = serialisasi tabel untuk explain (None → tidak ditampilkan);
+    table_alphabet = label kolom tabel padat (UI).
+    """
+
+    def __init__(self, name: str, *, label: str, short: str, explain: str, info: str,
+                 fast: Callable[[Any, Any], int],
+                 count: Callable[[Any, Any, Optional[OpStats], Any], Tuple[int, int, Any]],
+                 trace: Callable[[Any, Any], Tuple[int, List[str], int, Any]],
+                 work: Callable[[int, int], int],
+                 scan: Optional[Callable[[Any, Any, Any, int, Optional[int]], Iterator[int]]] = None,
+                 table: Optional[str] = None, table_label: str = "", build: Optional[Callable[[Any], Any]] = None,
+                 table_per_vocab: bool = False, cache_table: bool = True, table_json: Optional[Callable[[Any], Any]] = None,
+                 table_alphabet: Optional[str] = None, adversarial: Optional[Callable[[int], str]] = None,
+                 compare: bool = True, scaling: bool = True, batch: bool = True, instrumented: bool = True):
+        self.name = name
+        self.label = label
+        self.short = short
+        self.explain = explain
+        self.info = info
+        self.fast = fast
+        self.count = count
+        self.trace = trace
+        self.work = work
+        self.scan = scan
+        self.table = table
+        self.table_label = table_label
+        self.build = build
+        self.table_per_vocab = table_per_vocab
+        self.cache_table = cache_table
+        self.table_json = table_json or (lambda table: table)
+        self.table_alphabet = table_alphabet
+        self.adversarial = adversarial or (lambda m: "a" * (m - 1) + "b")
+        self.compare = compare
+        self.scaling = scaling
+        self.batch = batch
+        self.instrumented = instrumented
+
+    def describe(self) -> Dict[str, Any]:
+        """Metadata siap JSON (UI / API)."""
+        return {"name": self.name, "label": self.label, "short": self.short, "explain": self.explain,
+                "info": self.info, "table": self.table, "table_label": self.table_label,
+                "table_alphabet": self.table_alphabet,
+                "compare": self.compare, "scaling": self.scaling, "batch": self.batch,
+                "instrumented": self.instrumented}
+
+ENGINES: Dict[str, Engine] = {}
+
+def register_engine(engine: Engine) -> Engine:
+    if engine.name in ENGINES or engine.name in ("all", "sam"):
+        raise ValueError(f"Nama engine sudah dipakai: {engine.name}")
+    ENGINES[engine.name] = engine
+    return engine
+
+def engine_names(capability: Optional[str] = None) -> Tuple[str, ...]:
+    """Nama engine terdaftar (urut pendaftaran), opsional hanya yang punya kapabilitas tertentu."""
+    return tuple(name for name, e in ENGINES.items() if capability is None or getattr(e, capability))
+
+def _worst_case_work(n: int, m: int) -> int:
+    return (n - m + 1) * m          # kasus terburuk O(nm)
+
+def _linear_work(n: int, m: int) -> int:
+    return 2 * n + m                # tabel + pencarian, tidak mundur
+
+register_engine(Engine(
+    "naive", label="Naive String Matching", short="Naive",
+    explain="Naive menggeser pattern satu-per-satu dan membandingkan karakter dari kiri. Sederhana tetapi bisa lebih lambat pada teks panjang.",
+    info="Naive menggeser pattern satu-per-satu dan membandingkan dari kiri.",
+    fast=naive_search,
+    count=lambda t, p, stats, table: (*naive_search_count(t, p, stats), None),
+    trace=lambda t, p: (*naive_search_trace(t, p), None),
+    work=_worst_case_work, scan=naive_search_iter))
+register_engine(Engine(
+    "kmp", label="Knuth–Morris–Pratt (KMP)", short="KMP",
+    explain="KMP membangun tabel LPS untuk menghindari perbandingan ulang saat mismatch. i tidak mundur; pencarian lebih efisien.",
+    info="KMP memakai tabel LPS untuk menghindari perbandingan ulang saat mismatch.",
+    fast=kmp_search, count=kmp_search_count, trace=kmp_search_trace, work=_linear_work, scan=kmp_search_iter,
+    table="lps", table_label="LPS", build=kmp_build_lps))
+register_engine(Engine(
+    "bm", label="Boyer–Moore (Bad Character)", short="BM",
+    explain="Boyer–Moore membandingkan dari kanan ke kiri dan dapat melompat jauh dengan aturan bad character. Umumnya cepat pada teks natural.",
+    info="BM memakai tabel last occurrence (bad character) untuk menentukan lompatan shift.",
+    fast=bm_search, count=bm_search_count, trace=bm_search_trace, work=_worst_case_work, scan=bm_search_iter,
+    table="last", table_label="Last Table", build=bm_build_last, table_per_vocab=True,
+    table_json=bm_table_json, table_alphabet=BM_ALPHABET, adversarial=lambda m: "b" + "a" * (m - 1)))
+register_engine(Engine(
+    "bm_ext", label="Boyer–Moore (Extended Bad Character)", short="BM-Ext",
+    explain="Boyer–Moore dengan aturan bad character diperluas: tabel 2-D (posisi × simbol) memberi kemunculan terkanan simbol di KIRI posisi mismatch, sehingga shift tidak pernah jatuh ke 1 karena kemunculan di kanan.",
+    info="BM-Ext memakai tabel 2-D ext[j][c] = posisi terkanan simbol c di P[0..j); shift = j - ext[j][c]. Tabel (m × σ) tidak diserialisasi per pasangan.",
+    fast=bm_ext_search, count=bm_ext_search_count, trace=bm_ext_search_trace, work=_worst_case_work,
+    scan=bm_ext_search_iter,
+    table="ext", table_label="Tabel 2-D", build=bm_build_ext, table_per_vocab=True,
+    # tabel m × σ (≈ 400 KB untuk m = 5000) dibangun per pasangan: tidak di-cache dan
+    # tidak ikut method="all" agar memori PATTERN_CACHE tetap terbatas
+    cache_table=False, table_json=lambda ext: None, adversarial=lambda m: "b" + "a" * (m - 1),
+    compare=False))
+register_engine(Engine(
+    "z", label="Z-Algorithm", short="Z",
+    explain="Z-Algorithm menghitung array Z PATTERN, lalu memindai TEXT dengan kotak [l, r) sehingga kecocokan yang sudah diketahui tidak dibandingkan ulang. Linear O(n + m).",
+    info="Z-Algorithm memakai array Z PATTERN; posisi di dalam kotak [l, r) dengan Z[i-l] < r-i dilewati tanpa perbandingan.",
+    fast=z_search, count=z_search_count, trace=z_search_trace, work=_linear_work, scan=z_search_iter,
+    table="z", table_label="Z Array", build=z_build))
+register_engine(Engine(
+    "builtin", label="Builtin (str.find, C)", short="Builtin",
+    explain="Baseline: pencarian bawaan Python (str.find / bytes.find) yang berjalan di C. Paling cepat; dipakai sebagai pembanding dan default untuk batch besar.",
+    info="Baseline: str.find / bytes.find bawaan Python (C). Tidak ada langkah atau counter Python yang bisa ditampilkan (comparisons = 0).",
+    fast=builtin_search,
+    count=lambda t, p, stats, table: (*builtin_search_count(t, p, stats), None),
+    trace=lambda t, p: (*builtin_search_trace(t, p), None),
+    work=lambda n, m: (n + m) // 8 + 1,   # str.find di C: linear, jauh lebih murah per karakter
+    scan=builtin_search_iter,
+    compare=False, scaling=False, instrumented=False))
+
+# ============================================================
+# 4) SUFFIX AUTOMATON (LONGEST COMMON SUBSTRING / OVERLAP)
+# ============================================================
+OVERLAP_THRESHOLD = 0.8
+OVERLAP_TOP_K = 3
+OVERLAP_MIN_SHARE = 0.2  # substring bersama tambahan (selain LCS) minimal 20% panjang PATTERN
+MAX_OVERLAP_TOP_K = 10
+
+def sam_build(text) -> Tuple[List[Dict[Any, int]], List[int], List[int], List[int]]:
+    """
+    Bangun suffix automaton untuk text (str atau array id kata) dalam O(n).
+    Return (next, link, length, first): first[v] = posisi akhir kemunculan
+    pertama string-string milik state v di text.
+    """
+    nxt: List[Dict[Any, int]] = [{}]
+    link = [-1]
+    length = [0]
+    first = [-1]
+    last = 0
+    for pos, ch in enumerate(text):
+        cur = len(nxt)
+        nxt.append({})
+        link.append(0)
+        length.append(length[last] + 1)
+        first.append(pos)
+        p = last
+        while p != -1 and ch not in nxt[p]:
+            nxt[p][ch] = cur
+            p = link[p]
+        if p != -1:
+            q = nxt[p][ch]
+            if length[p] + 1 == length[q]:
+                link[cur] = q
+            else:
+                clone = len(nxt)
+                nxt.append(dict(nxt[q]))
+                link.append(link[q])
+                length.append(length[p] + 1)
+                first.append(first[q])
+                while p != -1 and nxt[p].get(ch) == q:
+                    nxt[p][ch] = clone
+                    p = link[p]
+                link[q] = clone
+                link[cur] = clone
+        last = cur
+    return nxt, link, length, first
+
+def _sam_stream(sam, pattern, top_k: int, min_len: int, trace: Optional[List[str]],
+                stats: Optional[OpStats] = None) -> Tuple[List[Tuple[int, int, int]], int]:
+    """
+    Alirkan pattern melalui automaton text. Setiap posisi i menghasilkan
+    panjang kecocokan terpanjang yang berakhir di P[i]; posisi di mana
+    kecocokan tidak bisa diperpanjang adalah substring bersama yang maksimal.
+    Return (top_k [(panjang, start_text, start_pattern)], comps); entri pertama
+    adalah LCS, entri berikutnya hanya yang panjangnya ≥ min_len.
+    """
+    nxt, link, length, first = sam
+    v = l = 0
+    comps = shifts = shift_total = 0
+    hist: Dict[int, int] = {}
+    ends: List[Tuple[int, int, int]] = []  # (panjang, akhir_text, akhir_pattern)
+    prev: Optional[Tuple[int, int, int]] = None
+    for i, ch in enumerate(pattern):
+        comps += 1
+        while v and ch not in nxt[v]:
+            v = link[v]
+            d = l - length[v]
+            l = length[v]
+            comps += 1
+            shifts += 1
+            shift_total += d
+            hist[d] = hist.get(d, 0) + 1
+        if ch in nxt[v]:
+            v = nxt[v][ch]
+            l += 1
+        else:
+            v = l = 0
+
+        if trace is not None:
+            if len(trace) < MAX_TRACE_STEPS:
+                trace.append(f" Step {i}: P[{i}]='{ch}' → state={v}, panjang cocok={l}")
+            elif len(trace) == MAX_TRACE_STEPS:
+                trace.append("...trace dihentikan (batas langkah), perhitungan tetap dilanjutkan")
+
+        if prev is not None and l != prev[0] + 1 and prev[0] > 0:
+            ends.append(prev)
+        prev = (l, first[v], i)
+    if prev is not None and prev[0] > 0:
+        ends.append(prev)
+
+    if stats is not None:
+        stats.update(comparisons=comps, shifts=shifts, shift_total=shift_total, shift_hist=hist)
+    ends.sort(key=lambda e: (-e[0], e[2]))
+    ends = ends[:1] + [e for e in ends[1:top_k] if e[0] >= min_len]
+    return [(ln, te - ln + 1, pe - ln + 1) for ln, te, pe in ends], comps
+
+def sam_table_stats(sam) -> Tuple[int, int]:
+    """(build_ops, table_bytes) automaton: jumlah state + transisi, dan ukuran tabelnya."""
+    nxt, link, length, first = sam
+    build_ops = len(nxt) + sum(len(d) for d in nxt)
+    table_bytes = (sum(sys.getsizeof(d) for d in nxt) + sys.getsizeof(nxt) + sys.getsizeof(link)
+                   + sys.getsizeof(length) + sys.getsizeof(first))
+    return build_ops, table_bytes
+
+def sam_overlap_count(text, pattern, top_k: int = OVERLAP_TOP_K, min_len: int = 1,
+                      stats: Optional[OpStats] = None) -> Tuple[List[Tuple[int, int, int]], int, int]:
+    sam = sam_build(text)
+    overlaps, comps = _sam_stream(sam, pattern, top_k, min_len, None, stats)
+    if stats is not None:
+        stats["build_ops"], stats["table_bytes"] = sam_table_stats(sam)
+    return overlaps, comps, len(sam[0])
+
+def sam_overlap_trace(text, pattern, top_k: int = OVERLAP_TOP_K,
+                      min_len: int = 1) -> Tuple[List[Tuple[int, int, int]], List[str], int, int]:
+    trace: List[str] = []
+    trace.append("[SUFFIX AUTOMATON] Tahap 1: Bangun automaton dari TEXT")
+    sam = sam_build(text)
+    trace.append(f"Jumlah state: {len(sam[0])} (≤ 2n-1, n={len(text)})")
+    trace.append("[SUFFIX AUTOMATON] Tahap 2: Alirkan PATTERN (ikuti suffix link saat transisi tidak ada)")
+    overlaps, comps = _sam_stream(sam, pattern, top_k, min_len, trace)
+    if overlaps:
+        for ln, ts, ps in overlaps:
+            trace.append(f"  substring bersama maksimal: panjang={ln}, TEXT[{ts}:{ts+ln}], PATTERN[{ps}:{ps+ln}]")
+    else:
+        trace.append("→ tidak ada substring bersama")
+    return overlaps, trace, comps, len(sam[0])
+
+# ============================================================
+# CACHE POLA LINTAS REQUEST (TABEL PRAPROSES: LPS / LAST / Z)
+# ============================================================
+# Kalimat baku (sitasi, frasa standar) muncul sebagai PATTERN di banyak
+# pasangan dan banyak request. Tabel praproses disimpan sekali per proses,
+# dikunci (jenis, unit, SHA-1 PATTERN hasil normalisasi), dibatasi LRU.
+# Tabel yang dikembalikan dipakai bersama antar thread → hanya dibaca.
+# Tabel yang memetakan simbol (Engine.table_per_vocab, mis. last BM) di mode
+# kata memetakan id kata (berbeda per request) sehingga tidak disimpan di sini;
+# tetap memakai cache per request.
+PATTERN_CACHE_SIZE = 4096
+
+class PatternCache:
+    """LRU thread-safe untuk tabel pattern + counter hit/miss/eviction."""
+
+    def __init__(self, capacity: int = PATTERN_CACHE_SIZE):
+        if capacity < 1:
+            raise ValueError("capacity harus ≥ 1.")
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Tuple[str, str, bytes], Any]" = OrderedDict()
+        self.hits = self.misses = self.evictions = 0
+
+    @staticmethod
+    def _key(kind: str, unit: str, pattern_norm: str) -> Tuple[str, str, bytes]:
+        return kind, unit, hashlib.sha1(pattern_norm.encode("utf-8")).digest()
+
+    def get(self, kind: str, unit: str, pattern_norm: str) -> Any:
+        """Tabel tersimpan (None jika belum ada); hit memindahkan entri ke posisi terbaru."""
+        key = self._key(kind, unit, pattern_norm)
+        with self._lock:
+            val = self._data.get(key)
+            if val is None:
+                self.misses += 1
+            else:
+                self._data.move_to_end(key)
+                self.hits += 1
+            return val
+
+    def __contains__(self, item: Tuple[str, str, str]) -> bool:
+        """Cek keberadaan (kind, unit, pattern_norm) tanpa mengubah counter / urutan LRU."""
+        key = self._key(*item)
+        with self._lock:
+            return key in self._data
+
+    def put(self, kind: str, unit: str, pattern_norm: str, table: Any) -> None:
+        key = self._key(kind, unit, pattern_norm)
+        with self._lock:
+            self._data[key] = table
+            self._data.move_to_end(key)
+            while len(self._data) > self.capacity:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def resize(self, capacity: int) -> None:
+        """Ubah kapasitas (≥ 1); entri terlama dibuang bila cache sudah melebihi kapasitas baru."""
+        if isinstance(capacity, bool) or not isinstance(capacity, int) or capacity < 1:
+            raise ValueError("capacity harus bilangan bulat ≥ 1.")
+        with self._lock:
+            self.capacity = capacity
+            while len(self._data) > self.capacity:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def warm(self, sentences: List[str], units: Tuple[str, ...] = MATCH_UNITS) -> int:
+        """Isi cache dari daftar kalimat yang sering muncul; return jumlah tabel yang dibangun."""
+        built = 0
+        for s in sentences:
+            norm = normalize(s)
+            if not norm:
+                continue
+            for unit in units:
+                seq = encode_words(norm, {})[0] if unit == "word" else norm
+                for engine in ENGINES.values():
+                    if (engine.build is None or not engine.cache_table
+                            or (unit == "word" and engine.table_per_vocab)):
+                        continue
+                    if (engine.table, unit, norm) not in self:
+                        self.put(engine.table, unit, norm, engine.build(seq))
+                        built += 1
+        return built
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"size": len(self._data), "capacity": self.capacity, "hits": self.hits,
+                    "misses": self.misses, "evictions": self.evictions,
+                    "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0}
+
+PATTERN_CACHE = PatternCache()
+
+# ============================================================
+# INDEX KATA (PRUNING PASANGAN KANDIDAT, ATURAN SUBSTRING)
+# ============================================================
+# PATTERN hanya bisa menjadi substring TEXT jika setiap kata "dalam"-nya
+# muncul utuh di TEXT. Mode karakter: kata pertama/terakhir PATTERN boleh
+# berupa potongan kata TEXT, sehingga hanya kata di antaranya yang wajib.
+# Mode kata: semua kata wajib. Kandidat = irisan posting list kata wajib,
+# dimulai dari kata paling jarang.
+
+class WordIndex:
+    """
+    Inverted index kata hasil normalisasi → {id kalimat}, satu unit (char/word).
+    Arah pasangan sama dengan run_one_pair: TEXT = urutan lebih panjang
+    (seri → kalimat pertama), PATTERN = yang lebih pendek.
+    """
+
+    def __init__(self, unit: str = "char"):
+        self.unit = unit
+        self.postings: Dict[str, set] = {}
+        self.norms: List[str] = []
+        self.lengths: List[int] = []
+        self._cands: Dict[int, Optional[set]] = {}
+
+    def __len__(self) -> int:
+        return len(self.norms)
+
+    def add(self, norm: str) -> int:
+        doc = len(self.norms)
+        words = norm.split()
+        for w in set(words):
+            self.postings.setdefault(w, set()).add(doc)
+        self.norms.append(norm)
+        self.lengths.append(len(words) if self.unit == "word" else len(norm))
+        return doc
+
+    def required_words(self, norm: str) -> List[str]:
+        words = norm.split()
+        return words if self.unit == "word" else words[1:-1]
+
+    def candidates(self, norm: str) -> Optional[set]:
+        """id kalimat yang mungkin memuat PATTERN norm; None = tidak ada kata wajib (semua kandidat)."""
+        req = set(self.required_words(norm))
+        if not req:
+            return None
+        lists = sorted((self.postings.get(w, set()) for w in req), key=len)
+        rarest, rest = lists[0], lists[1:]
+        return {d for d in rarest if all(d in other for other in rest)}
+
+    def _pattern_cands(self, p: int) -> Optional[set]:
+        try:
+            return self._cands[p]
+        except KeyError:
+            c = self._cands[p] = self.candidates(self.norms[p])
+            return c
+
+    def pair_possible(self, i: int, j: int) -> bool:
+        """False jika pasangan (i, j), i < j, pasti bukan duplikat substring."""
+        p, t = (j, i) if self.lengths[i] >= self.lengths[j] else (i, j)
+        c = self._pattern_cands(p)
+        return c is None or t in c
+
+    def candidate_pairs(self) -> Iterator[Tuple[int, int]]:
+        """
+        Semua pasangan (i, j), i < j, yang lolos pruning, urut leksikografis.
+        Hanya posting kandidat yang dikunjungi → ~O(n + jumlah kandidat) bila
+        setiap kalimat punya kata wajib.
+        """
+        n = len(self.norms)
+        lens = self.lengths
+        partners: Dict[int, set] = {}
+        for p in range(n):
+            c = self._pattern_cands(p)
+            targets = range(n) if c is None else c
+            for t in targets:
+                # p harus menjadi PATTERN pasangan (min, max) — lihat pair_possible
+                if t == p or (lens[t] < lens[p] if t < p else lens[p] >= lens[t]):
+                    continue
+                i, j = (t, p) if t < p else (p, t)
+                partners.setdefault(i, set()).add(j)
+        for i in sorted(partners):
+            for j in sorted(partners[i]):
+                yield i, j
+
+# ============================================================
+# PREFILTER PASANGAN (TOLAK MURAH SEBELUM ENGINE, ATURAN SUBSTRING)
+# ============================================================
+# Ringkasan per kalimat dihitung sekali; setiap filter hanya menolak pasangan
+# yang PASTI bukan duplikat (tidak pernah salah tolak). Urutan = termurah dulu:
+#   length     : panjang sama tetapi isi berbeda → PATTERN tidak mungkin = TEXT
+#   bitmask    : himpunan simbol PATTERN (64 bit) ⊄ himpunan simbol TEXT — O(1)
+#   word_index : kata wajib PATTERN tidak semua ada di TEXT (WordIndex)
+#   histogram  : ada simbol yang lebih sering di PATTERN daripada di TEXT — O(alfabet)
+#   qgram      : q-gram pertama/terakhir PATTERN tidak ada di TEXT (bitset q-gram TEXT)
+# Simbol = karakter (mode karakter) atau kata (mode kata).
+PREFILTERS = ("length", "bitmask", "word_index", "histogram", "qgram")
+QGRAM_Q = {"char": 3, "word": 2}
+QGRAM_BITS = 1024   # bitset q-gram per kalimat: cukup jarang terisi untuk kalimat biasa, tetap kecil
+
+_CHAR_BIT = {c: k for k, c in enumerate(sorted(_ASCII_ALNUM) + [" "])}
+
+def _symbol_bit(sym: str, unit: str) -> int:
+    if unit == "char":
+        return 1 << _CHAR_BIT.get(sym, ord(sym) & 63)
+    return 1 << (zlib.crc32(sym.encode("utf-8")) & 63)
+
+def _qgram_bit(gram: str) -> int:
+    return 1 << (zlib.crc32(gram.encode("utf-8")) % QGRAM_BITS)
+
+class PairPrefilter:
+    """Ringkasan per kalimat + WordIndex; reject(i, j) → nama filter yang menolak atau None."""
+
+    def __init__(self, unit: str = "char"):
+        self.unit = unit
+        self.q = QGRAM_Q[unit]
+        self.index = WordIndex(unit)
+        self._norms: List[str] = []
+        self._masks: List[int] = []
+        self._hists: List[Dict[str, int]] = []
+        self._grams: List[int] = []                       # bitset semua q-gram
+        self._ends: List[Optional[Tuple[int, int]]] = []  # bit q-gram pertama & terakhir
+
+    def __len__(self) -> int:
+        return len(self._norms)
+
+    def add(self, norm: str) -> int:
+        doc = self.index.add(norm)
+        syms = norm.split() if self.unit == "word" else norm
+        hist: Dict[str, int] = {}
+        mask = 0
+        for sym in syms:
+            hist[sym] = hist.get(sym, 0) + 1
+        for sym in hist:
+            mask |= _symbol_bit(sym, self.unit)
+        sep = " " if self.unit == "word" else ""
+        grams = [sep.join(syms[k:k + self.q]) for k in range(len(syms) - self.q + 1)]
+        gram_bits = 0
+        for g in grams:
+            gram_bits |= _qgram_bit(g)
+        self._norms.append(norm)
+        self._masks.append(mask)
+        self._hists.append(hist)
+        self._grams.append(gram_bits)
+        self._ends.append((_qgram_bit(grams[0]), _qgram_bit(grams[-1])) if grams else None)
+        return doc
+
+    def reject(self, i: int, j: int) -> Optional[str]:
+        """Filter pertama yang menolak pasangan (i, j), i < j; None = lolos ke engine."""
+        lens = self.index.lengths
+        p, t = (j, i) if lens[i] >= lens[j] else (i, j)
+        if lens[p] == lens[t] and self._norms[p] != self._norms[t]:
+            return "length"
+        if self._masks[p] & ~self._masks[t]:
+            return "bitmask"
+        if not self.index.pair_possible(i, j):
+            return "word_index"
+        ht = self._hists[t]
+        for sym, k in self._hists[p].items():
+            if ht.get(sym, 0) < k:
+                return "histogram"
+        ends = self._ends[p]
+        if ends is not None and (not self._grams[t] & ends[0] or not self._grams[t] & ends[1]):
+            return "qgram"
+        return None
+
+# ============================================================
+# RUNNER + HIGHLIGHT + EXPLAIN (UNTUK MENU PROSES)
+# ============================================================
+def method_label(method: str) -> str:
+    if method in ENGINES:
+        return ENGINES[method].label
+    if method == "all":
+        return "Semua Metode (" + " + ".join(ENGINES[m].short for m in engine_names("compare")) + ")"
+    if method == "sam":
+        return "Suffix Automaton (Overlap / LCS)"
+    return "Unknown"
+
+def method_explain(method: str) -> str:
+    if method in ENGINES:
+        return ENGINES[method].explain
+    if method == "all":
+        names = [ENGINES[m].short for m in engine_names("compare")]
+        return (f"{', '.join(names[:-1])} dan {names[-1]} dijalankan pada pasangan yang sama (normalisasi dan tabel "
+                "praproses dipakai bersama) untuk membandingkan jumlah perbandingan dan waktu secara langsung.")
+    if method == "sam":
+        return "Suffix automaton dibangun dari TEXT dalam O(n), lalu PATTERN dialirkan sekali untuk mencari substring bersama terpanjang dalam O(m). Cocok untuk duplikasi sebagian."
+    return "Metode tidak dikenal."
+
+def _seq_span(start: int, length: int, starts: Optional[array], norm: str) -> Tuple[int, int]:
+    """Rentang [start, start+length) pada urutan (karakter / id kata) → rentang karakter di norm."""
+    if starts is None:
+        return start, start + length
+    last = start + length - 1
+    end = starts[last + 1] - 1 if last + 1 < len(starts) else len(norm)
+    return starts[start], end
+
+def _cached(cache: Optional[Dict[Any, Any]], key: Any, build):
+    if cache is None:
+        return build()
+    try:
+        return cache[key]
+    except KeyError:
+        val = cache[key] = build()
+        return val
+
+def _prepare(sentence: str, unit: str, vocab: Dict[str, int],
+             cache: Optional[Dict[Any, Any]]) -> Tuple[str, array, Any, Optional[array]]:
+    """(norm, offset_map, seq, starts) satu kalimat; dengan cache tiap kalimat cukup dinormalisasi sekali."""
+    def build():
+        norm, omap = normalize_with_map(sentence)
+        if unit == "word":
+            seq, starts = encode_words(norm, vocab)
+            return norm, omap, seq, starts
+        return norm, omap, norm, None
+    return _cached(cache, ("sent", unit, sentence), build)
+
+def _run_engine(method: str, text_seq, pattern_seq, analysis_mode: bool, ops: Optional[OpStats],
+                unit: str, pattern_norm: str, cache: Optional[Dict[Any, Any]]):
+    """
+    Satu engine terdaftar → (idx, trace, comps, table). Dengan cache (per request),
+    tabel praproses diambil dari PATTERN_CACHE (lintas request); tabel yang
+    memetakan simbol (table_per_vocab) di mode kata hanya dari cache per request.
+    """
+    engine = ENGINES.get(method)
+    if engine is None:
+        return -1, (["Metode tidak dikenal"] if analysis_mode else None), 0, None
+    if analysis_mode:
+        return engine.trace(text_seq, pattern_seq)
+
+    kind = engine.table
+    if kind is None or cache is None or not engine.cache_table:
+        idx, comps, table = engine.count(text_seq, pattern_seq, ops, None)
+        return idx, None, comps, table
+    local = unit == "word" and engine.table_per_vocab
+    table = cache.get((kind, pattern_norm)) if local else PATTERN_CACHE.get(kind, unit, pattern_norm)
+    hit = table is not None
+    idx, comps, table = engine.count(text_seq, pattern_seq, ops, table)
+    if not hit and table:
+        if local:
+            cache[(kind, pattern_norm)] = table
+        else:
+            PATTERN_CACHE.put(kind, unit, pattern_norm, table)
+    return idx, None, comps, table
+
+def _add_table(tables: Dict[str, Any], method: str, table: Any) -> None:
+    if table is not None:
+        data = ENGINES[method].table_json(table)
+        if data is not None:
+            tables[ENGINES[method].table] = data
+
+def run_one_pair(method: str, sA: str, sB: str, analysis_mode: bool,
+                 unit: str = "char", vocab: Optional[Dict[str, int]] = None,
+                 rule: str = "substring", threshold: float = OVERLAP_THRESHOLD,
+                 top_k: int = OVERLAP_TOP_K, cache: Optional[Dict[Any, Any]] = None) -> Dict[str, Any]:
+    """
+    cache (opsional, satu dict per request): hasil normalisasi per kalimat dipakai
+    ulang antar pasangan; sekaligus mengaktifkan PATTERN_CACHE untuk tabel praproses.
+    """
+    origA, origB = sA, sB
+    if vocab is None:
+        vocab = {}
+
+    # Mode kata: engine yang sama dijalankan atas urutan id kata (array('i'))
+    normA, mapA, seqA, startsA = _prepare(origA, unit, vocab, cache)
+    normB, mapB, seqB, startsB = _prepare(origB, unit, vocab, cache)
+
+    # Tentukan TEXT (lebih panjang) dan PATTERN (lebih pendek)
+    if len(seqA) >= len(seqB):
+        text_norm, pattern_norm = normA, normB
+        text_seq, pattern_seq = seqA, seqB
+        text_orig, pattern_orig = origA, origB
+        text_map, text_starts = mapA, startsA
+        pattern_map, pattern_starts = mapB, startsB
+        text_source = "A"
+        pattern_source = "B"
+    else:
+        text_norm, pattern_norm = normB, normA
+        text_seq, pattern_seq = seqB, seqA
+        text_orig, pattern_orig = origB, origA
+        text_map, text_starts = mapB, startsB
+        pattern_map, pattern_starts = mapA, startsA
+        text_source = "B"
+        pattern_source = "A"
+
+    t0 = time.perf_counter()
+    trace: Optional[List[str]] = None
+    comps = 0
+    tables: Dict[str, Any] = {}   # jenis tabel praproses → bentuk JSON (Engine.table_json)
+    overlaps: Optional[List[Tuple[int, int, int]]] = None
+    overlap_ratio: Optional[float] = None
+    ops: Optional[OpStats] = None if analysis_mode else new_op_stats()
+    per_method: Optional[Dict[str, Dict[str, Any]]] = None
+
+    if rule == "overlap":
+        min_len = max(1, int(len(pattern_seq) * OVERLAP_MIN_SHARE))
+        if analysis_mode:
+            overlaps, trace, comps, _ = sam_overlap_trace(text_seq, pattern_seq, top_k, min_len)
+        else:
+            overlaps, comps, _ = sam_overlap_count(text_seq, pattern_seq, top_k, min_len, ops)
+        lcs_len = overlaps[0][0] if overlaps else 0
+        overlap_ratio = lcs_len / len(pattern_seq) if len(pattern_seq) > 0 else 0.0
+        idx = overlaps[0][1] if overlaps and overlap_ratio >= threshold else -1
+    elif len(pattern_seq) == 0:
+        # PATTERN kosong setelah normalisasi (mis. hanya tanda baca): tidak ada yang dibandingkan,
+        # pasangan dilewati → TIDAK DUPLIKAT (engine sendiri mengikuti str.find: "" ditemukan di 0)
+        idx = -1
+        if analysis_mode:
+            trace = ["PATTERN kosong setelah normalisasi → pasangan dilewati (TIDAK DUPLIKAT)"]
+        if method == "all":
+            per_method = {mth: {"idx": -1, "time_ms": 0.0, "comparisons": 0,
+                                "ops": None if analysis_mode else new_op_stats()}
+                          for mth in engine_names("compare")}
+            ops = None
+    elif method == "all":
+        # normalisasi + tabel dipakai bersama; tiap metode diukur terpisah
+        per_method = {}
+        trace = [] if analysis_mode else None
+        for mth in engine_names("compare"):
+            m_ops = None if analysis_mode else new_op_stats()
+            t1 = time.perf_counter()
+            m_idx, m_trace, m_comps, m_table = _run_engine(mth, text_seq, pattern_seq, analysis_mode, m_ops,
+                                                           unit, pattern_norm, cache)
+            per_method[mth] = {"idx": m_idx, "time_ms": round((time.perf_counter() - t1) * 1000, 3),
+                               "comparisons": m_comps, "ops": m_ops}
+            _add_table(tables, mth, m_table)
+            if m_trace is not None:
+                trace.append(f"===== {method_label(mth)} =====")
+                trace.extend(m_trace)
+        # semua metode harus sepakat; -2 = trace terpotong batas langkah
+        idx = next((r["idx"] for r in per_method.values() if r["idx"] != -2), -2)
+        comps = sum(r["comparisons"] for r in per_method.values())
+        ops = None
+    else:
+        idx, trace, comps, table = _run_engine(method, text_seq, pattern_seq, analysis_mode, ops,
+                                               unit, pattern_norm, cache)
+        _add_table(tables, method, table)
+
+    t_ms = (time.perf_counter() - t0) * 1000
+    if unit == "word" and trace is not None:
+        trace.insert(0, "[MODE KATA] id token PATTERN: " + ", ".join(
+            f"{w}={i}" for w, i in zip(pattern_norm.split(), pattern_seq)))
+    status = "DUPLIKAT" if idx >= 0 else "TIDAK DUPLIKAT"
+
+    # Highlight HTML
+    a_hl = escape_html(origA)
+    b_hl = escape_html(origB)
+    match_info = None
+    match_snippet_norm = ""
+    overlap_info: Optional[List[Dict[str, Any]]] = None
+
+    if overlaps is not None:
+        # Mode overlap: tandai substring bersama (top-k) di kedua kalimat
+        text_spans: List[Tuple[int, int]] = []
+        pattern_spans: List[Tuple[int, int]] = []
+        overlap_info = []
+        for ln, ts, ps in overlaps:
+            t_start, t_end = _seq_span(ts, ln, text_starts, text_norm)
+            p_start, p_end = _seq_span(ps, ln, pattern_starts, pattern_norm)
+            text_spans.append((text_map[t_start], text_map[t_end - 1] + 1))
+            pattern_spans.append((pattern_map[p_start], pattern_map[p_end - 1] + 1))
+            overlap_info.append({"length": ln, "text_idx": ts, "pattern_idx": ps,
+                                 "match_norm": text_norm[t_start:t_end]})
+        if idx >= 0:
+            match_snippet_norm = overlap_info[0]["match_norm"]
+            start_orig, end_orig = text_spans[0]
+            text_hl = highlight_spans(text_orig, text_spans)
+            pattern_hl = highlight_spans(pattern_orig, pattern_spans)
+            if text_source == "A":
+                a_hl, b_hl = text_hl, pattern_hl
+            else:
+                b_hl, a_hl = text_hl, pattern_hl
+            match_info = {"container": text_source, "start": start_orig, "end": end_orig}
+
+    elif idx >= 0 and len(pattern_seq) > 0:
+        norm_start, norm_end = _seq_span(idx, len(pattern_seq), text_starts, text_norm)
+        start_orig = text_map[norm_start]
+        end_orig = text_map[norm_end - 1] + 1
+        match_snippet_norm = text_norm[norm_start:norm_end]
+
+        text_hl = highlight_span(text_orig, start_orig, end_orig)
+        pattern_hl = f"<mark class='hl'>{escape_html(pattern_orig)}</mark>"
+
+        if text_source == "A":
+            a_hl = text_hl
+            b_hl = pattern_hl
+            match_info = {"container": "A", "start": start_orig, "end": end_orig}
+        else:
+            b_hl = text_hl
+            a_hl = pattern_hl
+            match_info = {"container": "B", "start": start_orig, "end": end_orig}
+
+    if rule == "overlap":
+        aturan = (f"Duplikat jika substring bersama terpanjang (LCS) ≥ {threshold:.0%} "
+                  "panjang PATTERN setelah normalisasi.")
+    else:
+        aturan = "Duplikat jika PATTERN ditemukan sebagai substring di dalam TEXT setelah normalisasi."
+
+    explain = {
+        "metode": method_label("sam" if rule == "overlap" else method),
+        "metode_ringkas": method_explain("sam" if rule == "overlap" else method),
+        "aturan_duplikasi": aturan,
+        "normA": normA,
+        "normB": normB,
+        "text_source": text_source,
+        "pattern_source": pattern_source,
+        "text_norm": text_norm,
+        "pattern_norm": pattern_norm,
+        "unit": unit,
+        "text_ids": list(text_seq) if unit == "word" else None,
+        "pattern_ids": list(pattern_seq) if unit == "word" else None,
+        "found_idx": idx,
+        "match_norm": match_snippet_norm,
+        "comparisons": comps,
+        "ops": ops,
+        "methods": per_method,
+        "lps": tables.get("lps"),
+        "last_table": tables.get("last"),
+        "tables": tables,
+        "rule": rule,
+        "overlap_ratio": round(overlap_ratio, 4) if overlap_ratio is not None else None,
+        "threshold": threshold if rule == "overlap" else None,
+        "overlaps": overlap_info
+    }
+
+    return {
+        "idx": idx,
+        "time_ms": round(t_ms, 3),
+        "status": status,
+        "trace": trace,
+        "a_hl": a_hl,
+        "b_hl": b_hl,
+        "match_info": match_info,
+        "overlap_ratio": explain["overlap_ratio"],
+        "explain": explain
+    }
+
+# ============================================================
+# 5) PERBANDINGAN BIPARTIT (SET A × SET B) DENGAN INDEX SEKALI BANGUN
+# ============================================================
+# Index dibangun sekali di sisi yang lebih besar:
+#   - suffix automaton atas gabungan kalimat (dipisah separator) → query ⊂ kalimat index
+#   - Aho–Corasick atas kalimat index                            → kalimat index ⊂ query
+# Setiap kalimat sisi kecil cukup dialirkan satu kali ke masing-masing automaton.
+_SEPARATOR = {"char": "\x00", "word": -1}
+
+def ac_build(patterns: List[Any]) -> Tuple[List[Dict[Any, int]], List[int], List[List[int]], List[int]]:
+    """
+    Aho–Corasick untuk daftar pattern (str atau array id kata).
+    Return (goto, fail, out, dict_link): out[v] = id pattern yang berakhir tepat di v,
+    dict_link[v] = state terdekat di rantai fail yang punya out (-1 jika tidak ada).
+    """
+    goto: List[Dict[Any, int]] = [{}]
+    out: List[List[int]] = [[]]
+    for pid, pat in enumerate(patterns):
+        v = 0
+        for ch in pat:
+            nxt = goto[v].get(ch)
+            if nxt is None:
+                nxt = len(goto)
+                goto[v][ch] = nxt
+                goto.append({})
+                out.append([])
+            v = nxt
+        out[v].append(pid)
+
+    fail = [0] * len(goto)
+    dict_link = [-1] * len(goto)
+    queue = list(goto[0].values())
+    for v in queue:  # BFS (queue bertambah selama iterasi)
+        for ch, u in goto[v].items():
+            f = fail[v]
+            while f and ch not in goto[f]:
+                f = fail[f]
+            fail[u] = goto[f][ch] if ch in goto[f] and goto[f][ch] != u else 0
+            dict_link[u] = fail[u] if out[fail[u]] else dict_link[fail[u]]
+            queue.append(u)
+    return goto, fail, out, dict_link
+
+def build_compare_index(seqs: List[Any], unit: str = "char") -> Dict[str, Any]:
+    sep = _SEPARATOR[unit]
+    joined: List[Any] = []
+    starts: List[int] = []
+    for seq in seqs:
+        starts.append(len(joined))
+        joined.extend(seq)
+        joined.append(sep)
+    nxt, link, length, first = sam_build(joined)
+    children: List[List[int]] = [[] for _ in nxt]
+    for v in range(1, len(nxt)):
+        children[link[v]].append(v)
+    return {
+        "seqs": seqs,
+        "starts": starts,
+        "sam": (nxt, link, length, first),
+        "children": children,
+        "ac": ac_build(seqs),
+    }
+
+def query_compare_index(index: Dict[str, Any], query) -> Dict[int, Tuple[str, int]]:
+    """
+    Cari semua kalimat index yang berpasangan duplikat dengan query.
+    Return {id_kalimat_index: (container, idx)}; container "index" = query ⊂ kalimat
+    index (idx di kalimat index), "query" = kalimat index ⊂ query (idx di query).
+    """
+    found: Dict[int, Tuple[str, int]] = {}
+    if len(query) == 0:
+        return found
+    seqs, starts = index["seqs"], index["starts"]
+
+    # query ⊂ kalimat index: jalan di suffix automaton tanpa suffix link
+    nxt, link, length, first = index["sam"]
+    v = 0
+    for ch in query:
+        v = nxt[v].get(ch, -1)
+        if v < 0:
+            break
+    if v > 0:
+        m = len(query)
+        stack = [v]
+        while stack:
+            u = stack.pop()
+            stack.extend(index["children"][u])
+            if length[u] == first[u] + 1:  # state asli (bukan clone) = satu posisi akhir
+                start = first[u] - m + 1
+                doc = bisect_right(starts, start) - 1
+                pos = start - starts[doc]
+                if doc not in found or pos < found[doc][1]:
+                    found[doc] = ("index", pos)
+
+    # kalimat index ⊂ query: alirkan query lewat Aho–Corasick
+    goto, fail, out, dict_link = index["ac"]
+    v = 0
+    for i, ch in enumerate(query):
+        while v and ch not in goto[v]:
+            v = fail[v]
+        v = goto[v].get(ch, 0)
+        u = v if out[v] else dict_link[v]
+        while u > 0:
+            for doc in out[u]:
+                if doc not in found:
+                    found[doc] = ("query", i - len(seqs[doc]) + 1)
+            u = dict_link[u]
+    return found
+
+def compare_sets(set_a: List[str], set_b: List[str], unit: str = "char") -> Dict[str, Any]:
+    """
+    Bandingkan setiap kalimat A dengan setiap kalimat B (tanpa pasangan dalam satu set).
+    Duplikat jika kalimat yang lebih pendek adalah substring kalimat yang lebih panjang
+    (setelah normalisasi), sama seperti aturan substring di run_one_pair; kalimat yang
+    kosong setelah normalisasi dilewati (tidak pernah duplikat), juga sama dengan run_one_pair.
+    """
+    vocab: Dict[str, int] = {}
+
+    def prep(s: str) -> Tuple[str, array, Any, Optional[array]]:
+        norm, omap = normalize_with_map(s)
+        if unit == "word":
+            seq, starts = encode_words(norm, vocab)
+            return norm, omap, seq, starts
+        return norm, omap, norm, None
+
+    t0 = time.perf_counter()
+    prep_a = [prep(s) for s in set_a]
+    prep_b = [prep(s) for s in set_b]
+
+    # Index di sisi yang lebih besar, sisi kecil dialirkan
+    a_is_index = sum(len(p[2]) for p in prep_a) >= sum(len(p[2]) for p in prep_b)
+    idx_prep, q_prep = (prep_a, prep_b) if a_is_index else (prep_b, prep_a)
+    index = build_compare_index([p[2] for p in idx_prep], unit)
+    t1 = time.perf_counter()
+
+    results: List[Dict[str, Any]] = []
+    for qi, (q_norm, q_map, q_seq, q_starts) in enumerate(q_prep):
+        if len(q_seq) == 0:
+            continue
+        for di, (container, pos) in sorted(query_compare_index(index, q_seq).items()):
+            d_norm, d_map, d_seq, d_starts = idx_prep[di]
+            if len(d_seq) == 0:
+                continue
+            if container == "index":
+                text_norm, text_map, text_starts, m = d_norm, d_map, d_starts, len(q_seq)
+            else:
+                text_norm, text_map, text_starts, m = q_norm, q_map, q_starts, len(d_seq)
+            ia, ib = (di, qi) if a_is_index else (qi, di)
+            a_contains = (container == "index") == a_is_index
+            norm_start, norm_end = _seq_span(pos, m, text_starts, text_norm)
+            start_orig, end_orig = text_map[norm_start], text_map[norm_end - 1] + 1
+
+            if a_contains:
+                a_hl = highlight_span(set_a[ia], start_orig, end_orig)
+                b_hl = f"<mark class='hl'>{escape_html(set_b[ib])}</mark>"
+            else:
+                a_hl = f"<mark class='hl'>{escape_html(set_a[ia])}</mark>"
+                b_hl = highlight_span(set_b[ib], start_orig, end_orig)
+            results.append({
+                "ia": ia + 1,
+                "ib": ib + 1,
+                "a": set_a[ia],
+                "b": set_b[ib],
+                "a_hl": a_hl,
+                "b_hl": b_hl,
+                "status": "DUPLIKAT",
+                "idx": pos,
+                "container": "A" if a_contains else "B",
+                "match_norm": text_norm[norm_start:norm_end],
+            })
+    t2 = time.perf_counter()
+
+    results.sort(key=lambda r: (r["ia"], r["ib"]))
+    return {
+        "index_side": "A" if a_is_index else "B",
+        "build_ms": round((t1 - t0) * 1000, 3),
+        "query_ms": round((t2 - t1) * 1000, 3),
+        "index_states": len(index["sam"][0]) + len(index["ac"][0]),
+        "results": results,
+    }
@@ -0,0 +1,278 @@
+"""
+Verifikasi diferensial engine string matching terhadap referensi str.find.
+
+Setiap kasus (text, pattern) acak — alfabet kecil, teks periodik, dan kasus tepi —
+diperiksa untuk semua varian fast / count / trace setiap engine terdaftar (sm.ENGINES):
+  - idx harus sama dengan text.find(pattern) (m > n → -1, m = 0 → 0)
+  - trace dan fast harus sama (kecuali trace terpotong batas langkah → -2)
+  - scan (semua kemunculan di rentang [lo, hi)) harus sama dengan str.startswith per posisi
+  - counter operasi konsisten: Σ shift_hist = shifts, dan bila ditemukan di idx
+    maka total jarak geser = idx
+  - mode kata: engine yang sama atas array('i') harus memberi idx yang sama
+  - suffix automaton: panjang LCS sama dengan DP brute force (kasus pendek)
+  - compare_sets (/api/compare) dan run_one_pair (/api/check) sepakat per pasangan A × B,
+    termasuk kalimat yang kosong setelah normalisasi (hanya tanda baca)
+Kasus gagal diperkecil (delta debugging) sebelum dilaporkan.
+
+Jalankan: python verify_engines.py --cases 1000000 --workers 8
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import string_matching as sm
+
+CHUNK_CASES = 20_000
+COMPARE_EVERY = 50          # satu kasus compare_sets vs run_one_pair per 50 kasus engine
+COMPARE_WORDS = ("ab", "ba", "abc", "kmp", "Metode", "string")
+COMPARE_EMPTY = ("!!!", "...", "?", " - ")   # kosong setelah normalisasi
+TRACE_MAX_LEN = 40          # trace hanya untuk input pendek (batas MAX_TRACE_STEPS)
+LCS_MAX_LEN = 24            # DP brute force O(n·m)
+# "ab#?éü": simbol di luar alfabet BM (kode BM_OTHER bersama, mode fold "unicode")
+ALPHABETS = ("ab", "abc", "ab ", "abcd ", "abcdefghijklmnopqrstuvwxyz0123456789 ", "ab#?éü")
+
+Case = Tuple[str, str]
+
+
+def _expected(text: str, pattern: str) -> int:
+    if len(pattern) > len(text):
+        return -1
+    return text.find(pattern)
+
+
+def _expected_all(text: str, pattern: str, lo: int, hi: int) -> List[int]:
+    if not pattern:
+        return []
+    return [i for i in range(lo, hi - len(pattern) + 1) if text.startswith(pattern, i)]
+
+
+def _lcs_len(a: str, b: str) -> int:
+    best = 0
+    prev = [0] * (len(b) + 1)
+    for ca in a:
+        cur = [0] * (len(b) + 1)
+        for j, cb in enumerate(b, start=1):
+            if ca == cb:
+                cur[j] = prev[j - 1] + 1
+                best = max(best, cur[j])
+        prev = cur
+    return best
+
+
+# ---------- generator kasus ----------
+def _rand_str(rnd: random.Random, alphabet: str, n: int) -> str:
+    return "".join(rnd.choice(alphabet) for _ in range(n))
+
+
+def _periodic(rnd: random.Random, alphabet: str, n: int) -> str:
+    unit = _rand_str(rnd, alphabet, rnd.randint(1, 4))
+    s = list((unit * (n // len(unit) + 1))[:n])
+    for _ in range(rnd.randint(0, 2)):   # sedikit mutasi agar periode "hampir" sempurna
+        if s:
+            s[rnd.randrange(len(s))] = rnd.choice(alphabet)
+    return "".join(s)
+
+
+def gen_case(rnd: random.Random, max_len: int) -> Case:
+    alphabet = rnd.choice(ALPHABETS)
+    kind = rnd.random()
+    n = rnd.randint(0, max_len)
+    if kind < 0.1:
+        # kasus tepi: kosong, satu karakter, m = n, m > n, pattern di awal/akhir
+        text = _rand_str(rnd, alphabet, n)
+        pattern = rnd.choice([
+            "", text, text[:1], text[-1:], text + rnd.choice(alphabet),
+            text[:rnd.randint(0, n)], text[rnd.randint(0, n):],
+        ])
+        return text, pattern
+    text = _periodic(rnd, alphabet, n) if kind < 0.5 else _rand_str(rnd, alphabet, n)
+    if n and rnd.random() < 0.5:
+        # pattern diambil dari text (sering ditemukan), kadang ujungnya dimutasi
+        start = rnd.randrange(n)
+        pattern = text[start:start + rnd.randint(1, max(1, n - start))]
+        if rnd.random() < 0.3:
+            pattern = pattern[:-1] + rnd.choice(alphabet)
+    else:
+        pattern = _periodic(rnd, alphabet, rnd.randint(0, max(1, n // 2)))
+    return text, pattern
+
+
+# ---------- pemeriksaan ----------
+def _check_count(name: str, fn: Callable, text: Any, pattern: Any, exp: int,
+                 instrumented: bool = True) -> Optional[str]:
+    stats = sm.new_op_stats()
+    idx = fn(text, pattern, stats, None)[0]
+    if idx != exp:
+        return f"{name}: idx={idx}, diharapkan {exp}"
+    if not instrumented:
+        return None  # mis. pencarian di C, counter selalu 0
+    if sum(stats["shift_hist"].values()) != stats["shifts"]:
+        return f"{name}: Σ shift_hist != shifts"
+    if sum(d * c for d, c in stats["shift_hist"].items()) != stats["shift_total"]:
+        return f"{name}: Σ jarak shift_hist != shift_total"
+    if idx > 0 and stats["shift_total"] != idx:
+        return f"{name}: total jarak geser {stats['shift_total']} != idx {idx}"
+    return None
+
+
+def check_case(text: str, pattern: str) -> Optional[str]:
+    """None jika semua engine benar; selain itu pesan kegagalan pertama."""
+    exp = _expected(text, pattern)
+    for name, eng in sm.ENGINES.items():
+        idx = eng.fast(text, pattern)
+        if idx != exp:
+            return f"{name}_search: idx={idx}, diharapkan {exp}"
+        err = _check_count(f"{name}_search_count", eng.count, text, pattern, exp, eng.instrumented)
+        if err:
+            return err
+        if len(text) <= TRACE_MAX_LEN:
+            t_idx = eng.trace(text, pattern)[0]
+            if t_idx != -2 and t_idx != idx:
+                return f"{name}_search_trace: idx={t_idx}, fast={idx}"
+        if eng.scan is not None:
+            for lo, hi in ((0, len(text)), (min(1, len(text)), max(0, len(text) - 1))):
+                got = list(eng.scan(text, pattern, None, lo, hi))
+                if got != _expected_all(text, pattern, lo, hi):
+                    return f"{name}_search_iter[{lo}:{hi}]: {got}, diharapkan {_expected_all(text, pattern, lo, hi)}"
+
+    # mode kata: engine dijalankan atas array('i') (di sini: kode karakter)
+    text_ids, pattern_ids = array("i", map(ord, text)), array("i", map(ord, pattern))
+    for name, eng in sm.ENGINES.items():
+        idx = eng.fast(text_ids, pattern_ids)
+        if idx != exp:
+            return f"{name}_search[array]: idx={idx}, diharapkan {exp}"
+        if eng.scan is not None and list(eng.scan(text_ids, pattern_ids, None, 0, len(text))) != \
+                _expected_all(text, pattern, 0, len(text)):
+            return f"{name}_search_iter[array]: tidak sama dengan referensi"
+
+    if pattern and len(text) <= LCS_MAX_LEN and len(pattern) <= len(text):
+        overlaps, _, _ = sm.sam_overlap_count(text, pattern, 1)
+        got = overlaps[0][0] if overlaps else 0
+        want = _lcs_len(text, pattern)
+        if got != want:
+            return f"sam_overlap_count: LCS={got}, diharapkan {want}"
+        if overlaps:
+            ln, ts, ps = overlaps[0]
+            if text[ts:ts + ln] != pattern[ps:ps + ln]:
+                return "sam_overlap_count: posisi LCS tidak cocok"
+    return None
+
+
+def gen_sentence_set(rnd: random.Random, size: int) -> List[str]:
+    out = []
+    for _ in range(size):
+        if rnd.random() < 0.2:
+            out.append(rnd.choice(COMPARE_EMPTY))
+        elif out and rnd.random() < 0.3:
+            words = rnd.choice(out).split()   # potongan kalimat lain → sering duplikat
+            k = rnd.randint(0, len(words))
+            out.append(" ".join(words[k:k + rnd.randint(1, 3)]) or rnd.choice(COMPARE_WORDS))
+        else:
+            out.append(" ".join(rnd.choice(COMPARE_WORDS) for _ in range(rnd.randint(1, 5))) + rnd.choice(("", ".", "!")))
+    return out
+
+
+def check_compare_case(set_a: List[str], set_b: List[str], unit: str) -> Optional[str]:
+    """None jika compare_sets menandai tepat pasangan yang DUPLIKAT menurut run_one_pair."""
+    got = {(r["ia"] - 1, r["ib"] - 1) for r in sm.compare_sets(set_a, set_b, unit)["results"]}
+    for i, a in enumerate(set_a):
+        for j, b in enumerate(set_b):
+            dup = sm.run_one_pair("kmp", a, b, False, unit)["status"] == "DUPLIKAT"
+            if dup != ((i, j) in got):
+                return f"compare_sets[{unit}] {a!r} × {b!r}: {(i, j) in got}, run_one_pair: {dup}"
+    return None
+
+
+def minimize(text: str, pattern: str) -> Case:
+    """Delta debugging sederhana: hapus / sederhanakan karakter selama kasus tetap gagal."""
+    changed = True
+    while changed:
+        changed = False
+        for which in (0, 1):
+            i = 0
+            while True:
+                cur = (text, pattern)[which]
+                if i >= len(cur):
+                    break
+                for cand in (cur[:i] + cur[i + 1:], cur[:i] + "a" + cur[i + 1:]):
+                    if cand == cur:
+                        continue
+                    t, p = (cand, pattern) if which == 0 else (text, cand)
+                    if check_case(t, p) is not None:
+                        text, pattern = t, p
+                        changed = True
+                        break
+                else:
+                    i += 1
+    return text, pattern
+
+
+def _run_chunk(args: Tuple[int, int, int]) -> Tuple[int, List[Dict[str, Any]]]:
+    seed, n_cases, max_len = args
+    rnd = random.Random(seed)
+    failures: List[Dict[str, Any]] = []
+    for k in range(n_cases):
+        if k % COMPARE_EVERY == 0:
+            set_a, set_b = gen_sentence_set(rnd, rnd.randint(1, 5)), gen_sentence_set(rnd, rnd.randint(1, 5))
+            for unit in sm.MATCH_UNITS:
+                err = check_compare_case(set_a, set_b, unit)
+                if err is not None:
+                    failures.append({"error": err, "a": set_a, "b": set_b})
+            if len(failures) >= 5:
+                break
+        text, pattern = gen_case(rnd, max_len)
+        err = check_case(text, pattern)
+        if err is not None:
+            mt, mp = minimize(text, pattern)
+            failures.append({"error": err, "text": text, "pattern": pattern,
+                             "min_text": mt, "min_pattern": mp, "min_error": check_case(mt, mp)})
+            if len(failures) >= 5:
+                break
+    return n_cases, failures
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Verifikasi diferensial engine string matching.")
+    p.add_argument("--cases", type=int, default=1_000_000)
+    p.add_argument("--seed", type=int, default=1)
+    p.add_argument("--max-len", type=int, default=64, help="panjang text maksimum")
+    p.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = p.parse_args(argv)
+
+    chunks = []
+    left, k = args.cases, 0
+    while left > 0:
+        size = min(CHUNK_CASES, left)
+        chunks.append((args.seed * 1_000_003 + k, size, args.max_len))
+        left -= size
+        k += 1
+
+    t0 = time.perf_counter()
+    done = 0
+    failures: List[Dict[str, Any]] = []
+    if args.workers <= 1:
+        results = map(_run_chunk, chunks)
+    else:
+        pool = ProcessPoolExecutor(max_workers=args.workers)
+        results = pool.map(_run_chunk, chunks)
+    for n_cases, fails in results:
+        done += n_cases
+        failures.extend(fails)
+        print(f"\r{done:,}/{args.cases:,} kasus, {len(failures)} gagal", end="", file=sys.stderr)
+    if args.workers > 1:
+        pool.shutdown()
+    print(f"\n{time.perf_counter() - t0:.1f} s", file=sys.stderr)
+
+    for f in failures:
+        print(json.dumps(f, ensure_ascii=False))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
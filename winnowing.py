@@ -0,0 +1,245 @@
+"""
+Deteksi passage bersama antar dokumen dengan fingerprint winnowing (tanpa Flask).
+
+Dokumen utuh (bukan per kalimat) dinormalisasi sekali, sehingga salinan yang
+melewati batas baris/kalimat tetap terdeteksi:
+  1. hash rolling (Karp–Rabin) setiap k-gram karakter hasil normalize
+  2. winnowing: dari tiap jendela w hash berurutan dipilih hash terkecil
+     (paling kanan jika seri) → fingerprint; setiap substring bersama dengan
+     panjang ≥ k + w - 1 dijamin berbagi minimal satu fingerprint
+  3. inverted index fingerprint → [(dokumen, offset)]
+  4. fingerprint bersama = seed; seed diperpanjang ke kiri/kanan secara eksak
+     menjadi passage, lalu dipetakan ke teks asli via normalize_with_map
+Fingerprint dengan lebih dari max_postings posisi (boilerplate) dilewati agar
+jumlah seed tidak kuadratik; jaminan langkah 2 hanya berlaku bila tidak ada
+fingerprint lintas dokumen yang dilewati (lihat skipped_fingerprints).
+
+Contoh:
+  python winnowing.py tugas/*.txt --k 20 --w 10
+"""
+import argparse
+import json
+import sys
+from collections import deque
+from itertools import combinations
+from typing import Any, Dict, List, Optional, Tuple
+
+from string_matching import NORMALIZE_FOLD, normalize_with_map, highlight_spans
+
+WINNOW_K = 20          # panjang k-gram (karakter hasil normalisasi)
+WINNOW_W = 10          # ukuran jendela winnowing → ambang jaminan t = k + w - 1
+MAX_POSTINGS = 50      # default: fingerprint yang muncul di lebih banyak posisi dianggap boilerplate
+
+_MOD = (1 << 61) - 1
+_BASE = 257
+
+# Passage = (start_a, start_b, panjang) pada teks normalisasi
+Passage = Tuple[int, int, int]
+
+
+def kgram_hashes(norm: str, k: int) -> List[int]:
+    """Hash rolling semua k-gram norm (len(norm) - k + 1 buah)."""
+    n = len(norm)
+    if n < k:
+        return []
+    top = pow(_BASE, k - 1, _MOD)
+    h = 0
+    for ch in norm[:k]:
+        h = (h * _BASE + ord(ch)) % _MOD
+    out = [h]
+    for i in range(k, n):
+        h = ((h - ord(norm[i - k]) * top) * _BASE + ord(norm[i])) % _MOD
+        out.append(h)
+    return out
+
+
+def winnow(hashes: List[int], w: int) -> List[Tuple[int, int]]:
+    """Fingerprint (hash, posisi) hasil winnowing; deque monoton → O(n)."""
+    if not hashes:
+        return []
+    if len(hashes) <= w:
+        # dokumen lebih pendek dari satu jendela: minimum satu-satunya jendela
+        pos = min(range(len(hashes)), key=lambda i: (hashes[i], -i))
+        return [(hashes[pos], pos)]
+    out: List[Tuple[int, int]] = []
+    dq: deque = deque()   # indeks dengan hash menaik; depan = minimum jendela
+    last = -1
+    for i, h in enumerate(hashes):
+        while dq and hashes[dq[-1]] >= h:   # ">=" → minimum paling kanan
+            dq.pop()
+        dq.append(i)
+        if dq[0] <= i - w:
+            dq.popleft()
+        if i >= w - 1 and dq[0] != last:
+            last = dq[0]
+            out.append((hashes[last], last))
+    return out
+
+
+class FingerprintIndex:
+    """Inverted index fingerprint → [(doc_id, offset)] atas kumpulan dokumen."""
+
+    def __init__(self, k: int = WINNOW_K, w: int = WINNOW_W, fold: str = NORMALIZE_FOLD,
+                 max_postings: Optional[int] = MAX_POSTINGS):
+        if k < 1 or w < 1:
+            raise ValueError("k dan w harus ≥ 1.")
+        if max_postings is not None and max_postings < 2:
+            raise ValueError("max_postings harus ≥ 2 (atau None = tanpa batas).")
+        self.k = k
+        self.w = w
+        self.fold = fold
+        self.max_postings = max_postings
+        self.names: List[str] = []
+        self.originals: List[str] = []
+        self.norms: List[str] = []
+        self.maps: List[Any] = []
+        self.postings: Dict[int, List[Tuple[int, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def threshold(self) -> int:
+        """Panjang passage minimum yang dijamin terdeteksi (selama skipped_fingerprints == 0)."""
+        return self.k + self.w - 1
+
+    def _skipped(self, plist: List[Tuple[int, int]]) -> bool:
+        return self.max_postings is not None and len(plist) > self.max_postings
+
+    @property
+    def skipped_fingerprints(self) -> int:
+        """Fingerprint lintas dokumen yang dilewati karena > max_postings; > 0 → jaminan tidak berlaku."""
+        return sum(1 for plist in self.postings.values()
+                   if self._skipped(plist) and len({doc for doc, _ in plist}) > 1)
+
+    def add(self, name: str, text: str) -> int:
+        doc_id = len(self.names)
+        norm, omap = normalize_with_map(text, self.fold)
+        self.names.append(name)
+        self.originals.append(text)
+        self.norms.append(norm)
+        self.maps.append(omap)
+        for h, pos in winnow(kgram_hashes(norm, self.k), self.w):
+            self.postings.setdefault(h, []).append((doc_id, pos))
+        return doc_id
+
+    def _extend(self, a: int, pa: int, b: int, pb: int) -> Passage:
+        """Perpanjang seed (pa, pb) secara eksak ke kiri dan kanan."""
+        ta, tb = self.norms[a], self.norms[b]
+        while pa > 0 and pb > 0 and ta[pa - 1] == tb[pb - 1]:
+            pa -= 1
+            pb -= 1
+        length = 0
+        while pa + length < len(ta) and pb + length < len(tb) and ta[pa + length] == tb[pb + length]:
+            length += 1
+        # spasi di tepi passage dibuang agar highlight tidak ikut menandai tanda baca di sekitarnya
+        while length and ta[pa] == " ":
+            pa, pb, length = pa + 1, pb + 1, length - 1
+        while length and ta[pa + length - 1] == " ":
+            length -= 1
+        return pa, pb, length
+
+    def shared_passages(self, min_len: Optional[int] = None) -> Dict[Tuple[int, int], List[Passage]]:
+        """
+        {(doc_a, doc_b): [passage]} untuk setiap pasangan dokumen (a < b) yang berbagi
+        passage ≥ min_len (default k). Hanya fingerprint bersama yang dikunjungi.
+        """
+        min_len = self.k if min_len is None else min_len
+        seeds: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+        for plist in self.postings.values():
+            if len(plist) < 2 or self._skipped(plist):
+                continue
+            for (a, pa), (b, pb) in combinations(plist, 2):
+                if a == b:
+                    continue
+                if a > b:
+                    a, pa, b, pb = b, pb, a, pa
+                seeds.setdefault((a, b), []).append((pa, pb))
+
+        out: Dict[Tuple[int, int], List[Passage]] = {}
+        for (a, b), pairs in seeds.items():
+            # urut per diagonal (pb - pa): seed yang sudah tercakup passage sebelumnya dilewati
+            pairs.sort(key=lambda s: (s[1] - s[0], s[0]))
+            found: List[Passage] = []
+            cur_diag, cur_end = None, -1
+            for pa, pb in pairs:
+                if pb - pa == cur_diag and pa < cur_end:
+                    continue
+                if self.norms[a][pa:pa + self.k] != self.norms[b][pb:pb + self.k]:
+                    continue   # tabrakan hash
+                sa, sb, ln = self._extend(a, pa, b, pb)
+                cur_diag, cur_end = pb - pa, sa + ln
+                if ln >= min_len:
+                    found.append((sa, sb, ln))
+            if found:
+                out[(a, b)] = sorted(set(found))   # seed di tepi yang dipangkas bisa menghasilkan passage yang sama
+        return out
+
+    def span(self, doc: int, start: int, length: int) -> Tuple[int, int]:
+        """Rentang norm [start, start+length) → rentang di teks asli dokumen."""
+        omap = self.maps[doc]
+        return omap[start], omap[start + length - 1] + 1
+
+    def report(self, min_len: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Hasil siap JSON per pasangan dokumen: passage (offset asli), cakupan, highlight."""
+        rows = []
+        for (a, b), passages in sorted(self.shared_passages(min_len).items()):
+            spans_a, spans_b, items = [], [], []
+            for sa, sb, ln in passages:
+                oa, ob = self.span(a, sa, ln), self.span(b, sb, ln)
+                spans_a.append(oa)
+                spans_b.append(ob)
+                items.append({"length": ln, "a_start": oa[0], "a_end": oa[1], "b_start": ob[0], "b_end": ob[1],
+                              "text_norm": self.norms[a][sa:sa + ln]})
+            rows.append({
+                "doc_a": self.names[a], "doc_b": self.names[b],
+                "passages": items,
+                "coverage_a": round(_covered(passages, 0) / max(1, len(self.norms[a])), 4),
+                "coverage_b": round(_covered(passages, 1) / max(1, len(self.norms[b])), 4),
+                "a_hl": highlight_spans(self.originals[a], spans_a),
+                "b_hl": highlight_spans(self.originals[b], spans_b),
+            })
+        return rows
+
+
+def _covered(passages: List[Passage], side: int) -> int:
+    """Jumlah karakter norm yang tercakup passage (rentang tumpang tindih dihitung sekali)."""
+    total = 0
+    end = -1
+    for start, length in sorted((p[side], p[2]) for p in passages):
+        if start + length > end:
+            total += start + length - max(start, end)
+            end = start + length
+    return total
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Passage bersama antar dokumen (winnowing), output JSONL.")
+    p.add_argument("files", nargs="+")
+    p.add_argument("--k", type=int, default=WINNOW_K)
+    p.add_argument("--w", type=int, default=WINNOW_W)
+    p.add_argument("--min-len", type=int, help="panjang passage minimum (default k)")
+    p.add_argument("--max-postings", type=int, default=MAX_POSTINGS,
+                   help="lewati fingerprint dengan posisi lebih banyak (0 = tanpa batas)")
+    args = p.parse_args(argv)
+    if args.max_postings < 0 or args.max_postings == 1:
+        print("Error: --max-postings harus 0 (tanpa batas) atau ≥ 2.", file=sys.stderr)
+        return 2
+
+    index = FingerprintIndex(args.k, args.w, max_postings=args.max_postings or None)
+    for f in args.files:
+        with open(f, encoding="utf-8", errors="replace") as fh:
+            index.add(f, fh.read())
+    for row in index.report(args.min_len):
+        row.pop("a_hl")
+        row.pop("b_hl")
+        print(json.dumps(row, ensure_ascii=False))
+    skipped = index.skipped_fingerprints
+    guarantee = (f"ambang jaminan {index.threshold} karakter" if not skipped else
+                 f"{skipped} fingerprint bersama dilewati (> {index.max_postings} posisi), tanpa jaminan ambang")
+    print(f"{len(index)} dokumen, {len(index.postings)} fingerprint unik, {guarantee}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())